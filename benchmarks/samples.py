@@ -0,0 +1,93 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from clients.authentication.authentication_schema import LoginResponseSchema
+from clients.courses.courses_schema import (
+    CreateCourseResponseSchema,
+    GetCourseResponseSchema,
+    GetCoursesResponseSchema,
+    UpdateCourseResponseSchema
+)
+from clients.errors_schema import InternalErrorResponseSchema, ValidationErrorResponseSchema
+from clients.exercises.exercises_schema import (
+    CreateExerciseResponseSchema,
+    GetExerciseResponseSchema,
+    GetExercisesResponseSchema,
+    UpdateExerciseResponseSchema
+)
+from clients.files.files_schema import CreateFileResponseSchema, GetFileResponseSchema
+from clients.users.users_schema import CreateUserResponseSchema, GetUserResponseSchema, UpdateUserResponseSchema
+from config import settings
+
+# Размер списков в ответах на получение курсов и заданий
+LIST_SIZE = 100
+
+FILE = {
+    "id": "5d7d3a8e-4f0c-4d4b-9b0e-2f3c6a1b7e10",
+    "url": f"{settings.http_client.client_url}static/tests/image.png",
+    "filename": "image.png",
+    "directory": "tests",
+}
+
+USER = {
+    "id": "0b6f1c2e-8a8d-4a4e-bb41-9e5c1d3f7a21",
+    "email": "user@example.com",
+    "lastName": "Ivanov",
+    "firstName": "Ivan",
+    "middleName": "Ivanovich",
+}
+
+COURSE = {
+    "id": "7c1e9f5a-2b3d-4e6f-8a9b-0c1d2e3f4a5b",
+    "title": "Playwright",
+    "maxScore": 100,
+    "minScore": 10,
+    "description": "Playwright course",
+    "previewFile": FILE,
+    "estimatedTime": "2 weeks",
+    "createdByUser": USER,
+}
+
+EXERCISE = {
+    "id": "9a8b7c6d-5e4f-4a3b-2c1d-0e9f8a7b6c5d",
+    "title": "Exercise 1",
+    "courseId": COURSE["id"],
+    "maxScore": 5,
+    "minScore": 1,
+    "orderIndex": 0,
+    "description": "Exercise 1",
+    "estimatedTime": "5 minutes",
+}
+
+TOKEN = {"tokenType": "bearer", "accessToken": "access-token", "refreshToken": "refresh-token"}
+
+# Примеры JSON ответов сервера для каждой модели ответа
+RESPONSES: dict[type[BaseModel], Any] = {
+    CreateFileResponseSchema: {"file": FILE},
+    GetFileResponseSchema: {"file": FILE},
+    CreateUserResponseSchema: {"user": USER},
+    GetUserResponseSchema: {"user": USER},
+    UpdateUserResponseSchema: {"user": USER},
+    CreateCourseResponseSchema: {"course": COURSE},
+    GetCourseResponseSchema: {"course": COURSE},
+    UpdateCourseResponseSchema: {"course": COURSE},
+    GetCoursesResponseSchema: {"courses": [COURSE] * LIST_SIZE},
+    CreateExerciseResponseSchema: {"exercise": EXERCISE},
+    GetExerciseResponseSchema: {"exercise": EXERCISE},
+    UpdateExerciseResponseSchema: {"exercise": EXERCISE},
+    GetExercisesResponseSchema: {"exercises": [EXERCISE] * LIST_SIZE},
+    LoginResponseSchema: {"token": TOKEN},
+    InternalErrorResponseSchema: {"detail": "Exercise not found"},
+    ValidationErrorResponseSchema: {
+        "detail": [
+            {
+                "type": "string_too_short",
+                "input": "",
+                "ctx": {"min_length": 1},
+                "msg": "String should have at least 1 character",
+                "loc": ["body", "filename"],
+            }
+        ]
+    },
+}
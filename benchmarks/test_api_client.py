@@ -0,0 +1,47 @@
+import httpx
+import pytest
+from httpx import Client, MockTransport, Request, Response
+
+from benchmarks.samples import RESPONSES
+from clients.api_client import APIClient
+from clients.courses.courses_schema import CreateCourseRequestSchema, CreateCourseResponseSchema
+from clients.event_hooks import get_event_hooks
+from fixtures.benchmark import Benchmark
+from tools.routes import APIRoutes
+
+pytestmark = pytest.mark.benchmark
+
+BASE_URL = "http://benchmark.local"
+
+
+def handle_request(request: Request) -> Response:
+    # Сервер не нужен: любой запрос получает заранее подготовленный ответ создания курса
+    return Response(200, json=RESPONSES[CreateCourseResponseSchema])
+
+
+def build_api_client(event_hooks: bool) -> APIClient:
+    return APIClient(
+        client=Client(
+            base_url=BASE_URL,
+            transport=MockTransport(handle_request),
+            event_hooks=get_event_hooks() if event_hooks else None
+        )
+    )
+
+
+@pytest.mark.parametrize("event_hooks", [False, True], ids=["without_hooks", "with_hooks"])
+def test_api_client_get(benchmark: Benchmark, event_hooks: bool):
+    client = build_api_client(event_hooks)
+    benchmark(lambda: client.get(APIRoutes.COURSES))
+
+
+@pytest.mark.parametrize("event_hooks", [False, True], ids=["without_hooks", "with_hooks"])
+def test_api_client_post_model(benchmark: Benchmark, event_hooks: bool):
+    client = build_api_client(event_hooks)
+    request = CreateCourseRequestSchema()
+    benchmark(lambda: client.post(APIRoutes.COURSES, json=request))
+
+
+def test_api_client_parse_response(benchmark: Benchmark):
+    response = httpx.Response(200, json=RESPONSES[CreateCourseResponseSchema])
+    benchmark(lambda: APIClient.parse_response(response, CreateCourseResponseSchema))
@@ -0,0 +1,87 @@
+from typing import TypeVar
+
+import pytest
+from pydantic import BaseModel
+
+from benchmarks.samples import COURSE, EXERCISE, FILE, LIST_SIZE, RESPONSES, USER
+from clients.authentication.authentication_schema import LoginResponseSchema
+from clients.courses.courses_schema import (
+    CreateCourseRequestSchema,
+    CreateCourseResponseSchema,
+    GetCoursesResponseSchema
+)
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    CreateExerciseResponseSchema,
+    GetExercisesResponseSchema
+)
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema
+from config import settings
+from fixtures.benchmark import Benchmark
+from tools.assertions.authentication import assert_login_response
+from tools.assertions.courses import assert_create_course_response, assert_get_courses_response
+from tools.assertions.exercises import assert_create_exercise_response, assert_get_exercises_response
+from tools.assertions.files import assert_create_file_response
+from tools.assertions.users import assert_create_user_response, assert_get_user_response
+
+pytestmark = pytest.mark.benchmark
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def build_response(model: type[T]) -> T:
+    return model.model_validate(RESPONSES[model])
+
+
+def test_assert_create_file_response(benchmark: Benchmark):
+    request = CreateFileRequestSchema(
+        filename=FILE["filename"],
+        directory=FILE["directory"],
+        upload_file=settings.test_data.image_png_file
+    )
+    response = build_response(CreateFileResponseSchema)
+    benchmark(lambda: assert_create_file_response(request, response))
+
+
+def test_assert_create_user_response(benchmark: Benchmark):
+    request = CreateUserRequestSchema.model_validate({**USER, "password": "password"})
+    response = build_response(CreateUserResponseSchema)
+    benchmark(lambda: assert_create_user_response(request, response))
+
+
+def test_assert_get_user_response(benchmark: Benchmark):
+    get_response = build_response(GetUserResponseSchema)
+    create_response = build_response(CreateUserResponseSchema)
+    benchmark(lambda: assert_get_user_response(get_response, create_response))
+
+
+def test_assert_login_response(benchmark: Benchmark):
+    response = build_response(LoginResponseSchema)
+    benchmark(lambda: assert_login_response(response))
+
+
+def test_assert_create_course_response(benchmark: Benchmark):
+    request = CreateCourseRequestSchema.model_validate(
+        {**COURSE, "previewFileId": FILE["id"], "createdByUserId": USER["id"]}
+    )
+    response = build_response(CreateCourseResponseSchema)
+    benchmark(lambda: assert_create_course_response(request, response))
+
+
+def test_assert_get_courses_response(benchmark: Benchmark):
+    get_response = build_response(GetCoursesResponseSchema)
+    create_responses = [build_response(CreateCourseResponseSchema)] * LIST_SIZE
+    benchmark(lambda: assert_get_courses_response(get_response, create_responses))
+
+
+def test_assert_create_exercise_response(benchmark: Benchmark):
+    request = CreateExerciseRequestSchema.model_validate(EXERCISE)
+    response = build_response(CreateExerciseResponseSchema)
+    benchmark(lambda: assert_create_exercise_response(request, response))
+
+
+def test_assert_get_exercises_response(benchmark: Benchmark):
+    get_response = build_response(GetExercisesResponseSchema)
+    create_responses = [build_response(CreateExerciseResponseSchema)] * LIST_SIZE
+    benchmark(lambda: assert_get_exercises_response(get_response, create_responses))
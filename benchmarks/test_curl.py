@@ -0,0 +1,28 @@
+import os
+
+import pytest
+from httpx import Request
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from fixtures.benchmark import Benchmark
+from tools.http.curl import make_curl_from_request
+
+pytestmark = pytest.mark.benchmark
+
+URL = "http://benchmark.local/api/v1/files"
+
+
+def test_curl_json_request(benchmark: Benchmark):
+    request = Request("POST", URL, json=CreateCourseRequestSchema().model_dump(by_alias=True))
+    benchmark(lambda: make_curl_from_request(request))
+
+
+@pytest.mark.parametrize("size", [10 * 1024, 5 * 1024 * 1024], ids=["10kb", "5mb"])
+def test_curl_multipart_request(benchmark: Benchmark, size: int):
+    request = Request(
+        "POST",
+        URL,
+        data={"filename": "image.png", "directory": "tests"},
+        files={"upload_file": ("image.png", os.urandom(size), "image/png")}
+    )
+    benchmark(lambda: make_curl_from_request(request))
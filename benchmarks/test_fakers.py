@@ -0,0 +1,33 @@
+import pytest
+
+from fixtures.benchmark import Benchmark
+from tools.fakers import fake
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "text",
+        "uuid4",
+        "email",
+        "sentence",
+        "password",
+        "last_name",
+        "first_name",
+        "middle_name",
+        "estimated_time",
+        "integer",
+        "max_score",
+        "min_score",
+    ]
+)
+def test_fake(benchmark: Benchmark, method: str):
+    benchmark(getattr(fake, method))
+
+
+@pytest.mark.parametrize("method", ["text", "email", "sentence", "password", "last_name", "first_name", "middle_name"])
+def test_fake_batch(benchmark: Benchmark, method: str):
+    with fake.batch(1000):
+        benchmark(getattr(fake, method))
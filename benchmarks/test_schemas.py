@@ -0,0 +1,22 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from benchmarks.samples import RESPONSES
+from fixtures.benchmark import Benchmark
+from tools.assertions.schema import validate_json_schema
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("model", RESPONSES, ids=lambda model: model.__name__)
+def test_model_validate_json(benchmark: Benchmark, model: type[BaseModel]):
+    content = json.dumps(RESPONSES[model]).encode()
+    benchmark(lambda: model.model_validate_json(content))
+
+
+@pytest.mark.parametrize("model", RESPONSES, ids=lambda model: model.__name__)
+def test_validate_json_schema(benchmark: Benchmark, model: type[BaseModel]):
+    instance = RESPONSES[model]
+    benchmark(lambda: validate_json_schema(instance, model))
@@ -1,8 +1,73 @@
-from typing import Any
+from functools import cached_property
+from typing import Any, Generic, TypeVar
 
-import allure
-from httpx import Client, URL, Response, QueryParams
+from httpx import Client, AsyncClient, URL, Response, QueryParams
 from httpx._types import RequestData, RequestFiles
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from tools.allure.steps import step, async_step
+
+T = TypeVar("T", bound=BaseModel)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class APIResponse(Generic[T]):
+    """
+    Результат однократного разбора ответа: валидированная модель, исходный JSON и статус-код.
+
+    Модель валидируется прямо из байтов ответа. Исходный JSON разбирается парсером pydantic-core
+    только при первом обращении, например для проверки JSON-схемы.
+    """
+
+    def __init__(self, response: Response, model: type[T]):
+        """
+        :param response: Объект ответа httpx.
+        :param model: Класс pydantic модели ответа.
+        """
+        self.response = response
+        self.model = model
+        self.status_code = response.status_code
+        self.data: T = model.model_validate_json(response.content)
+
+    @cached_property
+    def json(self) -> Any:
+        return from_json(self.response.content)
+
+
+def build_json_arguments(json: Any | BaseModel | None, exclude_none: bool = False) -> dict[str, Any]:
+    """
+    Формирует аргументы тела JSON-запроса для httpx.
+
+    Pydantic модель сериализуется сразу в байты (по алиасам полей), без промежуточного словаря
+    и повторного кодирования через json, прочие объекты передаются httpx как есть.
+
+    :param json: Pydantic модель или JSON-совместимые данные.
+    :param exclude_none: Исключить из модели поля со значением None.
+    :return: Именованные аргументы для метода httpx клиента.
+    """
+    if not isinstance(json, BaseModel):
+        return {"json": json}
+
+    return {
+        "content": type(json).__pydantic_serializer__.to_json(json, by_alias=True, exclude_none=exclude_none),
+        "headers": JSON_HEADERS
+    }
+
+
+def parse_response(response: Response, model: type[T]) -> APIResponse[T]:
+    """
+    Разбирает ответ в APIResponse без декодирования тела в строку.
+
+    Повторные response.text и response.json() для проверки модели и JSON-схемы не нужны.
+
+    :param response: Объект ответа httpx.
+    :param model: Класс pydantic модели ответа.
+    :return: Результат с моделью, исходным JSON и статус-кодом.
+    """
+    return APIResponse(response, model)
+
 
 class APIClient:
     def __init__(self, client: Client):
@@ -12,8 +77,19 @@ class APIClient:
         :param client: Экземпляр httpx.Client с предустановленной конфигурацией (например, заголовки, авторизация).
         """
         self.client = client
-        
-    @allure.step("Make GET request to {url}")
+
+    @staticmethod
+    def parse_response(response: Response, model: type[T]) -> APIResponse[T]:
+        """
+        Разбирает ответ один раз и возвращает модель, исходный JSON и статус-код.
+
+        :param response: Объект ответа httpx.
+        :param model: Класс pydantic модели ответа.
+        :return: Объект APIResponse.
+        """
+        return parse_response(response, model)
+
+    @step("Make GET request to {url}")
     def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
         """
         Выполняет GET-запрос.
@@ -24,45 +100,49 @@ class APIClient:
         """
         return self.client.get(url, params=params)
     
-    @allure.step("Make POST request to {url}")
+    @step("Make POST request to {url}")
     def post(
         self,
         url: URL | str,
-        json: Any | None = None,
+        json: Any | BaseModel | None = None,
         data: RequestData | None = None,
-        files: RequestFiles | None = None
+        files: RequestFiles | None = None,
+        exclude_none: bool = False
     ) -> Response:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON или pydantic модель, сериализуемая по алиасам полей.
         :param data: Форматированные данные формы.
         :param files: Файлы для загрузки на сервер.
+        :param exclude_none: Исключить из pydantic модели поля со значением None.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        return self.client.post(url, data=data, files=files, **build_json_arguments(json, exclude_none))
 
-    @allure.step("Make PATCH request to {url}")
+    @step("Make PATCH request to {url}")
     def patch(
         self,
         url: URL | str,
-        json: Any | None = None,
+        json: Any | BaseModel | None = None,
         data: RequestData | None = None,
-        files: RequestFiles | None = None
+        files: RequestFiles | None = None,
+        exclude_none: bool = False
     ) -> Response:
         """
         Выполняет PATCH-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON или pydantic модель, сериализуемая по алиасам полей.
         :param data: Форматированные данные формы.
         :param files: Файлы для загрузки.
+        :param exclude_none: Исключить из pydantic модели поля со значением None.
         :return: Объект Response с данными ответа.
         """
-        return self.client.patch(url, json=json, data=data, files=files)
+        return self.client.patch(url, data=data, files=files, **build_json_arguments(json, exclude_none))
 
-    @allure.step("Make DELETE request to {url}")
+    @step("Make DELETE request to {url}")
     def delete(self, url: URL | str) -> Response:
         """
         Выполняет DELETE-запрос.
@@ -71,3 +151,87 @@ class APIClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.delete(url)
+
+
+class AsyncAPIClient:
+    def __init__(self, client: AsyncClient):
+        """
+        Базовый асинхронный API клиент, обёртка над httpx.AsyncClient.
+
+        :param client: Экземпляр httpx.AsyncClient с предустановленной конфигурацией (например, заголовки, авторизация).
+        """
+        self.client = client
+
+    @staticmethod
+    def parse_response(response: Response, model: type[T]) -> APIResponse[T]:
+        """
+        Разбирает ответ один раз и возвращает модель, исходный JSON и статус-код.
+
+        :param response: Объект ответа httpx.
+        :param model: Класс pydantic модели ответа.
+        :return: Объект APIResponse.
+        """
+        return parse_response(response, model)
+
+    @async_step("Make GET request to {url}")
+    async def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url, params=params)
+
+    @async_step("Make POST request to {url}")
+    async def post(
+        self,
+        url: URL | str,
+        json: Any | BaseModel | None = None,
+        data: RequestData | None = None,
+        files: RequestFiles | None = None,
+        exclude_none: bool = False
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON или pydantic модель, сериализуемая по алиасам полей.
+        :param data: Форматированные данные формы.
+        :param files: Файлы для загрузки на сервер.
+        :param exclude_none: Исключить из pydantic модели поля со значением None.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url, data=data, files=files, **build_json_arguments(json, exclude_none))
+
+    @async_step("Make PATCH request to {url}")
+    async def patch(
+        self,
+        url: URL | str,
+        json: Any | BaseModel | None = None,
+        data: RequestData | None = None,
+        files: RequestFiles | None = None,
+        exclude_none: bool = False
+    ) -> Response:
+        """
+        Выполняет асинхронный PATCH-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON или pydantic модель, сериализуемая по алиасам полей.
+        :param data: Форматированные данные формы.
+        :param files: Файлы для загрузки.
+        :param exclude_none: Исключить из pydantic модели поля со значением None.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.patch(url, data=data, files=files, **build_json_arguments(json, exclude_none))
+
+    @async_step("Make DELETE request to {url}")
+    async def delete(self, url: URL | str) -> Response:
+        """
+        Выполняет асинхронный DELETE-запрос.
+
+        :param url: URL-адрес ресурса для удаления.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.delete(url)
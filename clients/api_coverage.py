@@ -1,5 +1,36 @@
+import functools
+import inspect
+from typing import Awaitable, Callable
+
+from httpx import Response
 from swagger_coverage_tool import SwaggerCoverageTracker
 
 # Инициализируем трекер для нашего сервиса "api-course"
 # ВАЖНО: 'api-course' должен точно совпадать с ключом `key` в SWAGGER_COVERAGE_SERVICES
 tracker = SwaggerCoverageTracker(service="api-course")
+
+
+def track_coverage_httpx_async(endpoint: str):
+    """
+    Асинхронный аналог tracker.track_coverage_httpx для методов асинхронных клиентов.
+
+    :param endpoint: Шаблон эндпоинта, например "/api/v1/courses/{course_id}".
+    :return: Декоратор, сохраняющий покрытие по ответу корутины.
+    """
+
+    def wrapper(func: Callable[..., Awaitable[Response]]):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def inner(*args, **kwargs) -> Response:
+            response = await func(*args, **kwargs)
+
+            if coverage := tracker.build_endpoint_coverage_for_httpx(endpoint, response):
+                tracker.storage.save(coverage)
+
+            return response
+
+        inner.__signature__ = signature
+        return inner
+
+    return wrapper
@@ -1,14 +1,14 @@
-import allure
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
 from clients.authentication.authentication_schema import (
     LoginRequestSchema,
     RefreshRequestSchema,
     LoginResponseSchema
 )
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 
@@ -17,42 +17,42 @@ class AuthenticationClient(APIClient):
     Клиент для работы с /api/v1/authentication
     """
 
-    @allure.step("Authenticate user")
+    @step("Authenticate user")
     # Cбор покрытия для эндпоинта POST /api/v1/authentication/login
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
     def login_api(self, request: LoginRequestSchema) -> Response:
         """
         Метод выполняет аутентификацию пользователя.
 
-        :param request: Словарь с email и password.
+        :param request: Модель с email и password.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/login",
-            # Сериализуем модель в словарь с использованием alias
-            json=request.model_dump(by_alias=True)
+            # Модель сериализуется в JSON по алиасам полей в post, без промежуточного словаря
+            json=request
         )
 
-    @allure.step("Refresh authentication token")
+    @step("Refresh authentication token")
     # Cбор покрытия для эндпоинта POST /api/v1/authentication/refresh
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
     def refresh_api(self, request: RefreshRequestSchema) -> Response:
         """
         Метод обновляет токен авторизации.
 
-        :param request: Словарь с refreshToken.
+        :param request: Модель с refresh_token.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/refresh",
-            # Сериализуем модель в словарь с использованием alias
-            json=request.model_dump(by_alias=True)
+            # Модель сериализуется в JSON по алиасам полей в post, без промежуточного словаря
+            json=request
         )
 
     def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
         response = self.login_api(request)
-        # Инициализируем модель через валидацию JSON строки
-        return LoginResponseSchema.model_validate_json(response.text)
+        # Модель разбирается из байтов ответа, без декодирования тела в строку
+        return LoginResponseSchema.model_validate_json(response.content)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -62,3 +62,52 @@ def get_authentication_client() -> AuthenticationClient:
     :return: Готовый к использованию AuthenticationClient.
     """
     return AuthenticationClient(client=get_public_http_client())
+
+
+class AsyncAuthenticationClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/authentication
+    """
+
+    @async_step("Authenticate user")
+    # Cбор покрытия для эндпоинта POST /api/v1/authentication/login
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/login")
+    async def login_api(self, request: LoginRequestSchema) -> Response:
+        """
+        Метод выполняет аутентификацию пользователя.
+
+        :param request: Модель с email и password.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/login",
+            json=request
+        )
+
+    @async_step("Refresh authentication token")
+    # Cбор покрытия для эндпоинта POST /api/v1/authentication/refresh
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/refresh")
+    async def refresh_api(self, request: RefreshRequestSchema) -> Response:
+        """
+        Метод обновляет токен авторизации.
+
+        :param request: Модель с refresh_token.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/refresh",
+            json=request
+        )
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        response = await self.login_api(request)
+        return LoginResponseSchema.model_validate_json(response.content)
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
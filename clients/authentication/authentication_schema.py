@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 # Импортируем заранее созданный экземпляр класса Fake
 from tools.fakers import fake
@@ -31,5 +31,15 @@ class RefreshRequestSchema(BaseModel):  # Наследуем от BaseModel вм
     """
     Описание структуры запроса для обновления токена.
     """
+    model_config = ConfigDict(populate_by_name=True)
+
     # Добавили генерацию случайного предложения
     refresh_token: str = Field(alias="refreshToken", default_factory=fake.sentence)
+
+
+class AuthenticationUserSchema(BaseModel, frozen=True):
+    """
+    Учётные данные пользователя, от имени которого работают приватные клиенты.
+    """
+    email: str
+    password: str
@@ -0,0 +1,292 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import AsyncGenerator, Generator
+
+from httpx import Auth, Request, Response
+
+from clients.authentication.authentication_client import AuthenticationClient, get_authentication_client
+from clients.authentication.authentication_schema import (
+    AuthenticationUserSchema,
+    LoginRequestSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema
+)
+from clients.authentication.token_storage import TokenStorage, StoredTokenSchema
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("TOKEN_MANAGER")
+
+
+def get_token_expiry(access_token: str) -> float | None:
+    """
+    Читает время истечения access token из поля exp JWT без проверки подписи.
+
+    :param access_token: Access token в формате JWT.
+    :return: Время истечения в секундах Unix или None, если токен не JWT или exp отсутствует.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class TokenState:
+    """
+    Токены пользователя и метаданные для их обновления и вытеснения.
+    """
+    access_token: str = ""
+    refresh_token: str = ""
+    expires_at: float = 0.0
+    last_used_at: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class TokenManager:
+    """
+    Хранит access и refresh токены пользователей и обновляет их до истечения.
+
+    Кэш ограничен по числу пользователей (LRU) и по времени простоя (TTL). Если задан storage,
+    токены дополнительно разделяются между процессами, и логин выполняется одним воркером.
+    """
+
+    def __init__(
+            self,
+            max_users: int,
+            idle_ttl: float,
+            refresh_margin: float,
+            access_token_ttl: float,
+            storage: TokenStorage | None = None
+    ):
+        """
+        :param max_users: Максимальное число пользователей в кэше.
+        :param idle_ttl: Время простоя в секундах, после которого пользователь вытесняется.
+        :param refresh_margin: За сколько секунд до истечения токен обновляется заранее.
+        :param access_token_ttl: Время жизни токена, если его нельзя прочитать из JWT.
+        :param storage: Общий для воркеров кэш токенов.
+        """
+        self.max_users = max_users
+        self.idle_ttl = idle_ttl
+        self.refresh_margin = refresh_margin
+        self.access_token_ttl = access_token_ttl
+        self.storage = storage
+
+        self._lock = threading.Lock()
+        self._tokens: OrderedDict[AuthenticationUserSchema, TokenState] = OrderedDict()
+        self._authentication_client: AuthenticationClient | None = None
+
+    @property
+    def authentication_client(self) -> AuthenticationClient:
+        if self._authentication_client is None:
+            self._authentication_client = get_authentication_client()
+
+        return self._authentication_client
+
+    def get_access_token(self, user: AuthenticationUserSchema) -> str:
+        """
+        Возвращает действующий access token пользователя.
+
+        При первом обращении выполняет логин, при приближении к истечению — обновление токена.
+
+        :param user: Учётные данные пользователя.
+        :return: Access token.
+        """
+        state = self._get_state(user)
+
+        with state.lock:
+            if self._is_fresh(state):
+                return state.access_token
+
+            if self.storage is None:
+                self._renew(user, state)
+                return state.access_token
+
+            with self.storage.lock(user):
+                # Другой воркер мог уже выполнить логин или обновить токен
+                if stored_token := self.storage.load(user):
+                    state.access_token = stored_token.access_token
+                    state.refresh_token = stored_token.refresh_token
+                    state.expires_at = stored_token.expires_at
+
+                if not self._is_fresh(state):
+                    self._renew(user, state)
+                    self.storage.save(user, StoredTokenSchema(
+                        access_token=state.access_token,
+                        refresh_token=state.refresh_token,
+                        expires_at=state.expires_at
+                    ))
+
+            return state.access_token
+
+    def get_fresh_access_token(self, user: AuthenticationUserSchema) -> str | None:
+        """
+        Возвращает access token из кэша без блокирующих операций.
+
+        Не ждёт логина или обновления токена в другом потоке, поэтому подходит для вызова из event loop.
+
+        :param user: Учётные данные пользователя.
+        :return: Access token или None, если токена нет или его пора обновить — тогда нужен get_access_token.
+        """
+        state = self._get_state(user)
+        # access_token записывается раньше expires_at, поэтому свежий срок всегда относится к новому токену
+        return state.access_token if self._is_fresh(state) else None
+
+    def invalidate(self, user: AuthenticationUserSchema, access_token: str | None = None) -> None:
+        """
+        Удаляет токены пользователя, следующий запрос выполнит логин заново.
+
+        :param user: Учётные данные пользователя.
+        :param access_token: Отклонённый сервером токен. Запись в общем кэше удаляется,
+        только если в ней всё ещё этот токен.
+        """
+        with self._lock:
+            self._tokens.pop(user, None)
+
+        if self.storage is not None:
+            self.storage.delete(user, access_token)
+
+    def clear(self) -> None:
+        """
+        Очищает кэш токенов всех пользователей.
+        """
+        with self._lock:
+            self._tokens.clear()
+
+    def _get_state(self, user: AuthenticationUserSchema) -> TokenState:
+        now = time.monotonic()
+
+        with self._lock:
+            # Вытесняем пользователей, которые простаивали дольше idle_ttl
+            for idle_user in [
+                cached_user for cached_user, state in self._tokens.items()
+                if now - state.last_used_at > self.idle_ttl
+            ]:
+                del self._tokens[idle_user]
+
+            state = self._tokens.get(user)
+            if state is None:
+                state = self._tokens[user] = TokenState()
+
+            state.last_used_at = now
+            self._tokens.move_to_end(user)
+
+            # Вытесняем наименее недавно использованных пользователей сверх лимита
+            while len(self._tokens) > self.max_users:
+                self._tokens.popitem(last=False)
+
+            return state
+
+    def _is_fresh(self, state: TokenState) -> bool:
+        return bool(state.access_token) and time.time() < state.expires_at - self.refresh_margin
+
+    def _renew(self, user: AuthenticationUserSchema, state: TokenState) -> None:
+        if state.refresh_token:
+            self._refresh(user, state)
+        else:
+            self._login(user, state)
+
+    def _login(self, user: AuthenticationUserSchema, state: TokenState) -> None:
+        logger.info("Login user %s", user.email)
+
+        request = LoginRequestSchema(email=user.email, password=user.password)
+        self._update_state(state, self.authentication_client.login(request))
+
+    def _refresh(self, user: AuthenticationUserSchema, state: TokenState) -> None:
+        logger.info("Refresh access token for user %s", user.email)
+
+        request = RefreshRequestSchema(refresh_token=state.refresh_token)
+        response = self.authentication_client.refresh_api(request)
+
+        if response.status_code != HTTPStatus.OK:
+            logger.warning("Unable to refresh access token for user %s: %s", user.email, response.status_code)
+            self._login(user, state)
+            return
+
+        self._update_state(state, LoginResponseSchema.model_validate_json(response.content))
+
+    def _update_state(self, state: TokenState, response: LoginResponseSchema) -> None:
+        state.access_token = response.token.access_token
+        state.refresh_token = response.token.refresh_token
+        state.expires_at = (
+                get_token_expiry(state.access_token)
+                or time.time() + self.access_token_ttl
+        )
+
+
+class TokenAuth(Auth):
+    """
+    Auth flow httpx, подставляющий актуальный access token пользователя в каждый запрос.
+
+    Если сервер ответил 401, токены пользователя сбрасываются и запрос повторяется один раз.
+    """
+
+    def __init__(self, user: AuthenticationUserSchema, manager: TokenManager | None = None):
+        """
+        :param user: Учётные данные пользователя.
+        :param manager: Менеджер токенов, по умолчанию общий для процесса token_manager.
+        """
+        self.user = user
+        self.manager = manager or token_manager
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        access_token = self.manager.get_access_token(self.user)
+        self.set_authorization(request, access_token)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            self.manager.invalidate(self.user, access_token)
+            self.set_authorization(request, self.manager.get_access_token(self.user))
+            yield request
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        # Свежий токен берём прямо в event loop, в поток уводим только логин и обновление синхронным клиентом
+        access_token = (
+                self.manager.get_fresh_access_token(self.user)
+                or await asyncio.to_thread(self.manager.get_access_token, self.user)
+        )
+        self.set_authorization(request, access_token)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            await asyncio.to_thread(self.manager.invalidate, self.user, access_token)
+            self.set_authorization(request, await asyncio.to_thread(self.manager.get_access_token, self.user))
+            yield request
+
+    @staticmethod
+    def set_authorization(request: Request, access_token: str) -> None:
+        request.headers["Authorization"] = f"Bearer {access_token}"
+
+
+def get_token_storage() -> TokenStorage | None:
+    """
+    Создаёт общий для воркеров кэш токенов, если он включён в настройках.
+
+    :return: Экземпляр TokenStorage или None.
+    """
+    if not settings.authentication.shared_cache:
+        return None
+
+    storage = TokenStorage(
+        directory=settings.authentication.shared_cache_dir,
+        namespace=settings.http_client.client_url
+    )
+    storage.prune()
+    return storage
+
+
+token_manager = TokenManager(
+    max_users=settings.authentication.max_users,
+    idle_ttl=settings.authentication.idle_ttl,
+    refresh_margin=settings.authentication.refresh_margin,
+    access_token_ttl=settings.authentication.access_token_ttl,
+    storage=get_token_storage()
+)
@@ -0,0 +1,101 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from tools.file_lock import FileLock
+
+
+class StoredTokenSchema(BaseModel):
+    """
+    Описание структуры токенов пользователя в общем файловом кэше.
+    """
+    access_token: str
+    refresh_token: str
+    expires_at: float
+
+
+class TokenStorage:
+    """
+    Файловый кэш токенов, общий для всех воркеров pytest-xdist на одном хосте.
+
+    Для каждого пользователя хранится отдельный JSON-файл, доступ к нему сериализуется
+    через lock-файл. Пароли в кэш не пишутся: имя файла — хэш от URL сервера, email и пароля.
+    """
+
+    def __init__(self, directory: Path, namespace: str):
+        """
+        :param directory: Директория кэша.
+        :param namespace: Пространство имён ключей, например URL сервера.
+        """
+        self.directory = directory
+        self.namespace = namespace
+
+    def lock(self, user: AuthenticationUserSchema) -> FileLock:
+        """
+        Возвращает межпроцессную блокировку записи пользователя.
+
+        :param user: Учётные данные пользователя.
+        :return: Контекстный менеджер FileLock.
+        """
+        return FileLock(self.directory / f"{self._get_key(user)}.lock")
+
+    def load(self, user: AuthenticationUserSchema) -> StoredTokenSchema | None:
+        """
+        Читает токены пользователя из кэша.
+
+        :param user: Учётные данные пользователя.
+        :return: Токены пользователя или None, если записи нет или она повреждена.
+        """
+        try:
+            return StoredTokenSchema.model_validate_json(self._get_path(user).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+    def save(self, user: AuthenticationUserSchema, token: StoredTokenSchema) -> None:
+        """
+        Атомарно записывает токены пользователя в кэш.
+
+        :param user: Учётные данные пользователя.
+        :param token: Токены пользователя.
+        """
+        path = self._get_path(user)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(token.model_dump_json())
+        os.replace(temporary_path, path)
+
+    def delete(self, user: AuthenticationUserSchema, access_token: str | None = None) -> None:
+        """
+        Удаляет токены пользователя из кэша.
+
+        :param user: Учётные данные пользователя.
+        :param access_token: Если указан, запись удаляется только если содержит этот токен,
+        чтобы не затереть токен, уже обновлённый другим воркером.
+        """
+        with self.lock(user):
+            token = self.load(user)
+            if token and (access_token is None or token.access_token == access_token):
+                self._get_path(user).unlink(missing_ok=True)
+
+    def prune(self) -> None:
+        """
+        Удаляет из кэша записи с истёкшими access token, оставшиеся от прошлых запусков.
+        """
+        now = time.time()
+        for path in self.directory.glob("*.json"):
+            try:
+                if StoredTokenSchema.model_validate_json(path.read_bytes()).expires_at < now:
+                    path.unlink(missing_ok=True)
+            except (OSError, ValidationError):
+                path.unlink(missing_ok=True)
+
+    def _get_key(self, user: AuthenticationUserSchema) -> str:
+        return hashlib.sha256(f"{self.namespace}\n{user.email}\n{user.password}".encode()).hexdigest()
+
+    def _get_path(self, user: AuthenticationUserSchema) -> Path:
+        return self.directory / f"{self._get_key(user)}.json"
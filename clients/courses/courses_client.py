@@ -1,8 +1,7 @@
-import allure
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
 from clients.courses.courses_schema import (
     GetCoursesQuerySchema,
     GetCoursesResponseSchema,
@@ -12,7 +11,12 @@ from clients.courses.courses_schema import (
     UpdateCourseRequestSchema,
     UpdateCourseResponseSchema
 )
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 class CoursesClient(APIClient):
@@ -20,7 +24,7 @@ class CoursesClient(APIClient):
     Клиент для работы с /api/v1/courses
     """
     
-    @allure.step("Get courses")
+    @step("Get courses")
     # Cбор покрытия для эндпоинта GET /api/v1/courses
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
     def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
@@ -32,7 +36,7 @@ class CoursesClient(APIClient):
         """
         return self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
 
-    @allure.step("Get course by id {course_id}")
+    @step("Get course by id {course_id}")
     # Cбор покрытия для эндпоинта GET /api/v1/courses/{course_id}
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
     def get_course_api(self, course_id: str) -> Response:
@@ -44,7 +48,7 @@ class CoursesClient(APIClient):
         """
         return self.get(f"{APIRoutes.COURSES}/{course_id}")
 
-    @allure.step("Create course")
+    @step("Create course")
     # Cбор покрытия для эндпоинта POST /api/v1/courses
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
     def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
@@ -55,9 +59,9 @@ class CoursesClient(APIClient):
         previewFileId, createdByUserId.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True))
+        return self.post(APIRoutes.COURSES, json=request)
 
-    @allure.step("Update course by id {course_id}")
+    @step("Update course by id {course_id}")
     # Cбор покрытия для эндпоинта PATCH /api/v1/courses/{course_id}
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
     def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
@@ -70,10 +74,10 @@ class CoursesClient(APIClient):
         """
         return self.patch(
             f"{APIRoutes.COURSES}/{course_id}",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
-    @allure.step("Delete course by id {course_id}")
+    @step("Delete course by id {course_id}")
     # Cбор покрытия для эндпоинта DELETE /api/v1/courses/{course_id}
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
     def delete_course_api(self, course_id: str) -> Response:
@@ -93,7 +97,7 @@ class CoursesClient(APIClient):
         :return: Валидированный ответ с курсами.
         """
         response = self.get_courses_api(query)
-        return GetCoursesResponseSchema.model_validate_json(response.text)
+        return GetCoursesResponseSchema.model_validate_json(response.content)
 
     def get_course(self, course_id: str) -> GetCourseResponseSchema:
         """
@@ -103,7 +107,7 @@ class CoursesClient(APIClient):
         :return: Валидированный ответ с курсом.
         """
         response = self.get_course_api(course_id)
-        return GetCourseResponseSchema.model_validate_json(response.text)
+        return GetCourseResponseSchema.model_validate_json(response.content)
 
     def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
         """
@@ -113,7 +117,7 @@ class CoursesClient(APIClient):
         :return: Валидированный ответ с созданным курсом.
         """
         response = self.create_course_api(request)
-        return CreateCourseResponseSchema.model_validate_json(response.text)
+        return CreateCourseResponseSchema.model_validate_json(response.content)
 
     def update_course(self, course_id: str, request: UpdateCourseRequestSchema) -> UpdateCourseResponseSchema:
         """
@@ -124,7 +128,7 @@ class CoursesClient(APIClient):
         :return: Валидированный ответ с обновленным курсом.
         """
         response = self.update_course_api(course_id, request)
-        return UpdateCourseResponseSchema.model_validate_json(response.text)
+        return UpdateCourseResponseSchema.model_validate_json(response.content)
 
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
@@ -133,3 +137,123 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     :return: Готовый к использованию CoursesClient.
     """
     return CoursesClient(client=get_private_http_client(user))
+
+
+class AsyncCoursesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/courses
+    """
+
+    @async_step("Get courses")
+    # Cбор покрытия для эндпоинта GET /api/v1/courses
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+        """
+        Метод получения списка курсов.
+
+        :param query: Модель с userId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
+
+    @async_step("Get course by id {course_id}")
+    # Cбор покрытия для эндпоинта GET /api/v1/courses/{course_id}
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def get_course_api(self, course_id: str) -> Response:
+        """
+        Метод получения курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.COURSES}/{course_id}")
+
+    @async_step("Create course")
+    # Cбор покрытия для эндпоинта POST /api/v1/courses
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+        """
+        Метод создания курса.
+
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
+        previewFileId, createdByUserId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.COURSES, json=request)
+
+    @async_step("Update course by id {course_id}")
+    # Cбор покрытия для эндпоинта PATCH /api/v1/courses/{course_id}
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
+        """
+        Метод обновления курса.
+
+        :param course_id: Идентификатор курса.
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(
+            f"{APIRoutes.COURSES}/{course_id}",
+            json=request
+        )
+
+    @async_step("Delete course by id {course_id}")
+    # Cбор покрытия для эндпоинта DELETE /api/v1/courses/{course_id}
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def delete_course_api(self, course_id: str) -> Response:
+        """
+        Метод удаления курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"{APIRoutes.COURSES}/{course_id}")
+
+    async def get_courses(self, query: GetCoursesQuerySchema) -> GetCoursesResponseSchema:
+        """
+        Метод получения списка курсов с валидацией ответа.
+
+        :param query: Модель с userId.
+        :return: Валидированный ответ с курсами.
+        """
+        response = await self.get_courses_api(query)
+        return GetCoursesResponseSchema.model_validate_json(response.content)
+
+    async def get_course(self, course_id: str) -> GetCourseResponseSchema:
+        """
+        Метод получения курса с валидацией ответа.
+
+        :param course_id: Идентификатор курса.
+        :return: Валидированный ответ с курсом.
+        """
+        response = await self.get_course_api(course_id)
+        return GetCourseResponseSchema.model_validate_json(response.content)
+
+    async def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
+        """
+        Метод создания курса с валидацией ответа.
+
+        :param request: Модель с данными для создания курса.
+        :return: Валидированный ответ с созданным курсом.
+        """
+        response = await self.create_course_api(request)
+        return CreateCourseResponseSchema.model_validate_json(response.content)
+
+    async def update_course(self, course_id: str, request: UpdateCourseRequestSchema) -> UpdateCourseResponseSchema:
+        """
+        Метод обновления курса с валидацией ответа.
+
+        :param course_id: Идентификатор курса.
+        :param request: Модель с данными для обновления курса.
+        :return: Валидированный ответ с обновленным курсом.
+        """
+        response = await self.update_course_api(course_id, request)
+        return UpdateCourseResponseSchema.model_validate_json(response.content)
+
+
+def get_async_courses_client(user: AuthenticationUserSchema) -> AsyncCoursesClient:
+    """
+    Функция создаёт экземпляр AsyncCoursesClient с уже настроенным HTTP-клиентом.
+    :return: Готовый к использованию AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=get_async_private_http_client(user))
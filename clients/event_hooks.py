@@ -1,21 +1,55 @@
-import allure
-from httpx import Request, Response
+import time
+from typing import Any, Awaitable, Callable
 
+from allure_commons.types import AttachmentType
+from httpx import Request, Response, ResponseNotRead
+
+from config import settings
+from tools.allure.attachments import attach
+from tools.assertions.base import assert_response_time_budget
 from tools.http.curl import make_curl_from_request
+from tools.latency import latency_recorder
 from tools.logger import get_logger
 
 # Инициализируем логгер один раз на весь модуль
 logger = get_logger("HTTP_CLIENT")
 
+# Ключи extensions: момент отправки запроса и время ответа в секундах
+STARTED_AT_EXTENSION = "autotests_started_at"
+RESPONSE_TIME_EXTENSION = "autotests_response_time"
+
 
 def curl_event_hook(request: Request):
     """
     Event hook для автоматического прикрепления cURL команды к Allure отчету.
 
+    В режиме failure_only команда формируется только если тест упал.
+
     :param request: HTTP-запрос, переданный в `httpx` клиент.
     """
-    curl_command = make_curl_from_request(request)
-    allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+    # Команда формируется позже, когда транспорт уже прочитал multipart поток, поэтому запоминаем его сейчас
+    stream = request.stream
+    attach(lambda: make_curl_from_request(request, stream=stream), "cURL command", AttachmentType.TEXT)
+
+
+def response_body_event_hook(response: Response):
+    """
+    Event hook для отложенного прикрепления тела ответа к Allure отчету упавшего теста.
+
+    Тело читается только при сбросе буфера, когда ответ уже прочитан клиентом.
+
+    :param response: Объект ответа HTTPX.
+    """
+
+    def render() -> str:
+        try:
+            body = response.text
+        except ResponseNotRead:
+            body = "<response body was not read>"
+
+        return f"{response.status_code} {response.reason_phrase} {response.url}\n\n{body}"
+
+    attach(render, f"Response {response.request.method} {response.url.path}", AttachmentType.TEXT)
 
 
 def log_request_event_hook(request: Request):  # Создаем event hook для логирования запроса
@@ -25,7 +59,7 @@ def log_request_event_hook(request: Request):  # Создаем event hook дл
     :param request: Объект запроса HTTPX.
     """
     # Пишем в лог информационное сообщение о запроса
-    logger.info(f'Make {request.method} request to {request.url}')
+    logger.info('Make %s request to %s', request.method, request.url)
 
 
 def log_response_event_hook(response: Response):  # Создаем event hook для логирования ответа
@@ -36,5 +70,140 @@ def log_response_event_hook(response: Response):  # Создаем event hook д
     """
     # Пишем в лог информационное сообщение о полученном ответе
     logger.info(
-        f"Got response {response.status_code} {response.reason_phrase} from {response.url}"
+        "Got response %s %s via %s from %s",
+        response.status_code, response.reason_phrase, response.http_version, response.url
     )
+
+
+def start_timer_event_hook(request: Request):
+    """
+    Запоминает момент отправки запроса для замера времени ответа.
+
+    :param request: Объект запроса HTTPX.
+    """
+    request.extensions[STARTED_AT_EXTENSION] = time.perf_counter()
+
+
+def stop_timer_event_hook(response: Response):
+    """
+    Сохраняет время от отправки запроса до получения заголовков ответа.
+
+    response.elapsed в response hook ещё недоступен, поэтому время считается от отметки start_timer_event_hook.
+
+    :param response: Объект ответа HTTPX.
+    """
+    if (started_at := response.request.extensions.get(STARTED_AT_EXTENSION)) is not None:
+        response.extensions[RESPONSE_TIME_EXTENSION] = time.perf_counter() - started_at
+
+
+def get_response_time(response: Response) -> float | None:
+    """
+    :param response: Объект ответа HTTPX.
+    :return: Время ответа в секундах, замеренное event hooks, или None, если замер не выполнялся.
+    """
+    return response.extensions.get(RESPONSE_TIME_EXTENSION)
+
+
+def latency_event_hook(response: Response):
+    """
+    Записывает время ответа в гистограмму эндпоинта.
+
+    :param response: Объект ответа HTTPX.
+    """
+    if (response_time := get_response_time(response)) is not None:
+        latency_recorder.record(response.request.method, response.url.path, response_time)
+
+
+def response_time_budget_event_hook(response: Response):
+    """
+    Проверяет время ответа по бюджету эндпоинта, при превышении в режиме fail запрос завершается AssertionError.
+
+    :param response: Объект ответа HTTPX.
+    """
+    if (response_time := get_response_time(response)) is not None:
+        assert_response_time_budget(response, response_time)
+
+
+# Хосты, для которых уже сообщили о переходе на HTTP/1.1
+_http1_fallback_hosts: set[str] = set()
+
+
+def http_version_event_hook(response: Response):
+    """
+    Сообщает, что сервер не согласовал HTTP/2 и соединение откатилось на HTTP/1.1.
+
+    Предупреждение пишется один раз на хост, чтобы не засорять лог.
+
+    :param response: Объект ответа HTTPX.
+    """
+    if response.http_version == "HTTP/2" or response.url.host in _http1_fallback_hosts:
+        return
+
+    _http1_fallback_hosts.add(response.url.host)
+    logger.warning(
+        "HTTP/2 is enabled, but %s negotiated %s", response.url.host, response.http_version
+    )
+
+
+def to_async_event_hook(hook: Callable[[Any], None]) -> Callable[[Any], Awaitable[None]]:
+    """
+    Оборачивает синхронный event hook в корутину для использования в httpx.AsyncClient.
+
+    :param hook: Синхронный event hook, принимающий Request или Response.
+    :return: Асинхронный event hook с тем же поведением.
+    """
+
+    async def inner(message: Any) -> None:
+        hook(message)
+
+    return inner
+
+
+def get_event_hooks() -> dict[str, list[Callable[[Any], None]]]:
+    """
+    Возвращает набор event hooks для httpx.Client.
+
+    В профиле lean cURL вложения и логирование запросов не подключаются.
+
+    :return: Словарь с хуками запросов и ответов.
+    """
+    hooks = {"request": [], "response": []}
+    if not settings.is_lean:
+        hooks["request"].extend([curl_event_hook, log_request_event_hook])  # Логируем исходящие HTTP-запросы
+        hooks["response"].append(log_response_event_hook)  # Логируем полученные HTTP-ответы
+
+        if settings.attachments.failure_only:
+            hooks["response"].append(response_body_event_hook)  # Тела ответов прикрепляем только при падении
+
+    if settings.http_client.http2:
+        hooks["response"].append(http_version_event_hook)  # Сообщаем о фолбэке на HTTP/1.1
+
+    budgets = settings.response_time
+    enforce_budgets = budgets.enforce and (budgets.budgets or budgets.default is not None)
+
+    if settings.latency.enabled or enforce_budgets:
+        # Таймер запускается последним хуком запроса и останавливается первым хуком ответа,
+        # чтобы работа других хуков не попадала в замер
+        hooks["request"].append(start_timer_event_hook)
+        hooks["response"].insert(0, stop_timer_event_hook)
+
+    if settings.latency.enabled:
+        hooks["response"].append(latency_event_hook)  # Пишем время ответа в гистограммы эндпоинтов
+
+    if enforce_budgets:
+        # Проверяем бюджет последним, чтобы при падении тела ответа уже были в буфере вложений
+        hooks["response"].append(response_time_budget_event_hook)
+
+    return hooks
+
+
+def get_async_event_hooks() -> dict[str, list[Callable[[Any], Awaitable[None]]]]:
+    """
+    Возвращает набор event hooks для httpx.AsyncClient.
+
+    :return: Словарь с асинхронными хуками запросов и ответов.
+    """
+    return {
+        event: [to_async_event_hook(hook) for hook in hooks]
+        for event, hooks in get_event_hooks().items()
+    }
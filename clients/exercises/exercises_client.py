@@ -1,9 +1,12 @@
-import allure 
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from clients.exercises.exercises_schema import (
     GetExerciseResponseSchema,
     GetExercisesQuerySchema,
@@ -13,6 +16,7 @@ from clients.exercises.exercises_schema import (
     UpdateExerciseRequestSchema,
     UpdateExerciseResponseSchema
 )
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 class ExercisesClient(APIClient):
@@ -20,7 +24,7 @@ class ExercisesClient(APIClient):
     Клиент для работы с /api/v1/exercises
     """
 
-    @allure.step("Call GET /api/v1/exercises with query: {query}")
+    @step("Call GET /api/v1/exercises with query: {query}")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
     def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
         """
@@ -31,7 +35,7 @@ class ExercisesClient(APIClient):
         """
         return self.get(str(APIRoutes.EXERCISES), params=query.model_dump(by_alias=True))
 
-    @allure.step("Call GET /api/v1/exercises/{exercise_id} with id: {exercise_id}")
+    @step("Call GET /api/v1/exercises/{exercise_id} with id: {exercise_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def get_exercise_api(self, exercise_id: str) -> Response:
         """
@@ -42,7 +46,7 @@ class ExercisesClient(APIClient):
         """
         return self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
-    @allure.step("Call POST /api/v1/exercises to create exercise with data: {request}")
+    @step("Call POST /api/v1/exercises to create exercise with data: {request}")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
     def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
         """
@@ -51,9 +55,9 @@ class ExercisesClient(APIClient):
         :param request: Модель с title, courseId, maxScore, minScore, orderIndex, description, estimatedTime.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(APIRoutes.EXERCISES, json=request.model_dump(by_alias=True))
+        return self.post(APIRoutes.EXERCISES, json=request)
 
-    @allure.step("Call PATCH /api/v1/exercises/{exercise_id} to update exercise with id: {exercise_id} and data: {request}")
+    @step("Call PATCH /api/v1/exercises/{exercise_id} to update exercise with id: {exercise_id} and data: {request}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
         """
@@ -63,9 +67,9 @@ class ExercisesClient(APIClient):
         :param request: Модель с title, maxScore, minScore, orderIndex, description, estimatedTime.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", json=request.model_dump(by_alias=True, exclude_none=True))
+        return self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", json=request, exclude_none=True)
 
-    @allure.step("Call DELETE /api/v1/exercises/{exercise_id} to delete exercise with id: {exercise_id}")
+    @step("Call DELETE /api/v1/exercises/{exercise_id} to delete exercise with id: {exercise_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
     def delete_exercise_api(self, exercise_id: str) -> Response:
         """
@@ -76,7 +80,7 @@ class ExercisesClient(APIClient):
         """
         return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
-    @allure.step("Get and validate exercises list with query: {query}")
+    @step("Get and validate exercises list with query: {query}")
     def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
         """
         Метод получения списка заданий с валидацией ответа.
@@ -85,9 +89,9 @@ class ExercisesClient(APIClient):
         :return: Валидированный ответ со списком заданий.
         """
         response = self.get_exercises_api(query)
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return GetExercisesResponseSchema.model_validate_json(response.content)
 
-    @allure.step("Get and validate exercise with id: {exercise_id}")
+    @step("Get and validate exercise with id: {exercise_id}")
     def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
         """
         Метод получения задания с валидацией ответа.
@@ -96,9 +100,9 @@ class ExercisesClient(APIClient):
         :return: Валидированный ответ с заданием.
         """
         response = self.get_exercise_api(exercise_id)
-        return GetExerciseResponseSchema.model_validate_json(response.text)
+        return GetExerciseResponseSchema.model_validate_json(response.content)
 
-    @allure.step("Create and validate exercise with data: {request}")
+    @step("Create and validate exercise with data: {request}")
     def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
         """
         Метод создания задания с валидацией ответа.
@@ -107,9 +111,9 @@ class ExercisesClient(APIClient):
         :return: Валидированный ответ с созданным заданием.
         """
         response = self.create_exercise_api(request)
-        return CreateExerciseResponseSchema.model_validate_json(response.text)
+        return CreateExerciseResponseSchema.model_validate_json(response.content)
 
-    @allure.step("Update and validate exercise with id: {exercise_id} and data: {request}")
+    @step("Update and validate exercise with id: {exercise_id} and data: {request}")
     def update_exercise(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> UpdateExerciseResponseSchema:
         """
         Метод обновления задания с валидацией ответа.
@@ -119,7 +123,7 @@ class ExercisesClient(APIClient):
         :return: Валидированный ответ с обновленным заданием.
         """
         response = self.update_exercise_api(exercise_id, request)
-        return UpdateExerciseResponseSchema.model_validate_json(response.text)
+        return UpdateExerciseResponseSchema.model_validate_json(response.content)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -129,3 +133,126 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
     :return: Готовый к использованию ExercisesClient.
     """
     return ExercisesClient(client=get_private_http_client(user))
+
+
+class AsyncExercisesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/exercises
+    """
+
+    @async_step("Call GET /api/v1/exercises with query: {query}")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
+        """
+        Метод получения списка заданий.
+
+        :param query: Модель с courseId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(str(APIRoutes.EXERCISES), params=query.model_dump(by_alias=True))
+
+    @async_step("Call GET /api/v1/exercises/{exercise_id} with id: {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def get_exercise_api(self, exercise_id: str) -> Response:
+        """
+        Метод получения задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+    @async_step("Call POST /api/v1/exercises to create exercise with data: {request}")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+        """
+        Метод создания задания.
+
+        :param request: Модель с title, courseId, maxScore, minScore, orderIndex, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.EXERCISES, json=request)
+
+    @async_step("Call PATCH /api/v1/exercises/{exercise_id} to update exercise with id: {exercise_id} and data: {request}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
+        """
+        Метод обновления задания.
+
+        :param exercise_id: Идентификатор задания.
+        :param request: Модель с title, maxScore, minScore, orderIndex, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(
+            f"{APIRoutes.EXERCISES}/{exercise_id}",
+            json=request, exclude_none=True
+        )
+
+    @async_step("Call DELETE /api/v1/exercises/{exercise_id} to delete exercise with id: {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def delete_exercise_api(self, exercise_id: str) -> Response:
+        """
+        Метод удаления задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+    @async_step("Get and validate exercises list with query: {query}")
+    async def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
+        """
+        Метод получения списка заданий с валидацией ответа.
+
+        :param query: Модель с courseId.
+        :return: Валидированный ответ со списком заданий.
+        """
+        response = await self.get_exercises_api(query)
+        return GetExercisesResponseSchema.model_validate_json(response.content)
+
+    @async_step("Get and validate exercise with id: {exercise_id}")
+    async def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
+        """
+        Метод получения задания с валидацией ответа.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Валидированный ответ с заданием.
+        """
+        response = await self.get_exercise_api(exercise_id)
+        return GetExerciseResponseSchema.model_validate_json(response.content)
+
+    @async_step("Create and validate exercise with data: {request}")
+    async def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
+        """
+        Метод создания задания с валидацией ответа.
+
+        :param request: Модель с данными для создания задания.
+        :return: Валидированный ответ с созданным заданием.
+        """
+        response = await self.create_exercise_api(request)
+        return CreateExerciseResponseSchema.model_validate_json(response.content)
+
+    @async_step("Update and validate exercise with id: {exercise_id} and data: {request}")
+    async def update_exercise(
+            self,
+            exercise_id: str,
+            request: UpdateExerciseRequestSchema
+    ) -> UpdateExerciseResponseSchema:
+        """
+        Метод обновления задания с валидацией ответа.
+
+        :param exercise_id: Идентификатор задания.
+        :param request: Модель с данными для обновления задания.
+        :return: Валидированный ответ с обновленным заданием.
+        """
+        response = await self.update_exercise_api(exercise_id, request)
+        return UpdateExerciseResponseSchema.model_validate_json(response.content)
+
+
+def get_async_exercises_client(user: AuthenticationUserSchema) -> AsyncExercisesClient:
+    """
+    Функция создаёт экземпляр AsyncExercisesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncExercisesClient.
+    """
+    return AsyncExercisesClient(client=get_async_private_http_client(user))
@@ -1,17 +1,22 @@
-import allure
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
+from tools.uploads import open_upload_file
 
 class FilesClient(APIClient):
     """
     Клиент для работы с /api/v1/files
     """
-    @allure.step("Get file by id {file_id}")
+    @step("Get file by id {file_id}")
     # Cбор покрытия для эндпоинта GET /api/v1/files/{file_id}
     @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
     def get_file_api(self, file_id: str) -> Response:
@@ -23,7 +28,7 @@ class FilesClient(APIClient):
         """
         return self.get(f"{APIRoutes.FILES}/{file_id}")
 
-    @allure.step("Create file")
+    @step("Create file")
     # Cбор покрытия для эндпоинта POST /api/v1/files
     @tracker.track_coverage_httpx(APIRoutes.FILES)
     def create_file_api(self, request: CreateFileRequestSchema) -> Response:
@@ -33,13 +38,15 @@ class FilesClient(APIClient):
         :param request: Словарь с filename, directory, upload_file.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(
-            APIRoutes.FILES,
-            data=request.model_dump(by_alias=True, exclude={'upload_file'}),
-            files={"upload_file": request.upload_file.read_bytes()}
-        )
+        # Файл отправляется частями из открытого файла или общего кэша, а не читается в память целиком
+        with open_upload_file(request.upload_file) as upload_file:
+            return self.post(
+                APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={'upload_file'}),
+                files={"upload_file": upload_file}
+            )
 
-    @allure.step("Delete file by id {file_id}")
+    @step("Delete file by id {file_id}")
     # Cбор покрытия для эндпоинта DELETE /api/v1/files/{file_id}
     @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
     def delete_file_api(self, file_id: str) -> Response:
@@ -53,7 +60,7 @@ class FilesClient(APIClient):
 
     def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text)
+        return CreateFileResponseSchema.model_validate_json(response.content)
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     """
@@ -61,3 +68,60 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     :return: Готовый к использованию FilesClient.
     """
     return FilesClient(client=get_private_http_client(user))
+
+
+class AsyncFilesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/files
+    """
+    @async_step("Get file by id {file_id}")
+    # Cбор покрытия для эндпоинта GET /api/v1/files/{file_id}
+    @track_coverage_httpx_async(f'{APIRoutes.FILES}/{{file_id}}')
+    async def get_file_api(self, file_id: str) -> Response:
+        """
+        Метод получения файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.FILES}/{file_id}")
+
+    @async_step("Create file")
+    # Cбор покрытия для эндпоинта POST /api/v1/files
+    @track_coverage_httpx_async(APIRoutes.FILES)
+    async def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+        """
+        Метод создания файла.
+
+        :param request: Словарь с filename, directory, upload_file.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        with open_upload_file(request.upload_file) as upload_file:
+            return await self.post(
+                APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={'upload_file'}),
+                files={"upload_file": upload_file}
+            )
+
+    @async_step("Delete file by id {file_id}")
+    # Cбор покрытия для эндпоинта DELETE /api/v1/files/{file_id}
+    @track_coverage_httpx_async(f'{APIRoutes.FILES}/{{file_id}}')
+    async def delete_file_api(self, file_id: str) -> Response:
+        """
+        Метод удаления файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"{APIRoutes.FILES}/{file_id}")
+
+    async def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
+        response = await self.create_file_api(request)
+        return CreateFileResponseSchema.model_validate_json(response.content)
+
+def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже настроенным HTTP-клиентом.
+    :return: Готовый к использованию AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=get_async_private_http_client(user))
@@ -15,8 +15,8 @@ class CreateFileRequestSchema(BaseModel):
     """
     Описание структуры запроса на создание файла.
     """
-    # Добавили генерацию случайного названия файла с расширением PNG
-    filename: str = Field(default_factory=lambda: f"{fake.uuid4()}.png")
+    # Уникальное название файла с расширением PNG, не пересекается между воркерами и запусками
+    filename: str = Field(default_factory=lambda: fake.filename("png"))
     # Директорию оставляем статичной, чтобы все тестовые файлы на сервере попадали в одну папку
     directory: str = Field(default="tests")
     upload_file: FilePath
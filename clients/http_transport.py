@@ -0,0 +1,46 @@
+from functools import lru_cache
+
+from httpx import AsyncBaseTransport, BaseTransport, HTTPTransport, MockTransport
+
+from config import settings, HTTPTransportType
+from tools.fake_server import get_fake_server
+
+
+@lru_cache(maxsize=None)
+def get_http_transport() -> BaseTransport:
+    """
+    Возвращает общий для процесса транспорт httpx с пулом keep-alive соединений.
+
+    Все публичные и приватные клиенты используют один транспорт, поэтому TCP/TLS соединения
+    переиспользуются между фикстурами, а не открываются заново для каждого клиента.
+    При HTTP_CLIENT.TRANSPORT=fake запросы обрабатывает фейковый сервер в памяти процесса.
+
+    :return: Экземпляр httpx.HTTPTransport с лимитами и версией протокола из настроек или httpx.MockTransport.
+    """
+    if settings.http_client.transport == HTTPTransportType.FAKE:
+        return MockTransport(get_fake_server().handle)
+
+    return HTTPTransport(limits=settings.http_client.limits, http2=settings.http_client.http2)
+
+
+def get_async_http_transport() -> AsyncBaseTransport | None:
+    """
+    Возвращает транспорт для httpx.AsyncClient.
+
+    :return: httpx.MockTransport фейкового сервера или None — тогда AsyncClient создаёт собственный пул.
+    """
+    if settings.http_client.transport == HTTPTransportType.FAKE:
+        return MockTransport(get_fake_server().handle)
+
+    return None
+
+
+def close_http_transport() -> None:
+    """
+    Закрывает общий транспорт и все соединения пула.
+
+    Транспорт пересоздаётся при следующем вызове get_http_transport.
+    """
+    if get_http_transport.cache_info().currsize:
+        get_http_transport().close()
+        get_http_transport.cache_clear()
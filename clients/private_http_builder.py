@@ -1,37 +1,164 @@
-from functools import lru_cache
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
 
-from httpx import Client
-from pydantic import BaseModel
+from httpx import Client, AsyncClient, BaseTransport, Request, Response
 
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from clients.authentication.token_manager import TokenAuth
+from clients.event_hooks import get_event_hooks, get_async_event_hooks
+from clients.http_transport import get_http_transport, get_async_http_transport
 from config import settings
 
-class AuthenticationUserSchema(BaseModel, frozen=True):
-    email: str
-    password: str
+
+class ClientTransport(BaseTransport):
+    """
+    Транспорт приватного клиента поверх общего транспорта процесса.
+
+    Отмечает каждый запрос клиента в кэше, чтобы вытеснялись действительно простаивающие клиенты,
+    а при закрытии клиента не закрывает общий пул соединений.
+    """
+
+    def __init__(self, transport: BaseTransport, on_request: Callable[[], None]):
+        """
+        :param transport: Общий транспорт, см. get_http_transport.
+        :param on_request: Вызывается перед каждым запросом клиента.
+        """
+        self.transport = transport
+        self.on_request = on_request
+
+    def handle_request(self, request: Request) -> Response:
+        self.on_request()
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        # Общий пул закрывается один раз в close_http_transport
+        return None
+
+
+class PrivateClientCache:
+    """
+    Кэш приватных клиентов пользователей с той же политикой, что у кэша токенов: не больше max_size клиентов (LRU),
+    клиенты без запросов дольше idle_ttl вытесняются. Вытесненные клиенты закрываются.
+    """
+
+    def __init__(self, max_size: int, idle_ttl: float):
+        """
+        :param max_size: Максимальное число клиентов.
+        :param idle_ttl: Время простоя в секундах, после которого клиент вытесняется.
+        """
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+
+        self._lock = threading.Lock()
+        self._clients: OrderedDict[AuthenticationUserSchema, Client] = OrderedDict()
+        self._last_used_at: dict[AuthenticationUserSchema, float] = {}
+
+    def get(self, user: AuthenticationUserSchema, factory: Callable[[BaseTransport], Client]) -> Client:
+        """
+        :param user: Учётные данные пользователя.
+        :param factory: Создаёт клиент с переданным транспортом, если его нет в кэше.
+        :return: Клиент пользователя.
+        """
+        with self._lock:
+            evicted = self._evict_idle(time.monotonic())
+
+            client = self._clients.get(user)
+            if client is None:
+                client = self._clients[user] = factory(ClientTransport(get_http_transport(), lambda: self.touch(user)))
+
+            self._touch(user)
+            while len(self._clients) > self.max_size:
+                evicted.append(self._pop(next(iter(self._clients))))
+
+        for evicted_client in evicted:
+            evicted_client.close()
+
+        return client
+
+    def touch(self, user: AuthenticationUserSchema) -> None:
+        """
+        Отмечает использование клиента пользователя.
+        """
+        with self._lock:
+            if user in self._clients:
+                self._touch(user)
+
+    def clear(self) -> None:
+        """
+        Закрывает и удаляет все клиенты.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._last_used_at.clear()
+
+        for client in clients:
+            client.close()
+
+    def _touch(self, user: AuthenticationUserSchema) -> None:
+        self._last_used_at[user] = time.monotonic()
+        self._clients.move_to_end(user)
+
+    def _evict_idle(self, now: float) -> list[Client]:
+        # Клиенты упорядочены по последнему использованию, поэтому простаивающие находятся в начале
+        evicted = []
+        for user in list(self._clients):
+            if now - self._last_used_at[user] <= self.idle_ttl:
+                break
+
+            evicted.append(self._pop(user))
+
+        return evicted
+
+    def _pop(self, user: AuthenticationUserSchema) -> Client:
+        del self._last_used_at[user]
+        return self._clients.pop(user)
+
+
+private_client_cache = PrivateClientCache(
+    max_size=settings.authentication.max_users,
+    idle_ttl=settings.authentication.idle_ttl
+)
 
 
-@lru_cache(maxsize=None)
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с аутентификацией пользователя.
 
+    Токен не фиксируется в заголовках: TokenAuth подставляет актуальный access token
+    в каждый запрос и обновляет его до истечения. Клиенты кэшируются по пользователю,
+    клиент без запросов дольше AUTHENTICATION.IDLE_TTL закрывается, см. PrivateClientCache.
+
     :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
-    :return: Готовый к использованию объект httpx.Client с установленным заголовком Authorization.
+    :return: Готовый к использованию объект httpx.Client с аутентификацией пользователя.
     """
-    authentication_client = get_authentication_client()
+    return private_client_cache.get(
+        user,
+        lambda transport: Client(
+            timeout=settings.http_client.timeout,
+            transport=transport,
+            base_url=settings.http_client.client_url,
+            auth=TokenAuth(user),
+            event_hooks=get_event_hooks(),
+        )
+    )
 
-    login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = authentication_client.login(login_request)
 
-    return Client(
+def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с аутентификацией пользователя.
+
+    :param user: Объект AuthenticationUserSchema с email и паролем пользователя.
+    :return: Готовый к использованию объект httpx.AsyncClient с аутентификацией пользователя.
+    """
+    return AsyncClient(
         timeout=settings.http_client.timeout,
+        limits=settings.http_client.limits,
+        http2=settings.http_client.http2,
+        transport=get_async_http_transport(),
         base_url=settings.http_client.client_url,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
-        event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
-            "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
-        },
+        auth=TokenAuth(user),
+        event_hooks=get_async_event_hooks(),
     )
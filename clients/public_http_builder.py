@@ -1,6 +1,7 @@
-from httpx import Client
+from httpx import Client, AsyncClient
 
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.event_hooks import get_event_hooks, get_async_event_hooks
+from clients.http_transport import get_http_transport, get_async_http_transport
 from config import settings
 
 
@@ -12,9 +13,26 @@ def get_public_http_client() -> Client:
     """
     return Client(
         timeout=settings.http_client.timeout,
+        transport=get_http_transport(),
         base_url=settings.http_client.client_url,
-        event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
-            "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
-        }
+        event_hooks=get_event_hooks()
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками.
+
+    Асинхронные соединения привязаны к event loop, поэтому пул у каждого AsyncClient свой,
+    но с теми же лимитами, что и у общего транспорта.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.http_client.timeout,
+        limits=settings.http_client.limits,
+        http2=settings.http_client.http2,
+        transport=get_async_http_transport(),
+        base_url=settings.http_client.client_url,
+        event_hooks=get_async_event_hooks()
     )
@@ -1,10 +1,14 @@
-import allure
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from clients.users.users_schema import UpdateUserRequestSchema, GetUserResponseSchema
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 class PrivateUsersClient(APIClient):
@@ -12,7 +16,7 @@ class PrivateUsersClient(APIClient):
     Клиент для работы с /api/v1/users
     """
 
-    @allure.step("Get user me")
+    @step("Get user me")
     # Cбор покрытия для эндпоинта GET /api/v1/users/me
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/me')
     def get_user_me_api(self) -> Response:
@@ -23,7 +27,7 @@ class PrivateUsersClient(APIClient):
         """
         return self.get(f"{APIRoutes.USERS}/me")
 
-    @allure.step("Get user by id {user_id}")
+    @step("Get user by id {user_id}")
     # Cбор покрытия для эндпоинта GET /api/v1/users/{user_id}
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
     def get_user_api(self, user_id: str) -> Response:
@@ -35,7 +39,7 @@ class PrivateUsersClient(APIClient):
         """
         return self.get(f"{APIRoutes.USERS}/{user_id}")
 
-    @allure.step("Update user by id {user_id}")
+    @step("Update user by id {user_id}")
     # Cбор покрытия для эндпоинта PATCH /api/v1/users/{user_id}
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
     def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
@@ -46,9 +50,9 @@ class PrivateUsersClient(APIClient):
         :param request: Словарь с email, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+        return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request)
 
-    @allure.step("Delete user by id {user_id}")
+    @step("Delete user by id {user_id}")
     # Cбор покрытия для эндпоинта DELETE /api/v1/users/{user_id}
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
     def delete_user_api(self, user_id: str) -> Response:
@@ -62,7 +66,7 @@ class PrivateUsersClient(APIClient):
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return GetUserResponseSchema.model_validate_json(response.content)
 
 
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
@@ -72,3 +76,70 @@ def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClie
     :return: Готовый к использованию PrivateUsersClient.
     """
     return PrivateUsersClient(client=get_private_http_client(user))
+
+
+class AsyncPrivateUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    @async_step("Get user me")
+    # Cбор покрытия для эндпоинта GET /api/v1/users/me
+    @track_coverage_httpx_async(f'{APIRoutes.USERS}/me')
+    async def get_user_me_api(self) -> Response:
+        """
+        Метод получения текущего пользователя.
+
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.USERS}/me")
+
+    @async_step("Get user by id {user_id}")
+    # Cбор покрытия для эндпоинта GET /api/v1/users/{user_id}
+    @track_coverage_httpx_async(f'{APIRoutes.USERS}/{{user_id}}')
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Метод получения пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.USERS}/{user_id}")
+
+    @async_step("Update user by id {user_id}")
+    # Cбор покрытия для эндпоинта PATCH /api/v1/users/{user_id}
+    @track_coverage_httpx_async(f'{APIRoutes.USERS}/{{user_id}}')
+    async def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
+        """
+        Метод обновления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :param request: Словарь с email, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(f"{APIRoutes.USERS}/{user_id}", json=request)
+
+    @async_step("Delete user by id {user_id}")
+    # Cбор покрытия для эндпоинта DELETE /api/v1/users/{user_id}
+    @track_coverage_httpx_async(f'{APIRoutes.USERS}/{{user_id}}')
+    async def delete_user_api(self, user_id: str) -> Response:
+        """
+        Метод удаления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.delete(f"{APIRoutes.USERS}/{user_id}")
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.content)
+
+
+def get_async_private_users_client(user: AuthenticationUserSchema) -> AsyncPrivateUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPrivateUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=get_async_private_http_client(user))
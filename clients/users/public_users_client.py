@@ -1,10 +1,10 @@
-import allure
 from httpx import Response
 
-from clients.api_client import APIClient
-from clients.api_coverage import tracker
-from clients.public_http_builder import get_public_http_client
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
 from clients.users.users_schema import CreateUserResponseSchema, CreateUserRequestSchema
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 class PublicUsersClient(APIClient):
@@ -12,7 +12,7 @@ class PublicUsersClient(APIClient):
     Клиент для работы с /api/v1/users
     """
 
-    @allure.step("Create user")
+    @step("Create user")
     # Cбор покрытия для эндпоинта POST /api/v1/users
     @tracker.track_coverage_httpx(APIRoutes.USERS)
     def create_user_api(self, request: CreateUserRequestSchema) -> Response:
@@ -22,11 +22,11 @@ class PublicUsersClient(APIClient):
         :param request: Словарь с email, password, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        return self.post(APIRoutes.USERS, json=request)
 
     def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return CreateUserResponseSchema.model_validate_json(response.content)
 
 
 def get_public_users_client() -> PublicUsersClient:
@@ -36,3 +36,34 @@ def get_public_users_client() -> PublicUsersClient:
     :return: Готовый к использованию PublicUsersClient.
     """
     return PublicUsersClient(client=get_public_http_client())
+
+
+class AsyncPublicUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    @async_step("Create user")
+    # Cбор покрытия для эндпоинта POST /api/v1/users
+    @track_coverage_httpx_async(APIRoutes.USERS)
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Метод создает пользователя.
+
+        :param request: Словарь с email, password, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.USERS, json=request)
+
+    async def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.content)
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
@@ -1,20 +1,239 @@
+import logging
+from enum import Enum
+from pathlib import Path
 from typing import Self
 
-from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
+from httpx import Limits
+from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class ExecutionProfile(str, Enum):
+    # Полная отчётность: allure шаги, cURL вложения и логи запросов
+    FULL = "full"
+    # Нагрузочные прогоны: шаги, вложения и логи запросов отключены
+    LEAN = "lean"
+
+
+class HTTPTransportType(str, Enum):
+    # Запросы уходят на сервер по адресу url
+    HTTP = "http"
+    # Запросы обрабатывает фейковый сервер в памяти процесса, сеть не нужна
+    FAKE = "fake"
+
+
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    transport: HTTPTransportType = HTTPTransportType.HTTP
+    # Лимиты общего пула соединений
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    # HTTP/2 согласуется через ALPN (только для https), при отказе сервера используется HTTP/1.1
+    http2: bool = False
 
     @property
     def client_url(self) -> str:
         return str(self.url)
 
+    @property
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class AuthenticationConfig(BaseModel):
+    # Время жизни access token, если его не удалось прочитать из JWT (секунды)
+    access_token_ttl: float = 1800.0
+    # За сколько секунд до истечения access token обновляется заранее
+    refresh_margin: float = 60.0
+    # Максимальное число пользователей в кэше токенов
+    max_users: int = 256
+    # Через сколько секунд простоя пользователь вытесняется из кэша токенов
+    idle_ttl: float = 900.0
+    # Общий файловый кэш токенов для воркеров pytest-xdist на одном хосте
+    shared_cache: bool = True
+    shared_cache_dir: Path = Path("./.tokens")
+
+
+class EntityPoolConfig(BaseModel):
+    # Максимальное число одновременных запросов при наполнении пула
+    concurrency: int = 16
+    # Сколько монопольных сущностей каждого типа создать сверх посчитанной потребности
+    reserve: int = 1
+
+
+class FakerConfig(BaseModel):
+    # Размер пулов заранее сгенерированных значений в tools/fakers.py, 0 — пулы отключены
+    batch_size: int = 0
+    # Доля пула, которая обновляется в фоне после каждых batch_size выданных значений
+    refill_ratio: float = 0.25
+    # Зерно запуска; данные каждого теста засеиваются зерном, вычисленным из него и nodeid теста.
+    # По умолчанию выбирается случайно и выводится в заголовке pytest, чтобы повторить данные упавшего теста
+    seed: int | None = None
+    # Идентификатор запуска в уникальных email и именах файлов, по умолчанию случайный
+    run_id: str | None = None
+
+
+class AttachmentsConfig(BaseModel):
+    # Прикреплять cURL, тела ответов и логи к allure отчету только для упавших тестов
+    failure_only: bool = True
+    # Размеры кольцевого буфера одного теста, старые записи вытесняются
+    max_attachments: int = 50
+    max_log_lines: int = 500
+    # Максимальный размер текстового тела запроса в cURL команде (байты)
+    max_curl_body_size: int = 10_000
+
+
+class LoggingConfig(BaseModel):
+    # Уровень логирования по умолчанию и переопределения по имени логгера
+    level: str = "DEBUG"
+    levels: dict[str, str] = {}
+    # Писать записи в формате JSON lines вместо текстового формата
+    json_format: bool = False
+    console: bool = True
+    # Директория файлов логов, по файлу на воркер pytest-xdist; без неё логи пишутся только в консоль
+    directory: Path | None = None
+
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, level: str) -> str:
+        return get_log_level_name(level)
+
+    @field_validator("levels")
+    @classmethod
+    def validate_levels(cls, levels: dict[str, str]) -> dict[str, str]:
+        return {name: get_log_level_name(level) for name, level in levels.items()}
+
+
+def get_log_level_name(level: str) -> str:
+    """
+    Проверяет имя уровня логирования, чтобы опечатка в LOGGING.LEVEL не превращалась в непонятную ошибку логгера.
+
+    :param level: Имя уровня в любом регистре, например "debug".
+    :return: Имя уровня в верхнем регистре.
+    """
+    names = logging.getLevelNamesMapping()
+    if level.upper() not in names:
+        raise ValueError(f'Unknown logging level "{level}", expected one of: {", ".join(names)}')
+
+    return level.upper()
+
+
+class SchemaRegistryConfig(BaseModel):
+    # Сохранять сгенерированные JSON-схемы моделей на диск для повторных запусков и воркеров xdist
+    disk_cache: bool = True
+    cache_dir: Path = Path("./.schemas")
+
+
+class BenchmarkConfig(BaseModel):
+    rounds: int = 5
+    warmup: int = 10
+    # Минимальная длительность одного раунда замера (секунды)
+    min_round_time: float = 0.05
+    # Допустимое замедление медианы относительно baseline, 0.3 — на 30%
+    max_regression: float = 0.3
+    results_file: Path = Path("./benchmark-results/results.json")
+    baseline_file: Path = Path("./benchmarks/baseline.json")
+    # Перезаписать baseline результатами текущего запуска вместо сравнения
+    update_baseline: bool = False
+
+
+class LatencyConfig(BaseModel):
+    # Собирать гистограммы времени ответа по эндпоинтам из event hooks
+    enabled: bool = True
+    results_file: Path = Path("./latency-results/results.json")
+
+
+class PerfConfig(BaseModel):
+    # Параметры маркера perf по умолчанию
+    iterations: int = 100
+    warmup: int = 10
+    # Бюджеты перцентилей в миллисекундах для всех тестов perf, аргументы маркера их переопределяют,
+    # например {"p95_ms": 150}; задаются под стенд, на котором запускаются тесты
+    budgets: dict[str, float] = {"p95_ms": 150}
+    # Время итераций каждого теста сохраняется в отдельный файл для сравнения между запусками
+    results_dir: Path = Path("./perf-results")
+
+
+class BudgetAction(str, Enum):
+    # Превышение бюджета роняет тест
+    FAIL = "fail"
+    # Превышение бюджета только записывается в лог, отчет и предупреждения pytest
+    WARN = "warn"
+
+
+class ResponseTimeConfig(BaseModel):
+    # Бюджеты времени ответа в миллисекундах по эндпоинтам, например {"GET /api/v1/courses": 300}
+    budgets: dict[str, float] = {}
+    # Бюджет эндпоинтов, которых нет в budgets; без него такие эндпоинты не проверяются
+    default: float | None = None
+    action: BudgetAction = BudgetAction.FAIL
+    # Проверять бюджеты в response hook для каждого запроса
+    enforce: bool = True
+
+
+class LoadMode(str, Enum):
+    # Открытая модель: операции запускаются с заданной частотой независимо от времени ответа
+    RPS = "rps"
+    # Закрытая модель: заданное число пользователей выполняет операции одну за другой
+    CONCURRENCY = "concurrency"
+
+
+class LoadPhaseConfig(BaseModel):
+    name: str
+    # Длительность фазы (секунды)
+    duration: float
+    # Целевое RPS или число пользователей в начале и в конце фазы, между ними значение меняется линейно
+    start: float
+    end: float
+
+
+class LoadConfig(BaseModel):
+    mode: LoadMode = LoadMode.RPS
+    phases: list[LoadPhaseConfig] = [
+        LoadPhaseConfig(name="ramp-up", duration=10, start=1, end=20),
+        LoadPhaseConfig(name="steady", duration=30, start=20, end=20),
+        LoadPhaseConfig(name="spike", duration=10, start=60, end=60),
+    ]
+    # Веса операций из tools/load/operations.py
+    mix: dict[str, float] = {
+        "get_user_me": 2,
+        "get_file": 2,
+        "get_courses": 5,
+        "get_course": 5,
+        "get_exercises": 4,
+        "get_exercise": 4,
+        "create_course": 1,
+        "update_course": 1,
+        "create_exercise": 1,
+        "update_exercise": 1,
+        "login": 1,
+    }
+    # Максимум одновременных запросов в режиме rps, запуски сверх него считаются пропущенными
+    max_concurrency: int = 100
+    # Зерно выбора операций, чтобы последовательность операций повторялась между запусками
+    seed: int | None = None
+    results_file: Path = Path("./load-results/results.json")
+
+
+class UploadsConfig(BaseModel):
+    # Максимальный размер части, которой файл читается при отправке multipart запроса (байты)
+    chunk_size: int = 64 * 1024
+    # Файлы не больше этого размера кэшируются в памяти для повторных загрузок (байты)
+    cache_max_file_size: int = 16 * 1024 * 1024
+    # Максимальный суммарный размер кэша загружаемых файлов (байты)
+    cache_max_size: int = 128 * 1024 * 1024
+
 
 class TestDataConfig(BaseModel):
     image_png_file: FilePath
+    # Директория сгенерированных тестовых файлов из tools/assets.py
+    assets_dir: Path = Path("./.assets")
 
 
 class Settings(BaseSettings):
@@ -25,10 +244,27 @@ class Settings(BaseSettings):
         env_nested_delimiter=".",
     )
 
+    profile: ExecutionProfile = ExecutionProfile.FULL
     test_data: TestDataConfig
     http_client: HTTPClientConfig
+    authentication: AuthenticationConfig = AuthenticationConfig()
+    entity_pool: EntityPoolConfig = EntityPoolConfig()
+    faker: FakerConfig = FakerConfig()
+    attachments: AttachmentsConfig = AttachmentsConfig()
+    logging: LoggingConfig = LoggingConfig()
+    schema_registry: SchemaRegistryConfig = SchemaRegistryConfig()
+    benchmark: BenchmarkConfig = BenchmarkConfig()
+    latency: LatencyConfig = LatencyConfig()
+    response_time: ResponseTimeConfig = ResponseTimeConfig()
+    perf: PerfConfig = PerfConfig()
+    load: LoadConfig = LoadConfig()
+    uploads: UploadsConfig = UploadsConfig()
     allure_results_dir: DirectoryPath
 
+    @property
+    def is_lean(self) -> bool:
+        return self.profile == ExecutionProfile.LEAN
+
     @classmethod
     def initialize(cls) -> Self:  # Возвращает экземпляр класса Settings
         allure_results_dir = DirectoryPath("./allure-results")  # Создаем объект пути к папке
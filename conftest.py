@@ -1,9 +1,18 @@
 pytest_plugins = (
+    "fixtures.fakers",
     "fixtures.users",
     "fixtures.files",
     "fixtures.courses",
     "fixtures.exercises",
     "fixtures.authentication",
+    "fixtures.factory",
+    "fixtures.pool",
+    "fixtures.http",
+    "fixtures.schema",
+    "fixtures.benchmark",
+    "fixtures.latency",
+    "fixtures.perf",
+    "fixtures.markers",
 
     "fixtures.allure"
 )
\ No newline at end of file
@@ -1,7 +1,53 @@
+import logging
+
 import pytest
 
+from config import settings
+from tools.allure.attachments import attachment_buffer, BufferLogHandler
 from tools.allure.environment import create_allure_environment_file
 
+# Упал ли хотя бы один из этапов теста (setup, call, teardown)
+failed_key = pytest.StashKey[bool]()
+
+buffer_log_handler = BufferLogHandler(attachment_buffer)
+buffer_log_handler.setFormatter(logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s'))
+
+
+def pytest_configure(config: pytest.Config):
+    if not settings.attachments.failure_only:
+        return
+
+    # Логи успешных тестов не прикрепляем, для упавших они берутся из буфера
+    config.option.attach_capture = False
+    logging.getLogger().addHandler(buffer_log_handler)
+
+
+def pytest_unconfigure(config: pytest.Config):
+    logging.getLogger().removeHandler(buffer_log_handler)
+
+
+def pytest_runtest_setup(item: pytest.Item):
+    # Записи прошлого теста и session фикстур не относятся к текущему тесту
+    attachment_buffer.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+
+    if report.failed:
+        item.stash[failed_key] = True
+
+    if report.when != "teardown":
+        return
+
+    # Вложения формируются только для упавших тестов, буфер успешных просто очищается
+    if item.stash.get(failed_key, False):
+        attachment_buffer.flush()
+    else:
+        attachment_buffer.clear()
+
 
 @pytest.fixture(scope='session', autouse=True)
 def save_allure_environment_file():
@@ -0,0 +1,82 @@
+import logging
+from typing import Callable
+
+import pytest
+
+from config import settings
+from tools.benchmark import (
+    BenchmarkResultSchema,
+    BenchmarkResultsSchema,
+    get_regression,
+    load_results,
+    measure,
+    save_results
+)
+
+
+class Benchmark:
+    """
+    Замеряет функцию, сохраняет результат и сравнивает его с baseline.
+    """
+
+    def __init__(self, name: str, results: BenchmarkResultsSchema, baseline: BenchmarkResultsSchema):
+        """
+        :param name: Имя бенчмарка, по умолчанию имя теста.
+        :param results: Результаты текущего запуска.
+        :param baseline: Сохранённые результаты, с которыми сравнивается замер.
+        """
+        self.name = name
+        self.results = results
+        self.baseline = baseline
+
+    def __call__(self, func: Callable[[], object]) -> BenchmarkResultSchema:
+        # Замеряем код фреймворка при уровне логов WARNING, как в нагрузочных прогонах,
+        # чтобы вывод тысяч строк лога не попадал в замер и не засорял консоль
+        logging.disable(logging.INFO)
+        try:
+            result = measure(
+                self.name,
+                func,
+                rounds=settings.benchmark.rounds,
+                warmup=settings.benchmark.warmup,
+                min_round_time=settings.benchmark.min_round_time
+            )
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.results.root[self.name] = result
+
+        if not settings.benchmark.update_baseline:
+            if regression := get_regression(result, self.baseline, settings.benchmark.max_regression):
+                pytest.fail(regression)
+
+        return result
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline() -> BenchmarkResultsSchema:
+    return load_results(settings.benchmark.baseline_file)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = BenchmarkResultsSchema()
+    yield results  # Запускаются бенчмарки...
+    # После завершения бенчмарков сохраняем результаты и, если нужно, обновляем baseline
+    if not results.root:
+        return
+
+    save_results(settings.benchmark.results_file, results)
+    if settings.benchmark.update_baseline:
+        baseline = load_results(settings.benchmark.baseline_file)
+        baseline.root.update(results.root)
+        save_results(settings.benchmark.baseline_file, baseline)
+
+
+@pytest.fixture
+def benchmark(
+        request: pytest.FixtureRequest,
+        benchmark_results: BenchmarkResultsSchema,
+        benchmark_baseline: BenchmarkResultsSchema
+) -> Benchmark:
+    return Benchmark(name=request.node.name, results=benchmark_results, baseline=benchmark_baseline)
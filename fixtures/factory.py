@@ -0,0 +1,188 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Sequence, overload
+
+import pytest
+from pydantic import BaseModel
+
+from clients.api_client import AsyncAPIClient
+from clients.courses.courses_client import AsyncCoursesClient, get_async_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_client import AsyncExercisesClient, get_async_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_client import AsyncFilesClient, get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.public_users_client import AsyncPublicUsersClient, get_async_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture
+from tools.allure.steps import task_step
+
+
+@dataclass(frozen=True)
+class EntityType:
+    """
+    Как создать сущность по модели запроса.
+    """
+    fixture: type[BaseModel]
+    # Асинхронный клиент от имени владельца сущностей; пользователи создаются без авторизации
+    get_client: Callable[[UserFixture | None], AsyncAPIClient]
+    # Метод клиента, принимающий клиент и запрос, например AsyncCoursesClient.create_course
+    create: Callable[[Any, Any], Awaitable[BaseModel]]
+    requires_owner: bool = True
+
+
+ENTITY_TYPES: dict[type[BaseModel], EntityType] = {
+    CreateUserRequestSchema: EntityType(
+        fixture=UserFixture,
+        get_client=lambda owner: get_async_public_users_client(),
+        create=AsyncPublicUsersClient.create_user,
+        requires_owner=False
+    ),
+    CreateFileRequestSchema: EntityType(
+        fixture=FileFixture,
+        get_client=lambda owner: get_async_files_client(owner.authentication_user),
+        create=AsyncFilesClient.create_file
+    ),
+    CreateCourseRequestSchema: EntityType(
+        fixture=CourseFixture,
+        get_client=lambda owner: get_async_courses_client(owner.authentication_user),
+        create=AsyncCoursesClient.create_course
+    ),
+    CreateExerciseRequestSchema: EntityType(
+        fixture=ExerciseFixture,
+        get_client=lambda owner: get_async_exercises_client(owner.authentication_user),
+        create=AsyncExercisesClient.create_exercise
+    ),
+}
+
+
+class EntityFactory:
+    """
+    Массовое создание пользователей, файлов, курсов и заданий асинхронными клиентами.
+
+    Запросы строятся заранее в порядке следования, поэтому данные не зависят от порядка ответов,
+    а отправляются одновременно, не больше concurrency за раз. Поля, которых нет в create_many,
+    заполняются так же, как в фикстурах: файлы загружают тестовое изображение, курсы создаются от имени
+    владельца с общим файлом превью, задания — в общем курсе. Общие файл и курс создаются при первой
+    необходимости.
+    """
+
+    def __init__(self, owner: UserFixture | None = None, concurrency: int = settings.entity_pool.concurrency):
+        """
+        :param owner: Пользователь, от имени которого создаются сущности; для пользователей не нужен.
+        :param concurrency: Максимальное число одновременных запросов по умолчанию.
+        """
+        self.owner = owner
+        self.concurrency = concurrency
+
+        self.preview_file: FileFixture | None = None
+        self.course: CourseFixture | None = None
+
+    @overload
+    def create_many(
+            self, request_type: type[CreateUserRequestSchema], n: int, concurrency: int | None = None, **fields: Any
+    ) -> list[UserFixture]: ...
+
+    @overload
+    def create_many(
+            self, request_type: type[CreateFileRequestSchema], n: int, concurrency: int | None = None, **fields: Any
+    ) -> list[FileFixture]: ...
+
+    @overload
+    def create_many(
+            self, request_type: type[CreateCourseRequestSchema], n: int, concurrency: int | None = None, **fields: Any
+    ) -> list[CourseFixture]: ...
+
+    @overload
+    def create_many(
+            self, request_type: type[CreateExerciseRequestSchema], n: int, concurrency: int | None = None, **fields: Any
+    ) -> list[ExerciseFixture]: ...
+
+    def create_many(self, request_type, n, concurrency=None, **fields):
+        """
+        Создаёт n сущностей, например create_many(CreateCourseRequestSchema, n=1000, concurrency=32).
+
+        :param request_type: Модель запроса создания сущности.
+        :param n: Количество сущностей.
+        :param concurrency: Максимальное число одновременных запросов.
+        :param fields: Значения полей запроса, общие для всех сущностей.
+        :return: Фикстуры сущностей в порядке запросов.
+        """
+        return asyncio.run(self.acreate_many(request_type, n, concurrency, **fields))
+
+    async def acreate_many(
+            self,
+            request_type: type[BaseModel],
+            n: int,
+            concurrency: int | None = None,
+            **fields: Any
+    ) -> list[BaseModel]:
+        """
+        Асинхронный вариант create_many для вызова из работающего event loop.
+        """
+        fields = await self._get_default_fields(request_type, fields)
+        return await self.acreate_all([request_type(**fields) for _ in range(n)], concurrency)
+
+    async def acreate_all(self, requests: Sequence[BaseModel], concurrency: int | None = None) -> list[BaseModel]:
+        """
+        Создаёт сущности по готовым запросам одного типа, например задания в разных курсах.
+
+        :param requests: Запросы создания сущностей.
+        :param concurrency: Максимальное число одновременных запросов.
+        :return: Фикстуры сущностей в порядке запросов.
+        """
+        if not requests:
+            return []
+
+        entity_type = self._get_entity_type(type(requests[0]))
+        client = entity_type.get_client(self.owner)
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def create(request: BaseModel) -> BaseModel:
+            async with semaphore:
+                response = await entity_type.create(client, request)
+            return entity_type.fixture(request=request, response=response)
+
+        try:
+            # Общий шаг открывается до запуска задач, шаги отдельных запросов в нём не открываются
+            with task_step(f"Create {len(requests)} entities from {type(requests[0]).__name__}"):
+                return await asyncio.gather(*(create(request) for request in requests))
+        finally:
+            await client.client.aclose()
+
+    def _get_entity_type(self, request_type: type[BaseModel]) -> EntityType:
+        if (entity_type := ENTITY_TYPES.get(request_type)) is None:
+            raise ValueError(f"Unable to create entities from {request_type.__name__}")
+
+        if entity_type.requires_owner and self.owner is None:
+            raise ValueError(f"Owner is required to create entities from {request_type.__name__}")
+
+        return entity_type
+
+    async def _get_default_fields(self, request_type: type[BaseModel], fields: dict[str, Any]) -> dict[str, Any]:
+        self._get_entity_type(request_type)
+        fields = dict(fields)
+
+        if request_type is CreateFileRequestSchema:
+            fields.setdefault("upload_file", settings.test_data.image_png_file)
+        elif request_type is CreateCourseRequestSchema:
+            fields.setdefault("created_by_user_id", self.owner.response.user.id)
+            if "preview_file_id" not in fields:
+                if self.preview_file is None:
+                    [self.preview_file] = await self.acreate_many(CreateFileRequestSchema, 1)
+                fields["preview_file_id"] = self.preview_file.response.file.id
+        elif request_type is CreateExerciseRequestSchema and "course_id" not in fields:
+            if self.course is None:
+                [self.course] = await self.acreate_many(CreateCourseRequestSchema, 1)
+            fields["course_id"] = self.course.response.course.id
+
+        return fields
+
+
+@pytest.fixture
+def entity_factory(function_user: UserFixture) -> EntityFactory:
+    return EntityFactory(owner=function_user)
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from config import settings
+from tools.fakers import fake, get_test_seed
+
+# Зерно и идентификатор запуска, общие для контроллера и всех воркеров pytest-xdist
+faker_seed_key = pytest.StashKey[int]()
+faker_run_id_key = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config):
+    if workerinput := getattr(config, "workerinput", None):
+        # Воркер получает значения контроллера, а его идентификатор отделяет данные от других воркеров
+        seed, run_id, worker_id = workerinput["faker_seed"], workerinput["faker_run_id"], workerinput["workerid"]
+    else:
+        seed = settings.faker.seed if settings.faker.seed is not None else random.randrange(2 ** 32)
+        run_id, worker_id = fake.run_id, "main"
+
+    config.stash[faker_seed_key] = seed
+    config.stash[faker_run_id_key] = run_id
+    fake.set_namespace(run_id, worker_id)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["faker_seed"] = node.config.stash[faker_seed_key]
+    node.workerinput["faker_run_id"] = node.config.stash[faker_run_id_key]
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    return (
+        f"fake data: seed={config.stash[faker_seed_key]}, run_id={config.stash[faker_run_id_key]} "
+        "(repeat with FAKER.SEED)"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    # Засеиваем до фикстур теста: его данные повторяются при том же зерне запуска независимо от порядка и воркера
+    seed = get_test_seed(item.config.stash[faker_seed_key], item.nodeid)
+    fake.seed(seed)
+    item.user_properties.append(("faker_seed", seed))
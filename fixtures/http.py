@@ -0,0 +1,13 @@
+import pytest
+
+from clients.http_transport import close_http_transport
+from clients.private_http_builder import private_client_cache
+
+
+@pytest.fixture(scope='session', autouse=True)
+def close_http_connections():
+    # До начала автотестов ничего не делаем
+    yield  # Запукаются автотесты...
+    # После завершения автотестов закрываем приватные клиенты и общий пул соединений
+    private_client_cache.clear()
+    close_http_transport()
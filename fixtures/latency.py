@@ -0,0 +1,66 @@
+import pytest
+
+from config import settings
+from tools.allure.environment import add_allure_environment_properties
+from tools.latency import (
+    LatencyReportSchema,
+    format_latency_report,
+    latency_recorder,
+    save_latency_report
+)
+
+# Итоговые перцентили сессии для вывода в терминал
+latency_report_key = pytest.StashKey[LatencyReportSchema]()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item):
+    # Бенчмарки работают с транспортом в памяти, их время не должно попадать в результаты эндпоинтов
+    latency_recorder.enabled = item.get_closest_marker("benchmark") is None
+    try:
+        yield
+    finally:
+        latency_recorder.enabled = True
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # Контроллер pytest-xdist собирает гистограммы завершившихся воркеров
+    if data := getattr(node, "workeroutput", {}).get("latency"):
+        latency_recorder.merge(data)
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        # Воркер передаёт свои гистограммы контроллеру, отчёт строит только контроллер
+        config.workeroutput["latency"] = latency_recorder.to_dict()
+        return
+
+    report = latency_recorder.build_report()
+    if not report.root:
+        return
+
+    config.stash[latency_report_key] = report
+    save_latency_report(settings.latency.results_file, report)
+
+    if report_dir := config.getoption("allure_report_dir", None):
+        # Перцентили выводятся в блоке Environment, а не отдельным результатом, чтобы не менять статистику тестов
+        add_allure_environment_properties(
+            report_dir,
+            {
+                f"latency {key}": (
+                    f"count={latency.count}, p50={latency.p50_ms:.1f} ms, p95={latency.p95_ms:.1f} ms, "
+                    f"p99={latency.p99_ms:.1f} ms, max={latency.max_ms:.1f} ms"
+                )
+                for key, latency in report.root.items()
+            }
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    if (report := config.stash.get(latency_report_key, None)) is None:
+        return
+
+    terminalreporter.write_sep("-", "endpoint latency")
+    terminalreporter.write_line(format_latency_report(report))
@@ -0,0 +1,18 @@
+import pytest
+
+# Маркеры долгих тестов, которые не входят в регрессию и без выражения -m не запускаются, например pytest -m perf
+OPT_IN_MARKERS = ("perf", "large_files")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if config.option.markexpr:
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        is_opt_in = any(item.get_closest_marker(marker) for marker in OPT_IN_MARKERS)
+        (deselected if is_opt_in else selected).append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -0,0 +1,113 @@
+import logging
+from typing import Callable
+
+import allure
+import pytest
+from allure_commons.types import AttachmentType
+
+from config import settings
+from tools.logger import get_logger
+from tools.perf import (
+    PERCENTILES,
+    PerfResultSchema,
+    get_budget_breaches,
+    get_perf_result_path,
+    load_perf_result,
+    run_perf,
+    save_perf_result
+)
+
+logger = get_logger("PERF")
+
+
+class Perf:
+    """
+    Многократно выполняет вызов с параметрами маркера perf, сохраняет время итераций и проверяет перцентили.
+    """
+
+    def __init__(self, name: str, iterations: int, warmup: int, budgets: dict[str, float]):
+        """
+        :param name: Имя замера, nodeid теста.
+        :param iterations: Количество замеряемых вызовов.
+        :param warmup: Количество вызовов для прогрева.
+        :param budgets: Бюджеты перцентилей в миллисекундах, например {"p95_ms": 150}.
+        """
+        self.name = name
+        self.iterations = iterations
+        self.warmup = warmup
+        self.budgets = budgets
+
+    def __call__(self, func: Callable[[], object]) -> PerfResultSchema:
+        path = get_perf_result_path(settings.perf.results_dir, self.name)
+        previous = load_perf_result(path)
+
+        # Тысячи строк лога итераций не нужны в консоли и не должны попадать в замер
+        logging.disable(logging.INFO)
+        try:
+            result = run_perf(self.name, func, iterations=self.iterations, warmup=self.warmup)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        save_perf_result(path, result)
+
+        summary = format_perf_result(result, previous)
+        logger.info(summary)
+        allure.attach(summary, name="Perf percentiles", attachment_type=AttachmentType.TEXT)
+
+        if breaches := get_budget_breaches(result, self.budgets):
+            pytest.fail(f'Perf budget exceeded for "{self.name}": {"; ".join(breaches)}')
+
+        return result
+
+
+def format_perf_result(result: PerfResultSchema, previous: PerfResultSchema | None) -> str:
+    """
+    :param result: Результат замера.
+    :param previous: Результат прошлого запуска того же теста.
+    :return: Перцентили текущего и, если есть, прошлого запуска.
+    """
+    lines = [f"{result.iterations} iterations after {result.warmup} warmup"]
+    for key in PERCENTILES:
+        line = f"{key.removesuffix('_ms')}: {getattr(result, key):.1f} ms"
+        if previous is not None:
+            line += f" (previous run: {getattr(previous, key):.1f} ms)"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+def get_perf(item: pytest.Item) -> Perf:
+    """
+    Создаёт Perf с параметрами маркера perf теста.
+
+    :param item: Тест.
+    :return: Объект Perf, без маркера — с параметрами и бюджетами по умолчанию из settings.perf.
+    """
+    marker = item.get_closest_marker("perf")
+    budgets = {**settings.perf.budgets, **(marker.kwargs if marker else {})}
+
+    iterations = budgets.pop("iterations", settings.perf.iterations)
+    warmup = budgets.pop("warmup", settings.perf.warmup)
+    if unknown := budgets.keys() - PERCENTILES.keys():
+        raise pytest.UsageError(
+            f"Unknown perf marker arguments or PERF.BUDGETS keys in {item.nodeid}: {', '.join(sorted(unknown))}"
+        )
+
+    return Perf(name=item.nodeid, iterations=iterations, warmup=warmup, budgets=budgets)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function):
+    # Тест с маркером perf без фикстуры perf замеряется целиком: тело теста выполняется многократно
+    if pyfuncitem.get_closest_marker("perf") is None or "perf" in pyfuncitem.fixturenames:
+        return None
+
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    get_perf(pyfuncitem)(lambda: pyfuncitem.obj(**arguments))
+    return True
+
+
+@pytest.fixture
+def perf(request: pytest.FixtureRequest) -> Perf:
+    # Тест с фикстурой perf выполняется один раз, многократно выполняется только переданный в неё вызов
+    return get_perf(request.node)
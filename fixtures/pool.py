@@ -0,0 +1,206 @@
+import asyncio
+import math
+import os
+from collections import Counter, deque
+
+import pytest
+
+from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_client import FilesClient, get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.private_users_client import PrivateUsersClient, get_private_users_client
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.factory import EntityFactory
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture
+
+# Фикстуры, выдающие сущность в монопольное пользование, и тип сущности в пуле
+EXCLUSIVE_FIXTURES = {
+    "exclusive_file": "files",
+    "exclusive_course": "courses",
+    "exclusive_exercise": "exercises",
+}
+
+# Сколько сущностей каждого типа понадобится воркеру, считается при сборе тестов
+pool_demand: Counter[str] = Counter()
+
+
+class EntityPool:
+    """
+    Пул заранее созданных сущностей одного воркера.
+
+    Общие (shared) сущности выдаются всем тестам только для чтения. Монопольные (exclusive)
+    сущности выдаются одному тесту, который может их изменять или удалять. Когда заранее
+    созданные монопольные сущности заканчиваются, новые создаются по требованию.
+    """
+
+    def __init__(self, owner: UserFixture):
+        """
+        :param owner: Пользователь, от имени которого создаются все сущности пула.
+        """
+        self.owner = owner
+
+        self.files_client: FilesClient = get_files_client(owner.authentication_user)
+        self.courses_client: CoursesClient = get_courses_client(owner.authentication_user)
+        self.exercises_client: ExercisesClient = get_exercises_client(owner.authentication_user)
+
+        self.shared_file: FileFixture | None = None
+        self.shared_course: CourseFixture | None = None
+        self.shared_exercise: ExerciseFixture | None = None
+
+        self.files: deque[FileFixture] = deque()
+        self.courses: deque[CourseFixture] = deque()
+        self.exercises: deque[ExerciseFixture] = deque()
+
+    def provision(self, files: int, courses: int, exercises: int, concurrency: int) -> None:
+        """
+        Создаёт общие сущности и заданное количество монопольных сущностей каждого типа.
+
+        :param files: Количество монопольных файлов.
+        :param courses: Количество монопольных курсов.
+        :param exercises: Количество монопольных заданий.
+        :param concurrency: Максимальное число одновременных запросов.
+        """
+        asyncio.run(self._provision(files, courses, exercises, concurrency))
+
+    def lease_file(self) -> FileFixture:
+        return self.files.popleft() if self.files else self.create_file()
+
+    def lease_course(self) -> CourseFixture:
+        return self.courses.popleft() if self.courses else self.create_course()
+
+    def lease_exercise(self) -> ExerciseFixture:
+        return self.exercises.popleft() if self.exercises else self.create_exercise(self.create_course())
+
+    def create_file(self) -> FileFixture:
+        request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        response = self.files_client.create_file(request)
+        return FileFixture(request=request, response=response)
+
+    def create_course(self) -> CourseFixture:
+        request = self._build_course_request()
+        response = self.courses_client.create_course(request)
+        return CourseFixture(request=request, response=response)
+
+    def create_exercise(self, course: CourseFixture) -> ExerciseFixture:
+        request = CreateExerciseRequestSchema(course_id=course.response.course.id)
+        response = self.exercises_client.create_exercise(request)
+        return ExerciseFixture(request=request, response=response)
+
+    async def _provision(self, files: int, courses: int, exercises: int, concurrency: int) -> None:
+        factory = EntityFactory(self.owner, concurrency)
+
+        self.shared_file, *exclusive_files = await factory.acreate_many(CreateFileRequestSchema, files + 1)
+        self.files.extend(exclusive_files)
+
+        # Каждое монопольное задание живёт в своём курсе, чтобы не менять списки заданий чужих курсов
+        self.shared_course, *exclusive_courses = await factory.acreate_many(
+            CreateCourseRequestSchema,
+            courses + exercises + 1,
+            preview_file_id=self.shared_file.response.file.id
+        )
+        self.courses.extend(exclusive_courses[:courses])
+
+        self.shared_exercise, *exclusive_exercises = await factory.acreate_all([
+            CreateExerciseRequestSchema(course_id=course.response.course.id)
+            for course in [self.shared_course, *exclusive_courses[courses:]]
+        ])
+        self.exercises.extend(exclusive_exercises)
+
+    def _build_course_request(self) -> CreateCourseRequestSchema:
+        return CreateCourseRequestSchema(
+            preview_file_id=self.shared_file.response.file.id,
+            created_by_user_id=self.owner.response.user.id
+        )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]):
+    # Хук выполняется после фильтрации по маркерам, поэтому считаем только выбранные тесты
+    demand = Counter(
+        EXCLUSIVE_FIXTURES[name]
+        for item in items
+        for name in getattr(item, "fixturenames", ())
+        if name in EXCLUSIVE_FIXTURES
+    )
+
+    # Под pytest-xdist каждый воркер создаёт свою долю пула
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    pool_demand.clear()
+    pool_demand.update({kind: math.ceil(count / workers) for kind, count in demand.items()})
+
+
+@pytest.fixture(scope="session")
+def pool_user() -> UserFixture:
+    request = CreateUserRequestSchema()
+    response = get_public_users_client().create_user(request)
+    return UserFixture(request=request, response=response)
+
+
+@pytest.fixture(scope="session")
+def entity_pool(pool_user: UserFixture) -> EntityPool:
+    pool = EntityPool(owner=pool_user)
+    pool.provision(
+        files=pool_demand["files"] + settings.entity_pool.reserve,
+        courses=pool_demand["courses"] + settings.entity_pool.reserve,
+        exercises=pool_demand["exercises"] + settings.entity_pool.reserve,
+        concurrency=settings.entity_pool.concurrency
+    )
+    return pool
+
+
+@pytest.fixture(scope="session")
+def pool_files_client(entity_pool: EntityPool) -> FilesClient:
+    return entity_pool.files_client
+
+
+@pytest.fixture(scope="session")
+def pool_courses_client(entity_pool: EntityPool) -> CoursesClient:
+    return entity_pool.courses_client
+
+
+@pytest.fixture(scope="session")
+def pool_exercises_client(entity_pool: EntityPool) -> ExercisesClient:
+    return entity_pool.exercises_client
+
+
+@pytest.fixture(scope="session")
+def pool_private_users_client(pool_user: UserFixture) -> PrivateUsersClient:
+    return get_private_users_client(pool_user.authentication_user)
+
+
+@pytest.fixture(scope="session")
+def shared_file(entity_pool: EntityPool) -> FileFixture:
+    return entity_pool.shared_file
+
+
+@pytest.fixture(scope="session")
+def shared_course(entity_pool: EntityPool) -> CourseFixture:
+    return entity_pool.shared_course
+
+
+@pytest.fixture(scope="session")
+def shared_exercise(entity_pool: EntityPool) -> ExerciseFixture:
+    return entity_pool.shared_exercise
+
+
+@pytest.fixture
+def exclusive_file(entity_pool: EntityPool) -> FileFixture:
+    return entity_pool.lease_file()
+
+
+@pytest.fixture
+def exclusive_course(entity_pool: EntityPool) -> CourseFixture:
+    return entity_pool.lease_course()
+
+
+@pytest.fixture
+def exclusive_exercise(entity_pool: EntityPool) -> ExerciseFixture:
+    return entity_pool.lease_exercise()
@@ -0,0 +1,25 @@
+import pytest
+
+from tools.logger import get_logger
+from tools.schema.registry import schema_registry
+from tools.schema.validators import validator_registry
+
+logger = get_logger("SCHEMA_VALIDATORS")
+
+
+@pytest.fixture(scope='session', autouse=True)
+def load_schema_registry():
+    # Генерируем или читаем с диска JSON-схемы всех моделей до запуска автотестов
+    schema_registry.load()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def report_schema_validator_stats():
+    # До начала автотестов ничего не делаем
+    yield  # Запукаются автотесты...
+    # После завершения автотестов пишем статистику кэша скомпилированных валидаторов
+    stats = validator_registry.stats
+    logger.info(
+        "Schema validator cache: %s hits, %s misses, %.3f s compiling",
+        stats.hits, stats.misses, stats.compile_seconds
+    )
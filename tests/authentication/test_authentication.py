@@ -53,13 +53,13 @@ class TestAuthentication:
         response = authentication_client.login_api(request)
 
         # Преобразуем ответ в объект схемы
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        result = authentication_client.parse_response(response, LoginResponseSchema)
 
         # Проверка: статус-код
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверка: содержимое ответа (access_token и т. д.)
-        assert_login_response(response_data)
+        assert_login_response(result.data)
 
         # Валидация структуры JSON-ответа по JSON-схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
@@ -1,10 +1,13 @@
+import asyncio
 from http import HTTPStatus
 
 import allure
 import pytest
+from allure_commons import hookimpl, plugin_manager
 from allure_commons.types import Severity
+from httpx import Response
 
-from clients.courses.courses_client import CoursesClient
+from clients.courses.courses_client import CoursesClient, get_async_courses_client
 from clients.courses.courses_schema import (
     UpdateCourseRequestSchema,
     UpdateCourseResponseSchema,
@@ -15,6 +18,7 @@ from clients.courses.courses_schema import (
 )
 from fixtures.courses import CourseFixture
 from fixtures.files import FileFixture
+from fixtures.perf import Perf
 from fixtures.users import UserFixture
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -28,6 +32,39 @@ from tools.assertions.courses import (
 )
 from tools.assertions.schema import validate_json_schema
 
+
+class AllureStepRecorder:
+    """
+    Записывает начало и конец allure шагов, чтобы проверить, что шаги вложены друг в друга корректно.
+    """
+
+    def __init__(self):
+        # Шаги, которые закрылись не последними из открытых, то есть перемешались с другими шагами
+        self.interleaved: list[str] = []
+        self._stack: list[tuple[str, str]] = []
+
+    @hookimpl
+    def start_step(self, uuid: str, title: str):
+        self._stack.append((uuid, title))
+
+    @hookimpl
+    def stop_step(self, uuid: str):
+        if self._stack and self._stack[-1][0] == uuid:
+            self._stack.pop()
+            return
+
+        self.interleaved.extend(title for step_uuid, title in self._stack if step_uuid == uuid)
+        self._stack = [(step_uuid, title) for step_uuid, title in self._stack if step_uuid != uuid]
+
+
+@pytest.fixture
+def allure_step_recorder() -> AllureStepRecorder:
+    recorder = AllureStepRecorder()
+    plugin_manager.register(recorder)
+    yield recorder
+    plugin_manager.unregister(recorder)
+
+
 @pytest.mark.courses
 @pytest.mark.regression
 @allure.tag(AllureTag.COURSES, AllureTag.REGRESSION)
@@ -58,12 +95,51 @@ class TestCourses:
         """
         query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
         response = courses_client.get_courses_api(query)
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        result = courses_client.parse_response(response, GetCoursesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_courses_response(response_data, [function_course.response])
+        assert_get_courses_response(result.data, [function_course.response])
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.title("Get courses concurrently")
+    @allure.severity(Severity.NORMAL)
+    def test_get_courses_concurrently(
+        self,
+        function_user: UserFixture,
+        function_course: CourseFixture,
+        allure_step_recorder: AllureStepRecorder
+    ):
+        """
+        Тест получения списка курсов двумя одновременными запросами асинхронного клиента.
+
+        Проверяет:
+        - Соответствие статус-кода 200 обоих ответов
+        - Наличие ранее созданного курса в обоих ответах
+        - Шаги allure одновременных запросов не перемешиваются
+        """
+        query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
+
+        courses_client = get_async_courses_client(function_user.authentication_user)
+
+        async def get_courses() -> list[Response]:
+            try:
+                return await asyncio.gather(courses_client.get_courses_api(query), courses_client.get_courses_api(query))
+            finally:
+                await courses_client.client.aclose()
+
+        for response in asyncio.run(get_courses()):
+            result = courses_client.parse_response(response, GetCoursesResponseSchema)
+
+            assert_status_code(response.status_code, HTTPStatus.OK)
+            assert_get_courses_response(result.data, [function_course.response])
+
+        assert not allure_step_recorder.interleaved, (
+            f"Allure steps of concurrent requests are interleaved: {allure_step_recorder.interleaved}"
+        )
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -72,8 +148,8 @@ class TestCourses:
     @allure.severity(Severity.CRITICAL)
     def test_update_course(
         self,
-        courses_client: CoursesClient,
-        function_course: CourseFixture
+        pool_courses_client: CoursesClient,
+        exclusive_course: CourseFixture
     ):
     
         """
@@ -87,13 +163,13 @@ class TestCourses:
         """
         
         request = UpdateCourseRequestSchema()
-        response = courses_client.update_course_api(function_course.response.course.id, request)
-        response_data = UpdateCourseResponseSchema.model_validate_json(response.text)
+        response = pool_courses_client.update_course_api(exclusive_course.response.course.id, request)
+        result = pool_courses_client.parse_response(response, UpdateCourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_update_course_response(request, response_data)
+        assert_update_course_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.CREATE_ENTITY)
     @allure.story(AllureStory.CREATE_ENTITY)
@@ -102,9 +178,9 @@ class TestCourses:
     @allure.severity(Severity.BLOCKER)
     def test_create_course(
         self,
-        courses_client: CoursesClient,
-        function_file: FileFixture,
-        function_user: UserFixture
+        pool_courses_client: CoursesClient,
+        shared_file: FileFixture,
+        pool_user: UserFixture
     ):
         """
         Тест для проверки создания курса через API.
@@ -115,18 +191,55 @@ class TestCourses:
         - Соответствие данных ответа данным запроса
         - Валидацию JSON-схемы ответа
 
-        :param courses_client: Клиент для работы с API курсов
-        :param function_file: Фикстура файла для preview_file_id
-        :param function_user: Фикстура пользователя для created_by_user_id
+        :param pool_courses_client: Клиент для работы с API курсов
+        :param shared_file: Общий файл из пула для preview_file_id
+        :param pool_user: Пользователь пула для created_by_user_id
         """
         request = CreateCourseRequestSchema(
-            preview_file_id=function_file.response.file.id,
-            created_by_user_id=function_user.response.user.id
+            preview_file_id=shared_file.response.file.id,
+            created_by_user_id=pool_user.response.user.id
         )
-        response = courses_client.create_course_api(request)
-        response_data = CreateCourseResponseSchema.model_validate_json(response.text)
+        response = pool_courses_client.create_course_api(request)
+        result = pool_courses_client.parse_response(response, CreateCourseResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_create_course_response(request, response_data)
+        assert_create_course_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
+
+
+@pytest.mark.courses
+@allure.tag(AllureTag.COURSES, AllureTag.PERFORMANCE)
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.COURSES)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.COURSES)
+class TestCoursesPerformance:
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    @allure.title("Get courses latency")
+    @allure.severity(Severity.NORMAL)
+    @pytest.mark.perf(iterations=200, warmup=20)
+    def test_get_courses_latency(
+        self,
+        courses_client: CoursesClient,
+        function_user: UserFixture,
+        function_course: CourseFixture,
+        perf: Perf
+    ):
+        """
+        Тест проверяет время ответа GET /api/v1/courses при многократном получении списка курсов.
+
+        Проверяет:
+        - Перцентили времени ответа не превышают бюджетов settings.perf.budgets на 200 запросах после 20 запросов прогрева
+        - Соответствие статус-кода 200 каждого ответа
+        """
+        query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
+
+        def get_courses():
+            # Статус проверяется внутри замера, чтобы быстрые ответы с ошибкой не проходили по бюджету
+            response = courses_client.get_courses_api(query)
+            assert_status_code(response.status_code, HTTPStatus.OK)
+
+        perf(get_courses)
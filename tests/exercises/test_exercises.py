@@ -50,8 +50,8 @@ class TestExercises:
     @allure.severity(Severity.BLOCKER)
     def test_create_exercise(
             self,
-            function_course: CourseFixture,
-            exercises_client: ExercisesClient
+            exclusive_course: CourseFixture,
+            pool_exercises_client: ExercisesClient
     ):
         """
         Тест создания задания через POST-запрос к /api/v1/exercises.
@@ -61,13 +61,13 @@ class TestExercises:
         - Соответствие тела ответа запросу
         - Валидацию JSON schema ответа
         """
-        request = CreateExerciseRequestSchema(course_id=function_course.response.course.id)
-        response = exercises_client.create_exercise_api(request)
+        request = CreateExerciseRequestSchema(course_id=exclusive_course.response.course.id)
+        response = pool_exercises_client.create_exercise_api(request)
         assert_status_code(response.status_code, HTTPStatus.OK)
-        response_data = CreateExerciseResponseSchema.model_validate_json(response.text)
-        assert_create_exercise_response(request, response_data)
+        result = pool_exercises_client.parse_response(response, CreateExerciseResponseSchema)
+        assert_create_exercise_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -76,8 +76,8 @@ class TestExercises:
     @allure.severity(Severity.BLOCKER)
     def test_get_exercise(
             self,
-            exercises_client: ExercisesClient,
-            function_exercise: ExerciseFixture
+            pool_exercises_client: ExercisesClient,
+            shared_exercise: ExerciseFixture
     ):
         """
         Тест получения задания через GET-запрос к /api/v1/exercises/{exercise_id}.
@@ -88,13 +88,13 @@ class TestExercises:
         - Соответствие данных ответа созданному заданию
         - Валидацию JSON schema ответа
         """
-        exercise_id = function_exercise.response.exercise.id
-        response = exercises_client.get_exercise_api(exercise_id)
+        exercise_id = shared_exercise.response.exercise.id
+        response = pool_exercises_client.get_exercise_api(exercise_id)
         assert_status_code(response.status_code, HTTPStatus.OK)
-        response_data = GetExerciseResponseSchema.model_validate_json(response.text)
-        assert_get_exercise_response(response_data, function_exercise.response)
+        result = pool_exercises_client.parse_response(response, GetExerciseResponseSchema)
+        assert_get_exercise_response(result.data, shared_exercise.response)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
@@ -103,8 +103,8 @@ class TestExercises:
     @allure.severity(Severity.CRITICAL)
     def test_update_exercise(
             self,
-            exercises_client: ExercisesClient,
-            function_exercise: ExerciseFixture
+            pool_exercises_client: ExercisesClient,
+            exclusive_exercise: ExerciseFixture
     ):
         """
         Тест обновления задания через PATCH-запрос к /api/v1/exercises/{exercise_id}.
@@ -115,14 +115,14 @@ class TestExercises:
         - Соответствие данных ответа запросу на обновление
         - Валидацию JSON schema ответа
         """
-        exercise_id = function_exercise.response.exercise.id
+        exercise_id = exclusive_exercise.response.exercise.id
         request = UpdateExerciseRequestSchema()
-        response = exercises_client.update_exercise_api(exercise_id, request)
+        response = pool_exercises_client.update_exercise_api(exercise_id, request)
         assert_status_code(response.status_code, HTTPStatus.OK)
-        response_data = UpdateExerciseResponseSchema.model_validate_json(response.text)
-        assert_update_exercise_response(request, response_data)
+        result = pool_exercises_client.parse_response(response, UpdateExerciseResponseSchema)
+        assert_update_exercise_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
@@ -131,8 +131,8 @@ class TestExercises:
     @allure.severity(Severity.CRITICAL)
     def test_delete_exercise(
             self,
-            exercises_client: ExercisesClient,
-            function_exercise: ExerciseFixture
+            pool_exercises_client: ExercisesClient,
+            exclusive_exercise: ExerciseFixture
     ):
         """
         Тест удаления задания через DELETE-запрос к /api/v1/exercises/{exercise_id}.
@@ -142,16 +142,16 @@ class TestExercises:
         - Статус-код 404 и соответствующее сообщение об ошибке после попытки получения удаленного задания.
         - Валидацию JSON schema ответа на GET-запрос после удаления.
         """
-        exercise_id = function_exercise.response.exercise.id
-        delete_response = exercises_client.delete_exercise_api(exercise_id)
+        exercise_id = exclusive_exercise.response.exercise.id
+        delete_response = pool_exercises_client.delete_exercise_api(exercise_id)
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
-        get_response = exercises_client.get_exercise_api(exercise_id)
+        get_response = pool_exercises_client.get_exercise_api(exercise_id)
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
-        assert_exercise_not_found_response(get_response_data)
+        get_result = pool_exercises_client.parse_response(get_response, InternalErrorResponseSchema)
+        assert_exercise_not_found_response(get_result.data)
         
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_result)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
@@ -160,9 +160,9 @@ class TestExercises:
     @allure.severity(Severity.BLOCKER)
     def test_get_exercises(
             self,
-            exercises_client: ExercisesClient,
-            function_course: CourseFixture,
-            function_exercise: ExerciseFixture
+            pool_exercises_client: ExercisesClient,
+            shared_course: CourseFixture,
+            shared_exercise: ExerciseFixture
     ):
         """
         Тест получения списка заданий через GET-запрос к /api/v1/exercises.
@@ -172,10 +172,10 @@ class TestExercises:
         - Соответствие тела ответа списку созданных заданий
         - Валидацию JSON schema ответа
         """
-        query = GetExercisesQuerySchema(course_id=function_course.response.course.id)
-        response = exercises_client.get_exercises_api(query)
+        query = GetExercisesQuerySchema(course_id=shared_course.response.course.id)
+        response = pool_exercises_client.get_exercises_api(query)
         assert_status_code(response.status_code, HTTPStatus.OK)
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
-        assert_get_exercises_response(response_data, [function_exercise.response])
+        result = pool_exercises_client.parse_response(response, GetExercisesResponseSchema)
+        assert_get_exercises_response(result.data, [shared_exercise.response])
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
@@ -9,10 +9,12 @@ from clients.files.files_client import FilesClient
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema
 from config import settings
 from fixtures.files import FileFixture
+from tools.allure.attachments import attachment_buffer, render_body
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
+from tools.assets import AssetPattern, get_asset_file
 from tools.assertions.base import assert_status_code
 from tools.assertions.files import (
     assert_create_file_response, 
@@ -38,99 +40,171 @@ class TestFiles:
     @allure.sub_suite(AllureStory.CREATE_ENTITY)
     @allure.title("Create file")
     @allure.severity(Severity.BLOCKER)
-    def test_create_file(self, files_client: FilesClient):
+    def test_create_file(self, pool_files_client: FilesClient):
         """Тест создания файла через API."""
         request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
-        response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text)
+        response = pool_files_client.create_file_api(request)
+        result = pool_files_client.parse_response(response, CreateFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_create_file_response(request, response_data)
+        assert_create_file_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
     
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.title("Create file of size 1KB")
+    @allure.severity(Severity.NORMAL)
+    def test_create_file_of_size(self, pool_files_client: FilesClient):
+        """Тест создания файла из сгенерированного PNG, большие размеры проверяет TestLargeFiles."""
+        request = CreateFileRequestSchema(upload_file=get_asset_file(1024, pattern=AssetPattern.RANDOM))
+        response = pool_files_client.create_file_api(request)
+        result = pool_files_client.parse_response(response, CreateFileResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_create_file_response(request, result.data)
+
+        validate_json_schema(result)
+
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.title("Create file cURL command")
+    @allure.severity(Severity.MINOR)
+    def test_create_file_curl_command(self, pool_files_client: FilesClient):
+        """
+        Тест cURL команды загрузки файла, которую event hook прикрепляет к отчету упавшего теста.
+
+        Команда формируется уже после отправки запроса, поэтому проверяется, что файл выводится аргументом -F,
+        а не описанием бинарного тела.
+        """
+        if settings.is_lean or not settings.attachments.failure_only:
+            pytest.skip("cURL command is buffered only with the full profile and ATTACHMENTS.FAILURE_ONLY")
+
+        request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        response = pool_files_client.create_file_api(request)
+        assert_status_code(response.status_code, HTTPStatus.OK)
+
+        curl = render_body(next(
+            body for name, body, _ in reversed(attachment_buffer.attachments) if name == "cURL command"
+        ))
+        assert f"-F 'upload_file=@{settings.test_data.image_png_file.name};type=image/png'" in curl, curl
+        assert f"-F 'filename={request.filename}'" in curl, curl
+        assert "request body" not in curl, curl
+
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
     @allure.sub_suite(AllureStory.GET_ENTITY)
     @allure.title("Get file")
     @allure.severity(Severity.BLOCKER)
-    def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
+    def test_get_file(self, pool_files_client: FilesClient, shared_file: FileFixture):
         """Тест получения файла по ID через API."""
-        response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+        response = pool_files_client.get_file_api(shared_file.response.file.id)
+        result = pool_files_client.parse_response(response, GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_file_response(response_data, function_file.response)
+        assert_get_file_response(result.data, shared_file.response)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.title("Create file with empty filename")
     @allure.severity(Severity.NORMAL)
-    def test_create_file_with_empty_filename(self, files_client: FilesClient):
+    def test_create_file_with_empty_filename(self, pool_files_client: FilesClient):
         """Негативный тест: создание файла с пустым именем."""
         request = CreateFileRequestSchema(
             filename="",
             upload_file="./testdata/files/image.png"
         )
-        response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response = pool_files_client.create_file_api(request)
+        result = pool_files_client.parse_response(response, ValidationErrorResponseSchema)
         
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
-        assert_create_file_with_empty_filename_response(response_data)
+        assert_create_file_with_empty_filename_response(result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.title("Create file with empty directory")
     @allure.severity(Severity.NORMAL)
-    def test_create_file_with_empty_directory(self, files_client: FilesClient):
+    def test_create_file_with_empty_directory(self, pool_files_client: FilesClient):
         """Негативный тест: создание файла с пустым значением директории."""
         request = CreateFileRequestSchema(
             directory="",
             upload_file="./testdata/files/image.png"
         )
-        response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response = pool_files_client.create_file_api(request)
+        result = pool_files_client.parse_response(response, ValidationErrorResponseSchema)
         
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
-        assert_create_file_with_empty_directory_response(response_data)
+        assert_create_file_with_empty_directory_response(result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
     @allure.title("Get file with incorrect file id")
     @allure.severity(Severity.NORMAL)
-    def test_get_file_with_incorrect_file_id(self, files_client: FilesClient):
+    def test_get_file_with_incorrect_file_id(self, pool_files_client: FilesClient):
         """Негативный тест: получение файла с некорректным file_id."""
-        response = files_client.get_file_api("incorrect-file-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response = pool_files_client.get_file_api("incorrect-file-id")
+        result = pool_files_client.parse_response(response, ValidationErrorResponseSchema)
         
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
-        assert_get_file_with_incorrect_file_id_response(response_data)
+        assert_get_file_with_incorrect_file_id_response(result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
     @allure.title("Delete file")
     @allure.severity(Severity.NORMAL)
-    def test_delete_file(self, files_client: FilesClient, function_file: FileFixture):
+    def test_delete_file(self, pool_files_client: FilesClient, exclusive_file: FileFixture):
         """Тест удаления файла через API."""
-        delete_response = files_client.delete_file_api(function_file.response.file.id)
+        delete_response = pool_files_client.delete_file_api(exclusive_file.response.file.id)
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
         
-        get_response = files_client.get_file_api(function_file.response.file.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response = pool_files_client.get_file_api(exclusive_file.response.file.id)
+        get_result = pool_files_client.parse_response(get_response, InternalErrorResponseSchema)
         
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
-        assert_file_not_found_response(get_response_data)
+        assert_file_not_found_response(get_result.data)
         
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_result)
+
+
+@pytest.mark.files
+@pytest.mark.large_files
+@allure.tag(AllureTag.FILES)
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.FILES)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.FILES)
+class TestLargeFiles:
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.title("Create file of size {size}")
+    @allure.severity(Severity.NORMAL)
+    @pytest.mark.parametrize(
+        "size, pattern",
+        [(1024 ** 2, AssetPattern.RANDOM), (10 * 1024 ** 2, AssetPattern.ZEROS)],
+        ids=["1MB", "10MB"]
+    )
+    def test_create_file_of_size(self, pool_files_client: FilesClient, size: int, pattern: AssetPattern):
+        """Тест создания большого файла заданного размера из сгенерированного PNG."""
+        request = CreateFileRequestSchema(upload_file=get_asset_file(size, pattern=pattern))
+        response = pool_files_client.create_file_api(request)
+        result = pool_files_client.parse_response(response, CreateFileResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_create_file_response(request, result.data)
+
+        validate_json_schema(result)
@@ -44,19 +44,19 @@ class TestUsers:
         """
         request = CreateUserRequestSchema(email=fake.email(domain=email))
         response = public_users_client.create_user_api(request)
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)
+        result = public_users_client.parse_response(response, CreateUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_create_user_response(request, response_data)
+        assert_create_user_response(request, result.data)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
 
     @allure.tag(AllureTag.GET_ENTITY)  # Тег через enum
     @allure.story(AllureStory.GET_ENTITY)
     @allure.sub_suite(AllureStory.GET_ENTITY)
     @allure.title("Get user me")
     @allure.severity(Severity.CRITICAL)
-    def test_get_user_me(self, function_user: UserFixture, private_users_client: PrivateUsersClient):
+    def test_get_user_me(self, pool_user: UserFixture, pool_private_users_client: PrivateUsersClient):
         """
         Тест проверяет получение данных текущего пользователя через эндпоинт /api/v1/users/me.
 
@@ -65,10 +65,10 @@ class TestUsers:
         - Корректность тела ответа
         - Валидацию JSON schema ответа
         """
-        response = private_users_client.get_user_me_api()
-        response_data = GetUserResponseSchema.model_validate_json(response.text)
+        response = pool_private_users_client.get_user_me_api()
+        result = pool_private_users_client.parse_response(response, GetUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_user_response(response_data, function_user.response)
+        assert_get_user_response(result.data, pool_user.response)
         
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(result)
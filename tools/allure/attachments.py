@@ -0,0 +1,111 @@
+import logging
+from collections import deque
+from typing import Callable
+
+import allure
+from allure_commons.types import AttachmentType
+
+from config import settings
+
+
+class AttachmentBuffer:
+    """
+    Кольцевой буфер вложений и строк лога текущего теста.
+
+    Вложения хранятся лениво (функцией, возвращающей тело) и прикрепляются к allure отчету
+    только если тест упал. Для успешных тестов буфер очищается без формирования вложений.
+    """
+
+    def __init__(self, max_attachments: int, max_log_lines: int):
+        """
+        :param max_attachments: Максимальное число хранимых вложений, старые вытесняются.
+        :param max_log_lines: Максимальное число хранимых строк лога, старые вытесняются.
+        """
+        self.attachments: deque[tuple[str, Callable[[], str], AttachmentType]] = deque(maxlen=max_attachments)
+        self.log_lines: deque[str] = deque(maxlen=max_log_lines)
+
+    def attach(self, body: Callable[[], str], name: str, attachment_type: AttachmentType = AttachmentType.TEXT):
+        """
+        Добавляет ленивое вложение в буфер.
+
+        :param body: Функция, формирующая тело вложения.
+        :param name: Название вложения.
+        :param attachment_type: Тип вложения allure.
+        """
+        self.attachments.append((name, body, attachment_type))
+
+    def log(self, line: str):
+        """
+        Добавляет строку лога в буфер.
+
+        :param line: Отформатированная строка лога.
+        """
+        self.log_lines.append(line)
+
+    def flush(self):
+        """
+        Прикрепляет содержимое буфера к allure отчету и очищает буфер.
+        """
+        for name, body, attachment_type in self.attachments:
+            allure.attach(render_body(body), name, attachment_type)
+
+        if self.log_lines:
+            allure.attach("\n".join(self.log_lines), "log", AttachmentType.TEXT)
+
+        self.clear()
+
+    def clear(self):
+        """
+        Очищает буфер без прикрепления вложений.
+        """
+        self.attachments.clear()
+        self.log_lines.clear()
+
+
+class BufferLogHandler(logging.Handler):
+    """
+    Обработчик логов, складывающий строки в буфер вложений текущего теста.
+    """
+
+    def __init__(self, buffer: AttachmentBuffer):
+        super().__init__()
+        self.buffer = buffer
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.buffer.log(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def render_body(body: Callable[[], str]) -> str:
+    """
+    Формирует тело ленивого вложения, не прерывая тест при ошибке формирования.
+
+    :param body: Функция, формирующая тело вложения.
+    :return: Тело вложения или описание ошибки.
+    """
+    try:
+        return body()
+    except Exception as error:
+        return f"Unable to render attachment: {error!r}"
+
+
+def attach(body: Callable[[], str], name: str, attachment_type: AttachmentType = AttachmentType.TEXT):
+    """
+    Прикрепляет вложение к allure отчету сразу или откладывает его до падения теста.
+
+    :param body: Функция, формирующая тело вложения.
+    :param name: Название вложения.
+    :param attachment_type: Тип вложения allure.
+    """
+    if settings.attachments.failure_only:
+        attachment_buffer.attach(body, name, attachment_type)
+    else:
+        allure.attach(render_body(body), name, attachment_type)
+
+
+attachment_buffer = AttachmentBuffer(
+    max_attachments=settings.attachments.max_attachments,
+    max_log_lines=settings.attachments.max_log_lines
+)
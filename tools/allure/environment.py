@@ -1,5 +1,7 @@
 import platform
 import sys
+from pathlib import Path
+
 from config import settings
 
 
@@ -21,3 +23,29 @@ def create_allure_environment_file():
 
     with open(settings.allure_results_dir.joinpath('environment.properties'), 'w+') as file:
         file.write(properties)
+
+
+def escape_property_key(key: str) -> str:
+    """
+    Экранирует ключ для формата .properties, в котором пробел, ":" и "=" отделяют ключ от значения.
+    """
+    for char in ("\\", " ", ":", "="):
+        key = key.replace(char, f"\\{char}")
+
+    return key
+
+
+def add_allure_environment_properties(report_dir: Path | str, properties: dict[str, str]):
+    """
+    Дописывает свойства в environment.properties, они выводятся в блоке Environment отчета allure.
+
+    :param report_dir: Директория allure-results.
+    :param properties: Свойства по ключам.
+    """
+    path = Path(report_dir).joinpath('environment.properties')
+    items = [f'{escape_property_key(key)}={value}' for key, value in properties.items()]
+
+    # Файл уже может содержать свойства окружения, записанные после завершения автотестов
+    prefix = '\n' if path.exists() and path.stat().st_size else ''
+    with open(path, 'a') as file:
+        file.write(prefix + '\n'.join(items))
@@ -0,0 +1,118 @@
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+import allure
+from allure_commons.utils import func_parameters, represent
+
+from config import settings
+
+T = TypeVar("T")
+
+# Задача, которая открыла текущий асинхронный шаг; дочерние задачи наследуют значение через контекст
+_step_task: ContextVar[asyncio.Task | None] = ContextVar("step_task", default=None)
+# Число открытых асинхронных шагов в потоке: стек шагов allure общий для всех задач потока
+_open_steps = threading.local()
+
+
+class NoopStep:
+    """
+    Заглушка allure шага для профиля lean.
+
+    Как декоратор возвращает функцию без обёртки, как контекстный менеджер ничего не делает,
+    поэтому не добавляет накладных расходов к вызову.
+    """
+
+    def __call__(self, func: T) -> T:
+        return func
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None
+    ) -> None:
+        return None
+
+
+noop_step = NoopStep()
+
+
+def step(title: str) -> Any:
+    """
+    Возвращает allure шаг или его заглушку в зависимости от профиля выполнения.
+
+    Используется вместо allure.step в клиентах и проверках, как декоратор и как контекстный менеджер.
+
+    :param title: Название шага, поддерживает подстановку аргументов функции, например "{url}".
+    :return: allure.step(title) для профиля full, иначе NoopStep.
+    """
+    if settings.is_lean:
+        return noop_step
+
+    return allure.step(title)
+
+
+@contextmanager
+def task_step(title: str) -> Iterator[None]:
+    """
+    Открывает allure шаг в асинхронном коде на время до выхода из блока, включая все await внутри.
+
+    Стек шагов allure общий для потока, поэтому шаги задач, выполняемых одновременно, например через
+    asyncio.gather, перемешались бы: шаг одной задачи стал бы вложенным в шаг другой, а закрывался бы
+    не последним. Поэтому шаг открывается, только если в потоке нет открытых шагов других задач.
+    Шаги дочерних задач пропускаются, и их запросы и вложения попадают в шаг родительской задачи.
+
+    :param title: Название шага.
+    """
+    task = asyncio.current_task()
+    owner = _step_task.get()
+    open_steps = getattr(_open_steps, "count", 0)
+
+    concurrent = owner is not task if owner is not None else open_steps > 0
+    if settings.is_lean or concurrent:
+        yield
+        return
+
+    token = _step_task.set(task)
+    _open_steps.count = open_steps + 1
+    try:
+        with allure.step(title):
+            yield
+    finally:
+        _open_steps.count -= 1
+        _step_task.reset(token)
+
+
+def async_step(title: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Асинхронный аналог декоратора allure.step.
+
+    Стандартный allure.step закрывает шаг сразу после создания корутины, поэтому время и вложенные
+    шаги асинхронных методов теряются. Этот декоратор открывает шаг на всё время выполнения корутины,
+    шаги одновременно выполняемых корутин не открываются, см. task_step.
+
+    :param title: Название шага, поддерживает подстановку аргументов функции, например "{url}".
+    :return: Декоратор для асинхронной функции.
+    """
+    if settings.is_lean:
+        return noop_step
+
+    def wrapper(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def inner(*args: Any, **kwargs: Any) -> T:
+            params = func_parameters(func, *args, **kwargs)
+            arguments = [represent(argument) for argument in args]
+            with task_step(title.format(*arguments, **params)):
+                return await func(*args, **kwargs)
+
+        return inner
+
+    return wrapper
@@ -8,6 +8,7 @@ class AllureTag(str, Enum):
     EXERCISES = "EXERCISES"
     REGRESSION = "REGRESSION"
     AUTHENTICATION = "AUTHENTICATION"
+    PERFORMANCE = "PERFORMANCE"
 
     GET_ENTITY = "GET_ENTITY"
     GET_ENTITIES = "GET_ENTITIES"
@@ -1,9 +1,8 @@
-import allure
-
 from clients.authentication.authentication_schema import LoginResponseSchema
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_is_true
 
-@allure.step("Check login response")
+@step("Check login response")
 def assert_login_response(response: LoginResponseSchema):
     """
     Проверяет корректность ответа при успешной авторизации.
@@ -1,12 +1,23 @@
+import warnings
 from typing import Any, Sized
 
-import allure
+from httpx import Response
 
+from config import settings, BudgetAction
+from tools.allure.steps import step
 from tools.logger import get_logger
+from tools.routes import get_endpoint_key
+
 logger = get_logger("BASE_ASSERTIONS")
 
 
-@allure.step("Check that response status code equals to {expected}")
+class ResponseTimeWarning(UserWarning):
+    """
+    Предупреждение о превышении бюджета времени ответа в режиме warn.
+    """
+
+
+@step("Check that response status code equals to {expected}")
 def assert_status_code(actual: int, expected: int):
     """
     Проверяет, что фактический статус-код ответа соответствует ожидаемому.
@@ -15,7 +26,7 @@ def assert_status_code(actual: int, expected: int):
     :param expected: Ожидаемый статус-код.
     :raises AssertionError: Если статус-коды не совпадают.
     """
-    logger.info(f"Check that response status code equals to {expected}")  # Логируем проверку
+    logger.info("Check that response status code equals to %s", expected)  # Логируем проверку
 
     assert actual == expected, (
         f'Incorrect response status code. '
@@ -24,7 +35,7 @@ def assert_status_code(actual: int, expected: int):
     )
 
 
-@allure.step("Check that {name} equals to {expected}")
+@step("Check that {name} equals to {expected}")
 def assert_equal(actual: Any, expected: Any, name: str):
     """
     Проверяет, что фактическое значение равно ожидаемому.
@@ -34,7 +45,7 @@ def assert_equal(actual: Any, expected: Any, name: str):
     :param expected: Ожидаемое значение.
     :raises AssertionError: Если фактическое значение не равно ожидаемому.
     """
-    logger.info(f'Check that "{name}" equals to {expected}')  # Логируем проверку
+    logger.info('Check that "%s" equals to %s', name, expected)  # Логируем проверку
 
     assert actual == expected, (
         f'Incorrect value: "{name}". '
@@ -43,7 +54,7 @@ def assert_equal(actual: Any, expected: Any, name: str):
     )
 
 
-@allure.step("Check that {name} is true")
+@step("Check that {name} is true")
 def assert_is_true(actual: Any, name: str):
     """
     Проверяет, что фактическое значение является истинным.
@@ -52,7 +63,7 @@ def assert_is_true(actual: Any, name: str):
     :param actual: Фактическое значение.
     :raises AssertionError: Если фактическое значение ложно.
     """
-    logger.info(f'Check that "{name}" is true')  # Логируем проверку
+    logger.info('Check that "%s" is true', name)  # Логируем проверку
 
     assert actual, (
         f'Incorrect value: "{name}". '
@@ -69,11 +80,57 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :param expected: Ожидаемый объект.
     :raises AssertionError: Если длины не совпадают.
     """
-    with allure.step(f"Check that length of {name} equals to {len(expected)}"):
-        logger.info(f'Check that length of "{name}" equals to {len(expected)}')  # Логируем проверку
+    with step(f"Check that length of {name} equals to {len(expected)}"):
+        logger.info('Check that length of "%s" equals to %s', name, len(expected))  # Логируем проверку
 
         assert len(actual) == len(expected), (
             f'Incorrect object length: "{name}". '
             f'Expected length: {len(expected)}. '
             f'Actual length: {len(actual)}'
         )
+
+
+def assert_response_time(actual: float, budget: float, endpoint: str, action: BudgetAction = BudgetAction.FAIL):
+    """
+    Проверяет, что время ответа эндпоинта не превышает бюджет.
+
+    :param actual: Фактическое время ответа в миллисекундах.
+    :param budget: Бюджет времени ответа в миллисекундах.
+    :param endpoint: Эндпоинт, например "GET /api/v1/courses".
+    :param action: Уронить тест или только предупредить при превышении бюджета.
+    :raises AssertionError: Если время превышает бюджет и action равен fail.
+    """
+    with step(f"Check that {endpoint} responded in {actual:.1f} ms within {budget:g} ms"):
+        logger.info('Check that "%s" responded within %s ms', endpoint, budget)  # Логируем проверку
+
+        message = (
+            f'Response time budget exceeded: "{endpoint}". '
+            f'Budget: {budget:g} ms. '
+            f'Actual response time: {actual:.1f} ms'
+        )
+        if action == BudgetAction.WARN:
+            if actual > budget:
+                logger.warning(message)
+                warnings.warn(message, ResponseTimeWarning)
+            return
+
+        assert actual <= budget, message
+
+
+def assert_response_time_budget(response: Response, response_time: float | None = None):
+    """
+    Проверяет время ответа по бюджету эндпоинта из settings.response_time.
+
+    :param response: Ответ httpx, по запросу которого определяется эндпоинт.
+    :param response_time: Время ответа в секундах. По умолчанию response.elapsed, доступный после чтения ответа.
+    :raises AssertionError: Если время превышает бюджет и в настройках указан action fail.
+    """
+    endpoint = get_endpoint_key(response.request.method, response.url.path)
+    budget = settings.response_time.budgets.get(endpoint, settings.response_time.default)
+    if budget is None:
+        return
+
+    if response_time is None:
+        response_time = response.elapsed.total_seconds()
+
+    assert_response_time(response_time * 1000, budget, endpoint, settings.response_time.action)
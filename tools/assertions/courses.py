@@ -1,5 +1,3 @@
-import allure
-
 from clients.courses.courses_schema import (
     CourseSchema, 
     UpdateCourseRequestSchema, 
@@ -8,6 +6,7 @@ from clients.courses.courses_schema import (
     CreateCourseResponseSchema,
     CreateCourseRequestSchema
 )
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_length
 from tools.assertions.files import assert_file
 from tools.assertions.users import assert_user
@@ -15,7 +14,7 @@ from tools.assertions.users import assert_user
 from tools.logger import get_logger
 logger = get_logger("COURSES_ASSERTIONS")
 
-@allure.step("Check update course response")
+@step("Check update course response")
 def assert_update_course_response(
         request: UpdateCourseRequestSchema,
         response: UpdateCourseResponseSchema
@@ -34,7 +33,7 @@ def assert_update_course_response(
     assert_equal(response.course.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Check create course response")
+@step("Check create course response")
 def assert_create_course_response(
         request: CreateCourseRequestSchema,
         response: CreateCourseResponseSchema
@@ -61,7 +60,7 @@ def assert_create_course_response(
     assert_equal(response.course.created_by_user.id, request.created_by_user_id, "created_by_user_id")
 
 
-@allure.step("Check course")
+@step("Check course")
 def assert_course(actual: CourseSchema, expected: CourseSchema):
     """
     Проверяет, что фактические данные курса соответствуют ожидаемым.
@@ -83,7 +82,7 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
     assert_user(actual.created_by_user, expected.created_by_user)
 
 
-@allure.step("Check get courses response")
+@step("Check get courses response")
 def assert_get_courses_response(
         get_courses_response: GetCoursesResponseSchema,
         create_course_responses: list[CreateCourseResponseSchema]
@@ -1,12 +1,11 @@
-import allure 
-
 from clients.errors_schema import ValidationErrorSchema, ValidationErrorResponseSchema, InternalErrorResponseSchema
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_length
 
 from tools.logger import get_logger
 logger = get_logger("ERRORS_ASSERTIONS")
 
-@allure.step("Check validation error")
+@step("Check validation error")
 def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationErrorSchema):
     """
     Проверяет, что объект ошибки валидации соответствует ожидаемому значению.
@@ -23,7 +22,7 @@ def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationE
     assert_equal(actual.location, expected.location, "location")
 
 
-@allure.step("Check validation error response")
+@step("Check validation error response")
 def assert_validation_error_response(
         actual: ValidationErrorResponseSchema,
         expected: ValidationErrorResponseSchema
@@ -43,7 +42,7 @@ def assert_validation_error_response(
         assert_validation_error(actual.details[index], detail)
 
 
-@allure.step("Check internal error response")
+@step("Check internal error response")
 def assert_internal_error_response(
         actual: InternalErrorResponseSchema,
         expected: InternalErrorResponseSchema
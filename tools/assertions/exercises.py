@@ -1,5 +1,3 @@
-import allure 
-
 from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_schema import (
     ExerciseSchema,
@@ -11,13 +9,14 @@ from clients.exercises.exercises_schema import (
     GetExercisesResponseSchema,
 )
 
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal, assert_length
 from tools.assertions.errors import assert_internal_error_response
 
 from tools.logger import get_logger
 logger = get_logger("EXERCISES_ASSERTIONS")
 
-@allure.step("Check create exercise response")
+@step("Check create exercise response")
 def assert_create_exercise_response(
         request: CreateExerciseRequestSchema,
         response: CreateExerciseResponseSchema
@@ -39,7 +38,7 @@ def assert_create_exercise_response(
     assert_equal(response.exercise.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Check update exercise response")
+@step("Check update exercise response")
 def assert_update_exercise_response(
         request: UpdateExerciseRequestSchema,
         response: UpdateExerciseResponseSchema
@@ -78,7 +77,7 @@ def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     assert_equal(actual.estimated_time, expected.estimated_time, "estimated_time")
 
 
-@allure.step("Check get exercise response")
+@step("Check get exercise response")
 def assert_get_exercise_response(
         get_exercise_response: GetExerciseResponseSchema,
         create_exercise_response: CreateExerciseResponseSchema
@@ -95,7 +94,7 @@ def assert_get_exercise_response(
     assert_exercise(get_exercise_response.exercise, create_exercise_response.exercise)
 
 
-@allure.step("Check get exercises response")
+@step("Check get exercises response")
 def assert_get_exercises_response(
         get_exercises_response: GetExercisesResponseSchema,
         create_exercise_responses: list[CreateExerciseResponseSchema]
@@ -116,7 +115,7 @@ def assert_get_exercises_response(
         assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
 
 
-@allure.step("Check exercise not found response")
+@step("Check exercise not found response")
 def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     """
     Функция для проверки ошибки, если задание не найдено на сервере.
@@ -1,5 +1,3 @@
-import allure
-
 from clients.errors_schema import (
     InternalErrorResponseSchema,
     ValidationErrorResponseSchema,
@@ -15,6 +13,7 @@ from clients.files.files_schema import (
 
 from config import settings
 
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal
 
 from tools.assertions.errors import (
@@ -25,7 +24,7 @@ from tools.assertions.errors import (
 from tools.logger import get_logger
 logger = get_logger("FILES_ASSERTIONS")
 
-@allure.step("Check create file response")
+@step("Check create file response")
 def assert_create_file_response(request: CreateFileRequestSchema, response: CreateFileResponseSchema):
     """
     Проверяет, что ответ на создание файла соответствует запросу.
@@ -50,12 +49,15 @@ def assert_file_is_accessible(url: str):
     :param url: Ссылка на файл.
     :raises AssertionError: Если файл не доступен.
     """
-    import httpx
-    
-    response = httpx.get(url)
+    from httpx import Client
+
+    from clients.http_transport import get_http_transport
+
+    # Общий транспорт, чтобы при HTTP_CLIENT.TRANSPORT=fake файл отдавал фейковый сервер
+    response = Client(transport=get_http_transport()).get(url)
     assert response.status_code == 200, f"Файл недоступен по URL: {url}"\
         
-@allure.step("Check file")
+@step("Check file")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Проверяет, что фактические данные файла соответствуют ожидаемым.
@@ -71,7 +73,7 @@ def assert_file(actual: FileSchema, expected: FileSchema):
     assert_equal(actual.filename, expected.filename, "filename")
     assert_equal(actual.directory, expected.directory, "directory")
 
-@allure.step("Check get file response")  # Добавили allure шаг
+@step("Check get file response")  # Добавили allure шаг
 def assert_get_file_response(
         get_file_response: GetFileResponseSchema,
         create_file_response: CreateFileResponseSchema
@@ -86,7 +88,7 @@ def assert_get_file_response(
     logger.info("Check get file response")
     assert_file(get_file_response.file, create_file_response.file)
     
-@allure.step("Check create file with empty filename response")
+@step("Check create file with empty filename response")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым именем файла соответствует ожидаемой валидационной ошибке.
@@ -108,7 +110,7 @@ def assert_create_file_with_empty_filename_response(actual: ValidationErrorRespo
     )
     assert_validation_error_response(actual, expected)
 
-@allure.step("Check create file with empty directory response")
+@step("Check create file with empty directory response")
 def assert_create_file_with_empty_directory_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым значением директории соответствует ожидаемой валидационной ошибке.
@@ -130,7 +132,7 @@ def assert_create_file_with_empty_directory_response(actual: ValidationErrorResp
     )
     assert_validation_error_response(actual, expected)
 
-@allure.step("Check get file with incorrect file id response")
+@step("Check get file with incorrect file id response")
 def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на получение файла с некорректным file_id соответствует ожидаемой валидационной ошибке.
@@ -155,7 +157,7 @@ def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorRespo
     )
     assert_validation_error_response(actual, expected)
 
-@allure.step("Check file not found response")
+@step("Check file not found response")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Функция для проверки ошибки, если файл не найден на сервере.
@@ -1,26 +1,32 @@
 from typing import Any
 
-import allure
-from jsonschema import validate
-from jsonschema.validators import Draft202012Validator
+from jsonschema.exceptions import best_match
 
+from clients.api_client import APIResponse
+from tools.allure.steps import step
 from tools.logger import get_logger
+from tools.schema.validators import SchemaSource, validator_registry
+
 logger = get_logger("SCHEMA_ASSERTIONS")
 
 
-@allure.step("Validating JSON schema")
-def validate_json_schema(instance: Any, schema: dict) -> None:
+@step("Validating JSON schema")
+def validate_json_schema(instance: Any | APIResponse, schema: SchemaSource | None = None) -> None:
     """
     Проверяет, соответствует ли JSON-объект (instance) заданной JSON-схеме (schema).
 
-    :param instance: JSON-данные, которые нужно проверить.
-    :param schema: Ожидаемая JSON-schema.
+    Валидатор схемы компилируется один раз и берётся из кэша validator_registry.
+
+    :param instance: JSON-данные, которые нужно проверить, или разобранный ответ APIResponse.
+    Для APIResponse проверяется исходный JSON, а схемой по умолчанию служит модель ответа.
+    :param schema: Ожидаемая JSON-schema или класс pydantic модели, из которого она строится.
     :raises jsonschema.exceptions.ValidationError: Если instance не соответствует schema.
     """
     logger.info("Validating JSON schema")
 
-    validate(
-        schema=schema,
-        instance=instance,
-        format_checker=Draft202012Validator.FORMAT_CHECKER,
-    )
\ No newline at end of file
+    if isinstance(instance, APIResponse):
+        instance, schema = instance.json, schema or instance.model
+
+    # Как и jsonschema.validate, выбрасываем наиболее релевантную ошибку
+    if error := best_match(validator_registry.get_validator(schema).iter_errors(instance)):
+        raise error
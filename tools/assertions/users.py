@@ -1,5 +1,3 @@
-import allure
-
 from clients.users.users_schema import (
     CreateUserRequestSchema, 
     CreateUserResponseSchema, 
@@ -7,11 +5,12 @@ from clients.users.users_schema import (
     UserSchema
 )
 
+from tools.allure.steps import step
 from tools.assertions.base import assert_equal
 from tools.logger import get_logger 
 logger = get_logger("USERS_ASSERTIONS")
 
-@allure.step("Check create user response")
+@step("Check create user response")
 def assert_create_user_response(request: CreateUserRequestSchema, response: CreateUserResponseSchema):
     """
     Проверяет, что ответ на создание пользователя соответствует запросу.
@@ -26,7 +25,7 @@ def assert_create_user_response(request: CreateUserRequestSchema, response: Crea
     assert_equal(response.user.first_name, request.first_name, "first_name")
     assert_equal(response.user.middle_name, request.middle_name, "middle_name")
 
-@allure.step("Check user")
+@step("Check user")
 def assert_user(actual: UserSchema, expected: UserSchema):
     """
     Проверяет корректность данных пользователя.
@@ -43,7 +42,7 @@ def assert_user(actual: UserSchema, expected: UserSchema):
     assert_equal(actual.first_name, expected.first_name, "first_name")
     assert_equal(actual.middle_name, expected.middle_name, "middle_name")
 
-@allure.step("Check get user response")
+@step("Check get user response")
 def assert_get_user_response(get_user_response: GetUserResponseSchema, create_user_response: CreateUserResponseSchema):
     """
     Проверяет, что данные пользователя при создании и при запросе совпадают.
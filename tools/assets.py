@@ -0,0 +1,194 @@
+import io
+import os
+import random
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO
+
+from config import settings
+from tools.file_lock import FileLock
+from tools.uploads import upload_cache
+
+# Размер части, которой данные генерируются и записываются в файл (байты)
+CHUNK_SIZE = 1024 * 1024
+ZERO_CHUNK = bytes(CHUNK_SIZE)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Сторона генерируемого изображения в пикселях, остальной размер файла занимает служебный чанк
+PNG_IMAGE_SIDE = 16
+# Частный вспомогательный чанк: декодеры PNG пропускают его, не интерпретируя содержимое
+PNG_PADDING_CHUNK = b"paDd"
+# Максимальная длина данных чанка PNG по спецификации
+PNG_MAX_CHUNK_LENGTH = 2 ** 31 - 1
+
+
+class AssetKind(str, Enum):
+    # Валидное изображение PNG, значение используется как расширение файла
+    PNG = "png"
+    # Произвольные бинарные данные
+    BINARY = "bin"
+
+
+class AssetPattern(str, Enum):
+    # Нули: данные хорошо сжимаются, а файлы на диске создаются разреженными
+    ZEROS = "zeros"
+    # Псевдослучайные байты из зерна: данные не сжимаются
+    RANDOM = "random"
+
+
+def write_data(file: BinaryIO, size: int, pattern: AssetPattern, rng: random.Random, sparse: bool, crc: int = 0) -> int:
+    """
+    Записывает size байт по шаблону частями не больше CHUNK_SIZE.
+
+    :param file: Файл или буфер в памяти.
+    :param size: Количество байт.
+    :param pattern: Шаблон данных.
+    :param rng: Генератор псевдослучайных байт для шаблона RANDOM.
+    :param sparse: Пропускать нули через seek, чтобы файловая система не выделяла под них место.
+    :param crc: Начальное значение CRC32.
+    :return: CRC32 записанных данных, продолженный от crc.
+    """
+    while size > 0:
+        length = min(size, CHUNK_SIZE)
+        if pattern == AssetPattern.RANDOM:
+            chunk = rng.randbytes(length)
+            file.write(chunk)
+        else:
+            chunk = ZERO_CHUNK[:length]
+            if sparse:
+                file.seek(length, io.SEEK_CUR)
+            else:
+                file.write(chunk)
+
+        crc = zlib.crc32(chunk, crc)
+        size -= length
+
+    return crc
+
+
+def write_png_chunk(file: BinaryIO, chunk_type: bytes, data: bytes) -> None:
+    file.write(struct.pack(">I", len(data)) + chunk_type + data)
+    file.write(struct.pack(">I", zlib.crc32(chunk_type + data)))
+
+
+def make_png_image(pattern: AssetPattern, rng: random.Random) -> bytes:
+    """
+    Формирует чанки IHDR и IDAT изображения PNG_IMAGE_SIDE x PNG_IMAGE_SIDE в оттенках серого.
+
+    :return: Чанки в бинарном виде.
+    """
+    file = io.BytesIO()
+    write_png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", PNG_IMAGE_SIDE, PNG_IMAGE_SIDE, 8, 0, 0, 0, 0))
+
+    # Каждая строка пикселей начинается с байта фильтра 0
+    rows = io.BytesIO()
+    for _ in range(PNG_IMAGE_SIDE):
+        rows.write(b"\x00")
+        write_data(rows, PNG_IMAGE_SIDE, pattern, rng, sparse=False)
+
+    write_png_chunk(file, b"IDAT", zlib.compress(rows.getvalue()))
+    return file.getvalue()
+
+
+def write_asset(
+        file: BinaryIO,
+        size: int,
+        kind: AssetKind,
+        pattern: AssetPattern,
+        seed: int,
+        sparse: bool = False
+) -> None:
+    """
+    Записывает тестовый файл заданного размера, содержимое однозначно определяется параметрами.
+
+    PNG состоит из небольшого изображения, заполненного по шаблону, и частного служебного чанка,
+    который добивает файл до нужного размера и также заполняется по шаблону.
+
+    :param file: Файл или буфер в памяти, открытый на запись с начала.
+    :param size: Размер в байтах.
+    :param kind: Тип файла.
+    :param pattern: Шаблон данных.
+    :param seed: Зерно генератора для шаблона RANDOM.
+    :param sparse: Пропускать нули через seek, только для файлов на диске.
+    """
+    rng = random.Random(seed)
+    if kind == AssetKind.BINARY:
+        write_data(file, size, pattern, rng, sparse)
+    else:
+        image = make_png_image(pattern, rng)
+        # Размер без данных служебного чанка: сигнатура, изображение, заголовок и CRC служебного чанка, IEND
+        min_size = len(PNG_SIGNATURE) + len(image) + 12 + 12
+        padding = size - min_size
+        if not 0 <= padding <= PNG_MAX_CHUNK_LENGTH:
+            raise ValueError(
+                f"PNG asset size must be between {min_size} and {min_size + PNG_MAX_CHUNK_LENGTH} bytes, got {size}"
+            )
+
+        file.write(PNG_SIGNATURE + image + struct.pack(">I", padding) + PNG_PADDING_CHUNK)
+        crc = write_data(file, padding, pattern, rng, sparse, crc=zlib.crc32(PNG_PADDING_CHUNK))
+        file.write(struct.pack(">I", crc))
+        write_png_chunk(file, b"IEND", b"")
+
+    # Если файл заканчивается пропущенными нулями, его размер нужно выставить явно
+    file.truncate(size)
+
+
+def generate_asset(
+        size: int,
+        kind: AssetKind = AssetKind.PNG,
+        pattern: AssetPattern = AssetPattern.ZEROS,
+        seed: int = 0
+) -> bytes:
+    """
+    Возвращает содержимое тестового файла из get_asset_file.
+
+    Содержимое берётся из общего кэша загрузок, ограниченного суммарным размером UPLOADS.CACHE_MAX_SIZE,
+    файлы больше UPLOADS.CACHE_MAX_FILE_SIZE читаются с диска при каждом вызове. Для больших размеров
+    используйте get_asset_file, чтобы не держать содержимое в памяти.
+
+    :param size: Размер в байтах.
+    :param kind: Тип файла.
+    :param pattern: Шаблон данных.
+    :param seed: Зерно генератора для шаблона RANDOM.
+    :return: Содержимое файла.
+    """
+    path = get_asset_file(size, kind, pattern, seed)
+    content = upload_cache.get(path)
+    return content if content is not None else path.read_bytes()
+
+
+def get_asset_file(
+        size: int,
+        kind: AssetKind = AssetKind.PNG,
+        pattern: AssetPattern = AssetPattern.ZEROS,
+        seed: int = 0
+) -> Path:
+    """
+    Возвращает путь к тестовому файлу в settings.test_data.assets_dir, создавая его при первом обращении.
+
+    Файл с теми же параметрами переиспользуется между тестами, запусками и воркерами pytest-xdist.
+    Файлы из нулей создаются разреженными и почти не занимают места на диске.
+    Путь подходит для CreateFileRequestSchema.upload_file.
+
+    :param size: Размер в байтах.
+    :param kind: Тип файла.
+    :param pattern: Шаблон данных.
+    :param seed: Зерно генератора для шаблона RANDOM.
+    :return: Путь к файлу.
+    """
+    kind, pattern = AssetKind(kind), AssetPattern(pattern)
+    directory = settings.test_data.assets_dir
+    path = directory / f"{pattern.value}-{seed}-{size}.{kind.value}"
+
+    with FileLock(directory / f"{path.name}.lock"):
+        if not path.exists():
+            # Пишем во временный файл, чтобы прерванная генерация не оставила неполный файл
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "wb") as file:
+                write_asset(file, size, kind, pattern, seed, sparse=True)
+
+            temp_path.replace(path)
+
+    return path
@@ -0,0 +1,115 @@
+import json
+import statistics
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from pydantic import BaseModel, RootModel
+
+
+class BenchmarkResultSchema(BaseModel):
+    """
+    Результат замера одного бенчмарка. Время указано в микросекундах на один вызов.
+    """
+    name: str
+    rounds: int
+    iterations: int
+    min_us: float
+    median_us: float
+    mean_us: float
+    stdev_us: float
+
+
+class BenchmarkResultsSchema(RootModel):
+    """
+    Результаты всех бенчмарков по имени, формат файлов результатов и baseline.
+    """
+    root: dict[str, BenchmarkResultSchema] = {}
+
+
+def measure(
+        name: str,
+        func: Callable[[], object],
+        rounds: int,
+        warmup: int,
+        min_round_time: float
+) -> BenchmarkResultSchema:
+    """
+    Замеряет время вызова функции.
+
+    Число вызовов в раунде подбирается так, чтобы раунд длился не меньше min_round_time,
+    время раунда делится на число вызовов.
+
+    :param name: Имя бенчмарка.
+    :param func: Замеряемая функция без аргументов.
+    :param rounds: Количество раундов замера.
+    :param warmup: Количество вызовов для прогрева перед замером.
+    :param min_round_time: Минимальная длительность раунда в секундах.
+    :return: Результат замера.
+    """
+    for _ in range(warmup):
+        func()
+
+    timer = timeit.Timer(func)
+    iterations = 1
+    while timer.timeit(iterations) < min_round_time:
+        iterations *= 2
+
+    samples = [time * 1_000_000 / iterations for time in timer.repeat(repeat=rounds, number=iterations)]
+
+    return BenchmarkResultSchema(
+        name=name,
+        rounds=rounds,
+        iterations=iterations,
+        min_us=min(samples),
+        median_us=statistics.median(samples),
+        mean_us=statistics.mean(samples),
+        stdev_us=statistics.stdev(samples) if len(samples) > 1 else 0.0
+    )
+
+
+def get_regression(
+        result: BenchmarkResultSchema,
+        baseline: BenchmarkResultsSchema,
+        max_regression: float
+) -> str | None:
+    """
+    Сравнивает результат с baseline по медиане.
+
+    :param result: Результат замера.
+    :param baseline: Сохранённые результаты baseline.
+    :param max_regression: Допустимое относительное замедление, например 0.3 — на 30%.
+    :return: Описание регрессии или None, если регрессии нет или бенчмарка нет в baseline.
+    """
+    expected = baseline.root.get(result.name)
+    if expected is None or result.median_us <= expected.median_us * (1 + max_regression):
+        return None
+
+    return (
+        f'Benchmark "{result.name}" regressed: median {result.median_us:.2f} us, '
+        f'baseline {expected.median_us:.2f} us, allowed +{max_regression:.0%}'
+    )
+
+
+def load_results(path: Path) -> BenchmarkResultsSchema:
+    """
+    Читает результаты бенчмарков из JSON-файла.
+
+    :param path: Путь к файлу.
+    :return: Результаты или пустой набор, если файла нет.
+    """
+    if not path.exists():
+        return BenchmarkResultsSchema()
+
+    return BenchmarkResultsSchema.model_validate_json(path.read_bytes())
+
+
+def save_results(path: Path, results: BenchmarkResultsSchema) -> None:
+    """
+    Сохраняет результаты бенчмарков в JSON-файл.
+
+    :param path: Путь к файлу.
+    :param results: Результаты бенчмарков.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results.model_dump(), indent=2, sort_keys=True))
@@ -0,0 +1,598 @@
+import base64
+import hashlib
+import json
+import mimetypes
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from email import policy
+from email.parser import BytesParser
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, Callable, TypeVar
+from uuid import UUID
+
+from httpx import Request, Response, URL
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema,
+    TokenSchema
+)
+from clients.courses.courses_schema import (
+    CourseSchema,
+    CreateCourseRequestSchema,
+    CreateCourseResponseSchema,
+    GetCourseResponseSchema,
+    GetCoursesQuerySchema,
+    GetCoursesResponseSchema,
+    UpdateCourseRequestSchema,
+    UpdateCourseResponseSchema
+)
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    CreateExerciseResponseSchema,
+    ExerciseSchema,
+    GetExerciseResponseSchema,
+    GetExercisesQuerySchema,
+    GetExercisesResponseSchema,
+    UpdateExerciseRequestSchema,
+    UpdateExerciseResponseSchema
+)
+from clients.files.files_schema import CreateFileResponseSchema, FileSchema, GetFileResponseSchema
+from clients.users.users_schema import (
+    CreateUserRequestSchema,
+    CreateUserResponseSchema,
+    GetUserResponseSchema,
+    UpdateUserRequestSchema,
+    UpdateUserResponseSchema,
+    UserSchema
+)
+from config import settings
+from tools.routes import APIRoutes, compile_route
+
+T = TypeVar("T", bound=BaseModel)
+
+Handler = Callable[["FakeRequest"], Response]
+
+uuid_adapter = TypeAdapter(UUID)
+multipart_boundary_pattern = re.compile(r'boundary="?([^";]+)"?')
+
+
+class CreateFileFormSchema(BaseModel):
+    """
+    Поля формы создания файла с ограничениями, которые проверяет сервер.
+    """
+    filename: str = Field(min_length=1)
+    directory: str = Field(min_length=1)
+
+
+class FakeAPIError(Exception):
+    """
+    Ошибка обработки запроса, которая превращается в ответ {"detail": ...} с указанным статус-кодом.
+    """
+
+    def __init__(self, status_code: HTTPStatus, detail: Any):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass(frozen=True)
+class FakeFileContent:
+    """
+    Сведения о загруженном файле. Само содержимое не хранится, чтобы большие загрузки не копились в памяти.
+    """
+    size: int
+    sha256: str
+
+
+@dataclass
+class FakeRequest:
+    """
+    Запрос к фейковому серверу после маршрутизации.
+    """
+    request: Request
+    params: dict[str, str]
+    user_id: str | None = None
+    # Поля и файлы multipart/form-data, разобранные до блокировки сервера
+    fields: dict[str, str] = field(default_factory=dict)
+    files: dict[str, "FakeFileContent"] = field(default_factory=dict)
+
+
+@dataclass
+class FakeRoute:
+    method: str
+    pattern: re.Pattern
+    handler: Handler
+    private: bool = True
+
+
+@dataclass
+class FakeStorage:
+    """
+    Данные фейкового сервера в памяти процесса.
+    """
+    users: dict[str, UserSchema] = field(default_factory=dict)
+    # Индекс пользователей по email для входа и проверки уникальности без перебора всех пользователей
+    user_ids_by_email: dict[str, str] = field(default_factory=dict)
+    passwords: dict[str, str] = field(default_factory=dict)
+    files: dict[str, FileSchema] = field(default_factory=dict)
+    file_contents: dict[str, FakeFileContent] = field(default_factory=dict)
+    courses: dict[str, CourseSchema] = field(default_factory=dict)
+    exercises: dict[str, ExerciseSchema] = field(default_factory=dict)
+    # Токены ссылаются на идентификатор пользователя
+    access_tokens: dict[str, str] = field(default_factory=dict)
+    refresh_tokens: dict[str, str] = field(default_factory=dict)
+
+
+def make_json_response(model: BaseModel, status_code: HTTPStatus = HTTPStatus.OK) -> Response:
+    return Response(
+        status_code,
+        content=model.model_dump_json(by_alias=True),
+        headers={"Content-Type": "application/json"}
+    )
+
+
+def make_error_response(status_code: HTTPStatus, detail: Any) -> Response:
+    return Response(status_code, json={"detail": detail})
+
+
+def get_validation_errors(error: ValidationError, *location: str) -> list[dict]:
+    """
+    Переводит ошибки pydantic в формат ошибок валидации FastAPI.
+
+    :param error: Ошибка валидации pydantic.
+    :param location: Начало пути к полю: часть запроса (body, query или path) и, если нужно, имя параметра.
+    :return: Список ошибок с полями type, loc, msg, input и ctx.
+    """
+    errors = json.loads(error.json(include_url=False))
+    for item in errors:
+        item["loc"] = [*location, *item["loc"]]
+
+    return errors
+
+
+def make_token(user_id: str, ttl: float) -> str:
+    """
+    Формирует токен в формате JWT с полем exp, подпись не проверяется.
+
+    :param user_id: Идентификатор пользователя.
+    :param ttl: Время жизни токена в секундах.
+    :return: Токен.
+    """
+
+    def encode(value: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"sub": user_id, "exp": int(time.time() + ttl), "jti": uuid.uuid4().hex})
+    return f"{header}.{payload}.fake"
+
+
+def get_token_payload(token: str) -> dict | None:
+    try:
+        payload = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+
+
+def parse_multipart(request: Request) -> tuple[dict[str, str], dict[str, FakeFileContent]]:
+    """
+    Разбирает тело multipart/form-data запроса по границе из заголовка Content-Type.
+
+    Части не копируются: размер и sha256 файлов считаются по срезам memoryview тела запроса,
+    в памяти остаются только текстовые поля формы.
+
+    :param request: Прочитанный запрос httpx.
+    :return: Текстовые поля формы и сведения о файлах по именам полей.
+    """
+    content_type = request.headers.get("Content-Type", "")
+    boundary = multipart_boundary_pattern.search(content_type)
+    if not content_type.startswith("multipart/form-data") or boundary is None:
+        return {}, {}
+
+    content = request.content
+    body = memoryview(content)
+    delimiter = b"--" + boundary.group(1).encode()
+
+    fields: dict[str, str] = {}
+    files: dict[str, FakeFileContent] = {}
+
+    if (position := content.find(delimiter)) < 0:
+        return fields, files
+
+    position += len(delimiter)
+    # После последней границы идет "--"
+    while content[position:position + 2] == b"\r\n":
+        headers_end = content.find(b"\r\n\r\n", position)
+        part_end = content.find(b"\r\n" + delimiter, headers_end + 4)
+        if headers_end < 0 or part_end < 0:
+            break
+
+        headers = BytesParser(policy=policy.HTTP).parsebytes(content[position + 2:headers_end + 4], headersonly=True)
+        name = headers.get_param("name", header="Content-Disposition")
+        part = body[headers_end + 4:part_end]
+        if headers.get_filename() is None:
+            fields[name] = str(part, "utf-8")
+        else:
+            files[name] = FakeFileContent(size=len(part), sha256=hashlib.sha256(part).hexdigest())
+
+        position = part_end + 2 + len(delimiter)
+
+    return fields, files
+
+
+class FakeAPIServer:
+    """
+    Фейковая реализация API /api/v1/users, /files, /courses, /exercises и /authentication в памяти процесса.
+
+    Подключается к httpx клиентам через httpx.MockTransport. Тела запросов и ответов описаны теми же
+    pydantic схемами, что и клиенты, ошибки валидации повторяют формат FastAPI. Сервер потокобезопасен,
+    данные живут до конца процесса, поэтому у каждого воркера pytest-xdist свой сервер.
+    """
+
+    def __init__(self, base_url: str, access_token_ttl: float = 1800.0):
+        """
+        :param base_url: Адрес сервера, от которого строятся ссылки на загруженные файлы.
+        :param access_token_ttl: Время жизни выдаваемых access token в секундах.
+        """
+        self.base_url = URL(base_url)
+        self.access_token_ttl = access_token_ttl
+
+        self._lock = threading.RLock()
+        self._storage = FakeStorage()
+        self._routes = [
+            FakeRoute("POST", compile_route(f"{APIRoutes.AUTHENTICATION}/login"), self._login, private=False),
+            FakeRoute("POST", compile_route(f"{APIRoutes.AUTHENTICATION}/refresh"), self._refresh, private=False),
+
+            FakeRoute("POST", compile_route(f"{APIRoutes.USERS}"), self._create_user, private=False),
+            FakeRoute("GET", compile_route(f"{APIRoutes.USERS}/me"), self._get_user_me),
+            FakeRoute("GET", compile_route(f"{APIRoutes.USERS}/{{user_id}}"), self._get_user),
+            FakeRoute("PATCH", compile_route(f"{APIRoutes.USERS}/{{user_id}}"), self._update_user),
+            FakeRoute("DELETE", compile_route(f"{APIRoutes.USERS}/{{user_id}}"), self._delete_user),
+
+            FakeRoute("POST", compile_route(f"{APIRoutes.FILES}"), self._create_file),
+            FakeRoute("GET", compile_route(f"{APIRoutes.FILES}/{{file_id}}"), self._get_file),
+            FakeRoute("DELETE", compile_route(f"{APIRoutes.FILES}/{{file_id}}"), self._delete_file),
+
+            FakeRoute("GET", compile_route(f"{APIRoutes.COURSES}"), self._get_courses),
+            FakeRoute("POST", compile_route(f"{APIRoutes.COURSES}"), self._create_course),
+            FakeRoute("GET", compile_route(f"{APIRoutes.COURSES}/{{course_id}}"), self._get_course),
+            FakeRoute("PATCH", compile_route(f"{APIRoutes.COURSES}/{{course_id}}"), self._update_course),
+            FakeRoute("DELETE", compile_route(f"{APIRoutes.COURSES}/{{course_id}}"), self._delete_course),
+
+            FakeRoute("GET", compile_route(f"{APIRoutes.EXERCISES}"), self._get_exercises),
+            FakeRoute("POST", compile_route(f"{APIRoutes.EXERCISES}"), self._create_exercise),
+            FakeRoute("GET", compile_route(f"{APIRoutes.EXERCISES}/{{exercise_id}}"), self._get_exercise),
+            FakeRoute("PATCH", compile_route(f"{APIRoutes.EXERCISES}/{{exercise_id}}"), self._update_exercise),
+            FakeRoute("DELETE", compile_route(f"{APIRoutes.EXERCISES}/{{exercise_id}}"), self._delete_exercise),
+
+            FakeRoute("GET", compile_route("/static/{directory}/{filename}"), self._get_static_file, private=False),
+        ]
+
+    def handle(self, request: Request) -> Response:
+        """
+        Обрабатывает запрос, функция-обработчик для httpx.MockTransport.
+
+        :param request: Запрос httpx.
+        :return: Ответ httpx.
+        """
+        try:
+            route, params = self._match(request)
+            fake_request = FakeRequest(request=request, params=params)
+            # Разбор и хэширование загрузок идут без блокировки, чтобы большие файлы не задерживали другие запросы
+            fake_request.fields, fake_request.files = parse_multipart(request)
+
+            self._validate_path_params(params)
+
+            with self._lock:
+                if route.private:
+                    fake_request.user_id = self._authenticate(request)
+
+                return route.handler(fake_request)
+        except FakeAPIError as error:
+            return make_error_response(error.status_code, error.detail)
+
+    def clear(self) -> None:
+        """
+        Удаляет все данные сервера.
+        """
+        with self._lock:
+            self._storage = FakeStorage()
+
+    def _match(self, request: Request) -> tuple[FakeRoute, dict[str, str]]:
+        path_matched = False
+        for route in self._routes:
+            if match := route.pattern.match(request.url.path):
+                path_matched = True
+                if route.method == request.method:
+                    return route, match.groupdict()
+
+        if path_matched:
+            raise FakeAPIError(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+
+        raise FakeAPIError(HTTPStatus.NOT_FOUND, "Not Found")
+
+    @staticmethod
+    def _validate_path_params(params: dict[str, str]) -> None:
+        errors = []
+        for name, value in params.items():
+            if not name.endswith("_id"):
+                continue
+
+            try:
+                uuid_adapter.validate_python(value)
+            except ValidationError as error:
+                errors.extend(get_validation_errors(error, "path", name))
+
+        if errors:
+            raise FakeAPIError(HTTPStatus.UNPROCESSABLE_ENTITY, errors)
+
+    def _authenticate(self, request: Request) -> str:
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        user_id = self._storage.access_tokens.get(token) if scheme.lower() == "bearer" else None
+        payload = get_token_payload(token) if user_id else None
+
+        if payload is None or payload["exp"] < time.time() or user_id not in self._storage.users:
+            raise FakeAPIError(HTTPStatus.UNAUTHORIZED, "Not authenticated")
+
+        return user_id
+
+    @staticmethod
+    def _parse(data: Any, model: type[T], location: str, partial: bool = False) -> T:
+        """
+        Валидирует данные запроса схемой клиента.
+
+        У схем клиентов есть значения по умолчанию из фейкера, поэтому для полных схем отсутствующие поля
+        проверяются отдельно, а для частичных (обновление) значения по умолчанию отбрасываются.
+        """
+        try:
+            result = model.model_validate(data)
+        except ValidationError as error:
+            raise FakeAPIError(HTTPStatus.UNPROCESSABLE_ENTITY, get_validation_errors(error, location))
+
+        if not partial:
+            missing = [
+                {"type": "missing", "loc": [location, info.alias or name], "msg": "Field required", "input": data}
+                for name, info in model.model_fields.items()
+                if name not in result.model_fields_set
+            ]
+            if missing:
+                raise FakeAPIError(HTTPStatus.UNPROCESSABLE_ENTITY, missing)
+
+        return result
+
+    def _parse_body(self, request: Request, model: type[T], partial: bool = False) -> T:
+        try:
+            data = from_json(request.content)
+        except ValueError:
+            raise FakeAPIError(
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+                [{"type": "json_invalid", "loc": ["body"], "msg": "JSON decode error", "input": {}}]
+            )
+
+        return self._parse(data, model, "body", partial)
+
+    def _parse_query(self, request: Request, model: type[T]) -> T:
+        return self._parse(dict(request.url.params), model, "query")
+
+    @staticmethod
+    def _get_updates(request: BaseModel) -> dict[str, Any]:
+        # Обновляем только переданные поля, None означает «не менять»
+        return {
+            name: value
+            for name, value in request.model_dump(include=request.model_fields_set).items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _get(entities: dict[str, T], entity_id: str, name: str) -> T:
+        if (entity := entities.get(entity_id)) is None:
+            raise FakeAPIError(HTTPStatus.NOT_FOUND, f"{name} not found")
+
+        return entity
+
+    def _issue_token(self, user_id: str) -> LoginResponseSchema:
+        access_token = make_token(user_id, self.access_token_ttl)
+        refresh_token = uuid.uuid4().hex
+
+        self._storage.access_tokens[access_token] = user_id
+        self._storage.refresh_tokens[refresh_token] = user_id
+
+        return LoginResponseSchema(
+            token=TokenSchema(tokenType="bearer", accessToken=access_token, refreshToken=refresh_token)
+        )
+
+    def _login(self, fake_request: FakeRequest) -> Response:
+        request = self._parse_body(fake_request.request, LoginRequestSchema)
+
+        user_id = self._storage.user_ids_by_email.get(request.email)
+        if user_id is not None and self._storage.passwords[user_id] == request.password:
+            return make_json_response(self._issue_token(user_id))
+
+        raise FakeAPIError(HTTPStatus.UNAUTHORIZED, "Wrong email or password")
+
+    def _refresh(self, fake_request: FakeRequest) -> Response:
+        request = self._parse_body(fake_request.request, RefreshRequestSchema)
+
+        if (user_id := self._storage.refresh_tokens.pop(request.refresh_token, None)) is None:
+            raise FakeAPIError(HTTPStatus.UNAUTHORIZED, "Invalid refresh token")
+
+        return make_json_response(self._issue_token(user_id))
+
+    def _create_user(self, fake_request: FakeRequest) -> Response:
+        request = self._parse_body(fake_request.request, CreateUserRequestSchema)
+
+        if request.email in self._storage.user_ids_by_email:
+            raise FakeAPIError(HTTPStatus.CONFLICT, "User with this email already exists")
+
+        user = UserSchema(id=str(uuid.uuid4()), **request.model_dump(exclude={"password"}))
+        self._storage.users[user.id] = user
+        self._storage.user_ids_by_email[user.email] = user.id
+        self._storage.passwords[user.id] = request.password
+
+        return make_json_response(CreateUserResponseSchema(user=user))
+
+    def _get_user_me(self, fake_request: FakeRequest) -> Response:
+        user = self._get(self._storage.users, fake_request.user_id, "User")
+        return make_json_response(GetUserResponseSchema(user=user))
+
+    def _get_user(self, fake_request: FakeRequest) -> Response:
+        user = self._get(self._storage.users, fake_request.params["user_id"], "User")
+        return make_json_response(GetUserResponseSchema(user=user))
+
+    def _update_user(self, fake_request: FakeRequest) -> Response:
+        user = self._get(self._storage.users, fake_request.params["user_id"], "User")
+        request = self._parse_body(fake_request.request, UpdateUserRequestSchema, partial=True)
+
+        del self._storage.user_ids_by_email[user.email]
+        user = self._storage.users[user.id] = user.model_copy(update=self._get_updates(request))
+        self._storage.user_ids_by_email[user.email] = user.id
+        return make_json_response(UpdateUserResponseSchema(user=user))
+
+    def _delete_user(self, fake_request: FakeRequest) -> Response:
+        user = self._get(self._storage.users, fake_request.params["user_id"], "User")
+
+        del self._storage.users[user.id]
+        del self._storage.user_ids_by_email[user.email]
+        del self._storage.passwords[user.id]
+        return Response(HTTPStatus.OK)
+
+    def _create_file(self, fake_request: FakeRequest) -> Response:
+        form = self._parse(fake_request.fields, CreateFileFormSchema, "body")
+        if "upload_file" not in fake_request.files:
+            raise FakeAPIError(
+                HTTPStatus.UNPROCESSABLE_ENTITY,
+                [{"type": "missing", "loc": ["body", "upload_file"], "msg": "Field required", "input": None}]
+            )
+
+        file = FileSchema(
+            id=str(uuid.uuid4()),
+            url=str(self.base_url.join(f"/static/{form.directory}/{form.filename}")),
+            filename=form.filename,
+            directory=form.directory
+        )
+        self._storage.files[file.id] = file
+        self._storage.file_contents[file.id] = fake_request.files["upload_file"]
+
+        return make_json_response(CreateFileResponseSchema(file=file))
+
+    def _get_file(self, fake_request: FakeRequest) -> Response:
+        file = self._get(self._storage.files, fake_request.params["file_id"], "File")
+        return make_json_response(GetFileResponseSchema(file=file))
+
+    def _delete_file(self, fake_request: FakeRequest) -> Response:
+        file = self._get(self._storage.files, fake_request.params["file_id"], "File")
+
+        del self._storage.files[file.id]
+        del self._storage.file_contents[file.id]
+        return Response(HTTPStatus.OK)
+
+    def _get_static_file(self, fake_request: FakeRequest) -> Response:
+        directory, filename = fake_request.params["directory"], fake_request.params["filename"]
+
+        for file in self._storage.files.values():
+            if file.directory == directory and file.filename == filename:
+                # Содержимое не хранится: отдаем пустое тело, а размер и хэш загруженного файла — в заголовках
+                content = self._storage.file_contents[file.id]
+                content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                return Response(
+                    HTTPStatus.OK,
+                    headers={
+                        "Content-Type": content_type,
+                        "ETag": f'"{content.sha256}"',
+                        "X-Upload-Size": str(content.size)
+                    }
+                )
+
+        raise FakeAPIError(HTTPStatus.NOT_FOUND, "Not Found")
+
+    def _get_courses(self, fake_request: FakeRequest) -> Response:
+        query = self._parse_query(fake_request.request, GetCoursesQuerySchema)
+
+        courses = [course for course in self._storage.courses.values() if course.created_by_user.id == query.user_id]
+        return make_json_response(GetCoursesResponseSchema(courses=courses))
+
+    def _create_course(self, fake_request: FakeRequest) -> Response:
+        request = self._parse_body(fake_request.request, CreateCourseRequestSchema)
+
+        course = CourseSchema(
+            id=str(uuid.uuid4()),
+            preview_file=self._get(self._storage.files, request.preview_file_id, "File"),
+            created_by_user=self._get(self._storage.users, request.created_by_user_id, "User"),
+            **request.model_dump(exclude={"preview_file_id", "created_by_user_id"})
+        )
+        self._storage.courses[course.id] = course
+
+        return make_json_response(CreateCourseResponseSchema(course=course))
+
+    def _get_course(self, fake_request: FakeRequest) -> Response:
+        course = self._get(self._storage.courses, fake_request.params["course_id"], "Course")
+        return make_json_response(GetCourseResponseSchema(course=course))
+
+    def _update_course(self, fake_request: FakeRequest) -> Response:
+        course = self._get(self._storage.courses, fake_request.params["course_id"], "Course")
+        request = self._parse_body(fake_request.request, UpdateCourseRequestSchema, partial=True)
+
+        course = self._storage.courses[course.id] = course.model_copy(update=self._get_updates(request))
+        return make_json_response(UpdateCourseResponseSchema(course=course))
+
+    def _delete_course(self, fake_request: FakeRequest) -> Response:
+        course = self._get(self._storage.courses, fake_request.params["course_id"], "Course")
+
+        del self._storage.courses[course.id]
+        return Response(HTTPStatus.OK)
+
+    def _get_exercises(self, fake_request: FakeRequest) -> Response:
+        query = self._parse_query(fake_request.request, GetExercisesQuerySchema)
+
+        exercises = [
+            exercise for exercise in self._storage.exercises.values() if exercise.course_id == query.course_id
+        ]
+        return make_json_response(GetExercisesResponseSchema(exercises=exercises))
+
+    def _create_exercise(self, fake_request: FakeRequest) -> Response:
+        request = self._parse_body(fake_request.request, CreateExerciseRequestSchema)
+        self._get(self._storage.courses, request.course_id, "Course")
+
+        exercise = ExerciseSchema(id=str(uuid.uuid4()), **request.model_dump())
+        self._storage.exercises[exercise.id] = exercise
+
+        return make_json_response(CreateExerciseResponseSchema(exercise=exercise))
+
+    def _get_exercise(self, fake_request: FakeRequest) -> Response:
+        exercise = self._get(self._storage.exercises, fake_request.params["exercise_id"], "Exercise")
+        return make_json_response(GetExerciseResponseSchema(exercise=exercise))
+
+    def _update_exercise(self, fake_request: FakeRequest) -> Response:
+        exercise = self._get(self._storage.exercises, fake_request.params["exercise_id"], "Exercise")
+        request = self._parse_body(fake_request.request, UpdateExerciseRequestSchema, partial=True)
+
+        exercise = self._storage.exercises[exercise.id] = exercise.model_copy(update=self._get_updates(request))
+        return make_json_response(UpdateExerciseResponseSchema(exercise=exercise))
+
+    def _delete_exercise(self, fake_request: FakeRequest) -> Response:
+        exercise = self._get(self._storage.exercises, fake_request.params["exercise_id"], "Exercise")
+
+        del self._storage.exercises[exercise.id]
+        return Response(HTTPStatus.OK)
+
+
+@lru_cache(maxsize=None)
+def get_fake_server() -> FakeAPIServer:
+    """
+    Возвращает общий для процесса фейковый сервер, его используют и синхронные, и асинхронные клиенты.
+
+    :return: Экземпляр FakeAPIServer с адресом и временем жизни токенов из настроек.
+    """
+    return FakeAPIServer(
+        base_url=settings.http_client.client_url,
+        access_token_ttl=settings.authentication.access_token_ttl
+    )
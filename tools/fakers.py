@@ -1,21 +1,188 @@
+import itertools
+import random
+import threading
+import uuid
+import zlib
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
 from faker import Faker
 
+from config import settings
+
+
+class FakePool:
+    """
+    Пул заранее сгенерированных значений одного поля.
+
+    Первая пачка из size значений генерируется при первом обращении. Значения выбираются из пачки случайно,
+    а после каждых size выборок доля refill_ratio пачки заменяется новыми значениями в фоновом потоке,
+    так что на одно выданное значение приходится только refill_ratio вызовов Faker.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], object],
+            size: int,
+            rng: random.Random,
+            refill_ratio: float = 0.25
+    ):
+        """
+        :param factory: Функция генерации одного значения.
+        :param size: Размер пачки.
+        :param rng: Генератор для случайного выбора значений из пачки.
+        :param refill_ratio: Доля пачки, которая обновляется в фоне.
+        """
+        self.factory = factory
+        self.size = size
+        self.rng = rng
+        self.refill_ratio = refill_ratio
+
+        self._lock = threading.Lock()
+        self._values: list = []
+        self._draws = 0
+        self._refilling = False
+
+    def get(self) -> object:
+        """
+        :return: Значение из пула. Если пул пуст, пачка генерируется синхронно.
+        """
+        with self._lock:
+            if not self._values:
+                self._values = [self.factory() for _ in range(self.size)]
+
+            value = self._values[self.rng.randrange(len(self._values))]
+            self._draws += 1
+            if self._draws >= self.size and not self._refilling:
+                self._refilling = True
+                threading.Thread(target=self._refill, daemon=True).start()
+
+        return value
+
+    def _refill(self) -> None:
+        try:
+            # Генерация идет без блокировки, чтобы не задерживать выдачу значений из текущей пачки
+            values = [self.factory() for _ in range(max(int(self.size * self.refill_ratio), 1))]
+            with self._lock:
+                for value in values:
+                    self._values[self.rng.randrange(len(self._values))] = value
+
+                self._draws = 0
+        finally:
+            with self._lock:
+                self._refilling = False
+
+
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Email и имена файлов уникальны без обращений к серверу: в них добавляется ключ из идентификатора запуска,
+    идентификатора воркера pytest-xdist и счетчика процесса, поэтому они не пересекаются между воркерами
+    и повторными запусками, даже если генератор засеян одинаково.
+
+    В пакетном режиме (batch_size > 0) дорогие методы — текст, имена, пароль и email — берут значения
+    из пулов FakePool, поэтому массовое создание сущностей не упирается в Faker. Значения этих полей,
+    кроме уникального ключа email, при этом повторяются между сущностями, а данные перестают
+    воспроизводиться по зерну, см. seed.
     """
-    def __init__(self, faker: Faker):
+    def __init__(
+            self,
+            faker: Faker,
+            batch_size: int = 0,
+            refill_ratio: float = 0.25,
+            run_id: str | None = None,
+            worker_id: str = "main"
+    ):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param batch_size: Размер пулов, 0 — пакетный режим выключен.
+        :param refill_ratio: Доля пулов, которая обновляется в фоне, см. FakePool.
+        :param run_id: Идентификатор запуска, по умолчанию случайный.
+        :param worker_id: Идентификатор воркера pytest-xdist.
         """
         self.faker = faker
+        self.batch_size = batch_size
+        self.refill_ratio = refill_ratio
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+        self.worker_id = worker_id
+
+        self._lock = threading.Lock()
+        self._pools: dict[str, FakePool] = {}
+        self._counter = itertools.count(1)
+
+    def seed(self, seed: int) -> None:
+        """
+        Засеивает генератор, чтобы повторить те же данные.
+
+        Пулы пакетного режима не сбрасываются, иначе каждое засеивание генерировало бы их заново.
+        Данные в пакетном режиме зерном не воспроизводятся: пулы наполняются в фоновом потоке
+        тем же генератором Faker, и порядок его вызовов зависит от потоков.
+
+        :param seed: Зерно генератора.
+        """
+        self.faker.seed_instance(seed)
+
+    def set_namespace(self, run_id: str, worker_id: str) -> None:
+        """
+        :param run_id: Идентификатор запуска, общий для всех воркеров.
+        :param worker_id: Идентификатор воркера pytest-xdist.
+        """
+        self.run_id = run_id
+        self.worker_id = worker_id
+
+    def unique_key(self) -> str:
+        """
+        Генерирует ключ, уникальный в пределах всех запусков, например "3f2a9c1d-gw0-17".
+        :return: Уникальный ключ.
+        """
+        return f"{self.run_id}-{self.worker_id}-{next(self._counter)}"
+
+    @contextmanager
+    def batch(self, size: int) -> Iterator["Fake"]:
+        """
+        Включает пакетный режим на время блока, например, на время массового создания сущностей.
+
+        :param size: Размер пулов.
+        """
+        previous = self.batch_size
+        self.set_batch_size(size)
+        try:
+            yield self
+        finally:
+            self.set_batch_size(previous)
+
+    def set_batch_size(self, size: int) -> None:
+        """
+        :param size: Размер пулов, 0 — выключить пакетный режим. Существующие пулы сбрасываются.
+        """
+        with self._lock:
+            self.batch_size = size
+            self._pools.clear()
+
+    def _from_pool(self, name: str, factory: Callable[[], object]) -> object:
+        if not self.batch_size:
+            return factory()
+
+        with self._lock:
+            pool = self._pools.get(name)
+            if pool is None:
+                pool = self._pools[name] = FakePool(
+                    factory,
+                    size=self.batch_size,
+                    # Свой генератор выбора, чтобы выборки из пула не сдвигали последовательность Faker
+                    rng=random.Random(self.faker.random.getrandbits(64)),
+                    refill_ratio=self.refill_ratio
+                )
+
+        return pool.get()
 
     def text(self) -> str:
         """
         Генерирует случайный текст.
         :return: Случайный текст.
         """
-        return self.faker.text()
+        return self._from_pool("text", self.faker.text)
 
     def uuid4(self) -> str:
         """
@@ -30,44 +197,55 @@ class Fake:
 
         :param domain: Домен электронной почты (например, "example.com").
         Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        :return: Случайный email с уникальным ключом, например "john.smith-3f2a9c1d-gw0-17@example.org".
         """
-        return self.faker.email(domain=domain)
+        user_name = self._from_pool("user_name", self.faker.user_name)
+        domain = domain or self._from_pool("email_domain", self.faker.free_email_domain)
+        return f"{user_name}-{self.unique_key()}@{domain}"
+
+    def filename(self, extension: str) -> str:
+        """
+        Генерирует уникальное имя файла.
+
+        :param extension: Расширение файла без точки.
+        :return: Имя файла, например "3f2a9c1d-gw0-17.png".
+        """
+        return f"{self.unique_key()}.{extension}"
 
     def sentence(self) -> str:
         """
         Генерирует случайное предложение.
         :return: Случайное предложение.
         """
-        return self.faker.sentence()
+        return self._from_pool("sentence", self.faker.sentence)
 
     def password(self) -> str:
         """
         Генерирует случайный пароль.
         :return: Случайный пароль.
         """
-        return self.faker.password()
+        return self._from_pool("password", self.faker.password)
 
     def last_name(self) -> str:
         """
         Генерирует случайную фамилию.
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self._from_pool("last_name", self.faker.last_name)
 
     def first_name(self) -> str:
         """
         Генерирует случайное имя.
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self._from_pool("first_name", self.faker.first_name)
 
     def middle_name(self) -> str:
         """
         Генерирует случайное отчество/среднее имя.
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self._from_pool("middle_name", self.faker.first_name)
 
     def estimated_time(self) -> str:
         """
@@ -99,4 +277,22 @@ class Fake:
         """
         return self.integer(1, 30)
 
-fake = Fake(faker=Faker())
\ No newline at end of file
+def get_test_seed(seed: int, name: str) -> int:
+    """
+    Вычисляет зерно теста из зерна запуска, чтобы данные теста не зависели от порядка тестов и воркера.
+
+    :param seed: Зерно запуска.
+    :param name: Имя теста, например nodeid.
+    :return: Зерно теста.
+    """
+    return zlib.crc32(name.encode(), seed & 0xFFFFFFFF)
+
+
+fake = Fake(
+    faker=Faker(),
+    batch_size=settings.faker.batch_size,
+    refill_ratio=settings.faker.refill_ratio,
+    run_id=settings.faker.run_id
+)
+if settings.faker.seed is not None:
+    fake.seed(settings.faker.seed)
@@ -0,0 +1,122 @@
+import math
+
+
+def get_percentile(samples: list[float], percentile: float) -> float:
+    """
+    Возвращает перцентиль по методу ближайшего ранга.
+
+    :param samples: Отсортированные значения.
+    :param percentile: Перцентиль от 0 до 100.
+    :return: Значение перцентиля или 0, если значений нет.
+    """
+    if not samples:
+        return 0.0
+
+    return samples[max(math.ceil(percentile / 100 * len(samples)) - 1, 0)]
+
+
+class LatencyHistogram:
+    """
+    Компактная гистограмма времени ответа в духе HdrHistogram.
+
+    Значения хранятся в микросекундах в логарифмически-линейных корзинах: каждый интервал [2^k, 2^(k+1))
+    делится на 2^precision_bits равных корзин, поэтому относительная погрешность перцентилей не превышает
+    1 / 2^precision_bits, а память фиксирована и не зависит от числа замеров.
+    """
+
+    def __init__(self, precision_bits: int = 5, max_exponent: int = 36):
+        """
+        :param precision_bits: Число бит точности, 5 — погрешность около 3%.
+        :param max_exponent: Значения от 2^max_exponent мкс (около 19 часов) попадают в последнюю корзину.
+        """
+        self.precision_bits = precision_bits
+        self.max_exponent = max_exponent
+
+        self.counts = [0] * ((max_exponent - precision_bits + 2) << precision_bits)
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        :param seconds: Время ответа в секундах.
+        """
+        value = max(int(seconds * 1_000_000), 0)
+        self.counts[min(self._get_index(value), len(self.counts) - 1)] += 1
+        self.total += 1
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет замеры другой гистограммы с теми же параметрами.
+
+        :param other: Гистограмма, например, другого воркера pytest-xdist.
+        """
+        if (other.precision_bits, other.max_exponent) != (self.precision_bits, self.max_exponent):
+            raise ValueError("Unable to merge histograms with different precision")
+
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+
+        self.total += other.total
+        self.max_us = max(self.max_us, other.max_us)
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Возвращает верхнюю границу корзины, в которую попадает перцентиль.
+
+        :param percentile: Перцентиль от 0 до 100.
+        :return: Значение в миллисекундах, не больше максимального замера.
+        """
+        if not self.total:
+            return 0.0
+
+        rank = max(percentile / 100 * self.total, 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._get_upper_bound(index), self.max_us) / 1000
+
+        return self.max_us / 1000
+
+    def to_dict(self) -> dict:
+        """
+        Сериализует гистограмму, пустые корзины не сохраняются.
+
+        :return: Словарь, пригодный для JSON и передачи между воркерами pytest-xdist.
+        """
+        return {
+            "precision_bits": self.precision_bits,
+            "max_exponent": self.max_exponent,
+            "total": self.total,
+            "max_us": self.max_us,
+            "counts": {str(index): count for index, count in enumerate(self.counts) if count},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(precision_bits=data["precision_bits"], max_exponent=data["max_exponent"])
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+
+        histogram.total = data["total"]
+        histogram.max_us = data["max_us"]
+        return histogram
+
+    def _get_index(self, value: int) -> int:
+        exponent = value.bit_length() - 1
+        if exponent < self.precision_bits:
+            # Маленькие значения хранятся точно, по корзине на микросекунду
+            return value
+
+        shift = exponent - self.precision_bits
+        mantissa = (value >> shift) - (1 << self.precision_bits)
+        return ((shift + 1) << self.precision_bits) + mantissa
+
+    def _get_upper_bound(self, index: int) -> int:
+        if index < 1 << self.precision_bits:
+            return index
+
+        shift = (index >> self.precision_bits) - 1
+        mantissa = index & ((1 << self.precision_bits) - 1)
+        return (((1 << self.precision_bits) + mantissa + 1) << shift) - 1
@@ -1,22 +1,147 @@
-from httpx import Request, RequestNotRead
+import codecs
+import hashlib
+import os
+from typing import Any
 
+from httpx import AsyncByteStream, Request, RequestNotRead, SyncByteStream
+from httpx._multipart import DataField, FileField, MultipartStream
 
-def make_curl_from_request(request: Request) -> str:
+from config import settings
+from tools.uploads import UploadStream
+
+# Заголовки, которые cURL формирует сам для multipart запроса с -F
+MULTIPART_SKIP_HEADERS = {"content-type", "content-length"}
+
+
+def quote(value: str) -> str:
+    """
+    Экранирует значение для подстановки в одинарные кавычки shell.
+    """
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def describe_binary(content: bytes) -> str:
+    """
+    Возвращает краткое описание бинарных данных вместо самих данных.
+
+    :param content: Бинарные данные.
+    :return: Строка с размером и sha256 данных.
+    """
+    return f"{len(content)} bytes, sha256={hashlib.sha256(content).hexdigest()}"
+
+
+def describe_file(file: Any) -> str:
+    """
+    Возвращает описание файла multipart запроса без чтения файлового объекта.
+
+    :param file: Содержимое файла: bytes, str или файловый объект.
+    :return: Строка с размером и, для данных в памяти, sha256.
+    """
+    if isinstance(file, str):
+        file = file.encode("utf-8")
+
+    if isinstance(file, bytes):
+        return describe_binary(file)
+
+    if isinstance(file, UploadStream):
+        # Описание может формироваться уже после отправки запроса, когда файл закрыт
+        return f"{file.size} bytes"
+
+    # Файловый объект уже прочитан транспортом, поэтому берём только его размер
+    try:
+        return f"{os.fstat(file.fileno()).st_size} bytes"
+    except (AttributeError, OSError):
+        return "unknown size"
+
+
+def make_body_arguments(body: bytes, max_body_size: int) -> tuple[list[str], list[str]]:
+    """
+    Формирует аргумент cURL для тела запроса.
+
+    Текстовое тело обрезается до max_body_size байт, бинарное заменяется описанием.
+
+    :return: Кортеж из комментариев к команде и аргументов команды.
+    """
+    try:
+        # Инкрементальный декодер не падает на символе, разрезанном границей max_body_size
+        text = codecs.getincrementaldecoder("utf-8")().decode(body[:max_body_size])
+    except UnicodeDecodeError:
+        return [f"# request body: {describe_binary(body)}"], ["--data-binary '@body.bin'"]
+
+    if len(body) > max_body_size:
+        return [f"# request body truncated to {max_body_size} of {len(body)} bytes"], [f"-d {quote(text)}"]
+
+    return [], [f"-d {quote(text)}"]
+
+
+def make_multipart_arguments(stream: MultipartStream, max_body_size: int) -> tuple[list[str], list[str]]:
+    """
+    Формирует аргументы -F cURL для multipart запроса.
+
+    Содержимое файлов в команду не попадает: вместо него подставляется имя файла,
+    а размер и хэш выводятся комментарием.
+
+    :return: Кортеж из комментариев к команде и аргументов команды.
+    """
+    comments: list[str] = []
+    arguments: list[str] = []
+
+    for field in stream.fields:
+        if isinstance(field, DataField):
+            value = field.value if isinstance(field.value, str) else field.value.decode("utf-8", "replace")
+            arguments.append(f"-F {quote(f'{field.name}={value[:max_body_size]}')}")
+        elif isinstance(field, FileField):
+            content_type = field.headers.get("Content-Type")
+            part = f"{field.name}=@{field.filename}" + (f";type={content_type}" if content_type else "")
+            comments.append(f"# {field.name}: {field.filename}, {describe_file(field.file)}")
+            arguments.append(f"-F {quote(part)}")
+
+    return comments, arguments
+
+
+def make_curl_from_request(
+        request: Request,
+        max_body_size: int | None = None,
+        stream: SyncByteStream | AsyncByteStream | None = None
+) -> str:
     """
     Генерирует команду cURL из HTTP-запроса httpx.
 
+    Multipart запросы выводятся аргументами -F без содержимого файлов, бинарные тела —
+    описанием с размером и хэшем, а текстовые тела обрезаются до max_body_size байт.
+
     :param request: HTTP-запрос, из которого будет сформирована команда cURL.
+    :param max_body_size: Максимальный размер тела в команде, по умолчанию из настроек.
+    :param stream: Поток тела, сохранённый до отправки запроса. Транспорт читает тело и заменяет
+    request.stream на ByteStream, после этого multipart запрос уже не отличить от бинарного тела.
     :return: Строка с командой cURL, содержащая метод запроса, URL, заголовки и тело (если есть).
     """
+    if max_body_size is None:
+        max_body_size = settings.attachments.max_curl_body_size
+
+    stream = stream or request.stream
+    is_multipart = isinstance(stream, MultipartStream)
+
+    comments: list[str] = []
     result: list[str] = [f"curl -X '{request.method}'", f"'{request.url}'"]
 
     for header, value in request.headers.items():
+        if is_multipart and header.lower() in MULTIPART_SKIP_HEADERS:
+            continue
+
         result.append(f"-H '{header}: {value}'")
 
-    try:
-        if body := request.content:
-            result.append(f"-d '{body.decode('utf-8')}'")
-    except RequestNotRead:
-        pass
+    if is_multipart:
+        body_comments, body_arguments = make_multipart_arguments(stream, max_body_size)
+    else:
+        try:
+            body = request.content
+        except RequestNotRead:
+            body = b""
+
+        body_comments, body_arguments = make_body_arguments(body, max_body_size) if body else ([], [])
+
+    comments.extend(body_comments)
+    result.extend(body_arguments)
 
-    return " \\\n  ".join(result)
\ No newline at end of file
+    return "\n".join([*comments, " \\\n  ".join(result)])
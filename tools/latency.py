@@ -0,0 +1,113 @@
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from pydantic import BaseModel, RootModel
+
+from tools.histogram import LatencyHistogram
+from tools.routes import get_endpoint_key
+
+
+class EndpointLatencySchema(BaseModel):
+    """
+    Перцентили времени ответа эндпоинта в миллисекундах.
+    """
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class LatencyReportSchema(RootModel):
+    """
+    Время ответа по эндпоинтам ("GET /api/v1/courses/{course_id}"), формат файла результатов.
+    """
+    root: dict[str, EndpointLatencySchema] = {}
+
+
+class LatencyRecorder:
+    """
+    Собирает время ответа в гистограммы по методу и шаблону эндпоинта.
+
+    Записи приходят из event hooks синхронных клиентов и из потоков асинхронной аутентификации,
+    поэтому обновление гистограмм защищено блокировкой.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        # Запись выключается на время бенчмарков, которые обращаются к транспорту в памяти
+        self.enabled = True
+
+    def record(self, method: str, path: str, seconds: float) -> None:
+        """
+        :param method: HTTP метод запроса.
+        :param path: Путь запроса, по нему определяется шаблон эндпоинта.
+        :param seconds: Время ответа в секундах.
+        """
+        if not self.enabled:
+            return
+
+        key = get_endpoint_key(method, path)
+        with self._lock:
+            self.histograms[key].record(seconds)
+
+    def merge(self, data: dict[str, dict]) -> None:
+        """
+        Добавляет гистограммы, сериализованные методом to_dict, например, полученные от воркера pytest-xdist.
+
+        :param data: Гистограммы по эндпоинтам.
+        """
+        with self._lock:
+            for key, histogram in data.items():
+                self.histograms[key].merge(LatencyHistogram.from_dict(histogram))
+
+    def to_dict(self) -> dict[str, dict]:
+        with self._lock:
+            return {key: histogram.to_dict() for key, histogram in self.histograms.items()}
+
+    def build_report(self) -> LatencyReportSchema:
+        with self._lock:
+            return LatencyReportSchema({
+                key: EndpointLatencySchema(
+                    count=histogram.total,
+                    p50_ms=histogram.get_percentile(50),
+                    p95_ms=histogram.get_percentile(95),
+                    p99_ms=histogram.get_percentile(99),
+                    max_ms=histogram.max_us / 1000
+                )
+                for key, histogram in sorted(self.histograms.items())
+            })
+
+
+def format_latency_report(report: LatencyReportSchema) -> str:
+    """
+    Форматирует перцентили в текстовую таблицу.
+
+    :param report: Время ответа по эндпоинтам.
+    :return: Таблица по эндпоинтам.
+    """
+    lines = [f"{'Endpoint':<45} {'Count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+    for key, latency in report.root.items():
+        lines.append(
+            f"{key:<45} {latency.count:>7} {latency.p50_ms:>8.1f} {latency.p95_ms:>8.1f} "
+            f"{latency.p99_ms:>8.1f} {latency.max_ms:>8.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+def save_latency_report(path: Path, report: LatencyReportSchema) -> None:
+    """
+    Сохраняет перцентили в JSON-файл.
+
+    :param path: Путь к файлу.
+    :param report: Время ответа по эндпоинтам.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.model_dump(), indent=2))
+
+
+latency_recorder = LatencyRecorder()
@@ -0,0 +1,44 @@
+import asyncio
+
+from config import settings
+from tools.load.operations import create_load_context
+from tools.load.runner import LoadRunner
+from tools.load.stats import LoadReportSchema, format_report, save_report
+from tools.logger import get_logger
+
+logger = get_logger("LOAD")
+
+
+async def run_load() -> LoadReportSchema:
+    """
+    Готовит данные нагрузки и выполняет прогон с параметрами из settings.load.
+
+    :return: Итог прогона.
+    """
+    context = await create_load_context()
+    try:
+        runner = LoadRunner(
+            context=context,
+            mix=settings.load.mix,
+            mode=settings.load.mode,
+            phases=settings.load.phases,
+            max_concurrency=settings.load.max_concurrency,
+            seed=settings.load.seed
+        )
+        return await runner.run()
+    finally:
+        await context.close()
+
+
+def main() -> None:
+    if not settings.is_lean:
+        logger.warning("Load is generated with the full profile, set PROFILE=lean to skip steps, cURL and request logs")
+
+    report = asyncio.run(run_load())
+    save_report(settings.load.results_file, report)
+
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from httpx import Response
+
+from clients.authentication.authentication_client import AsyncAuthenticationClient, get_async_authentication_client
+from clients.authentication.authentication_schema import AuthenticationUserSchema, LoginRequestSchema
+from clients.courses.courses_client import AsyncCoursesClient, get_async_courses_client
+from clients.courses.courses_schema import (
+    CreateCourseRequestSchema,
+    GetCoursesQuerySchema,
+    UpdateCourseRequestSchema
+)
+from clients.exercises.exercises_client import AsyncExercisesClient, get_async_exercises_client
+from clients.exercises.exercises_schema import (
+    CreateExerciseRequestSchema,
+    GetExercisesQuerySchema,
+    UpdateExerciseRequestSchema
+)
+from clients.files.files_client import AsyncFilesClient, get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.private_users_client import AsyncPrivateUsersClient, get_async_private_users_client
+from clients.users.public_users_client import AsyncPublicUsersClient, get_async_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from tools.routes import APIRoutes
+
+
+@dataclass
+class LoadContext:
+    """
+    Клиенты и заранее созданные сущности, с которыми работают операции нагрузки.
+    """
+    user: AuthenticationUserSchema
+    user_id: str
+    file_id: str
+    course_id: str
+    exercise_id: str
+
+    public_users_client: AsyncPublicUsersClient
+    private_users_client: AsyncPrivateUsersClient
+    authentication_client: AsyncAuthenticationClient
+    files_client: AsyncFilesClient
+    courses_client: AsyncCoursesClient
+    exercises_client: AsyncExercisesClient
+
+    async def close(self) -> None:
+        for client in (
+                self.public_users_client,
+                self.private_users_client,
+                self.authentication_client,
+                self.files_client,
+                self.courses_client,
+                self.exercises_client
+        ):
+            await client.client.aclose()
+
+
+@dataclass(frozen=True)
+class LoadOperation:
+    """
+    Операция нагрузки: вызов типизированного клиента и эндпоинт, к которому относится её статистика.
+    """
+    name: str
+    method: str
+    route: APIRoutes
+    # Шаблон эндпоинта, как в tracker.track_coverage_httpx
+    endpoint: str
+    call: Callable[[LoadContext], Awaitable[Response]]
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.endpoint}"
+
+
+async def create_load_context() -> LoadContext:
+    """
+    Создаёт пользователя нагрузки и по одному файлу, курсу и заданию, к которым обращаются операции чтения.
+
+    :return: Контекст с клиентами от имени созданного пользователя.
+    """
+    public_users_client = get_async_public_users_client()
+
+    create_user_request = CreateUserRequestSchema()
+    create_user_response = await public_users_client.create_user(create_user_request)
+    user = AuthenticationUserSchema(email=create_user_request.email, password=create_user_request.password)
+
+    files_client = get_async_files_client(user)
+    courses_client = get_async_courses_client(user)
+    exercises_client = get_async_exercises_client(user)
+
+    create_file_response = await files_client.create_file(
+        CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+    )
+    create_course_response = await courses_client.create_course(
+        CreateCourseRequestSchema(
+            preview_file_id=create_file_response.file.id,
+            created_by_user_id=create_user_response.user.id
+        )
+    )
+    create_exercise_response = await exercises_client.create_exercise(
+        CreateExerciseRequestSchema(course_id=create_course_response.course.id)
+    )
+
+    return LoadContext(
+        user=user,
+        user_id=create_user_response.user.id,
+        file_id=create_file_response.file.id,
+        course_id=create_course_response.course.id,
+        exercise_id=create_exercise_response.exercise.id,
+        public_users_client=public_users_client,
+        private_users_client=get_async_private_users_client(user),
+        authentication_client=get_async_authentication_client(),
+        files_client=files_client,
+        courses_client=courses_client,
+        exercises_client=exercises_client
+    )
+
+
+OPERATIONS: dict[str, LoadOperation] = {
+    operation.name: operation
+    for operation in (
+        LoadOperation(
+            name="login",
+            method="POST",
+            route=APIRoutes.AUTHENTICATION,
+            endpoint=f"{APIRoutes.AUTHENTICATION}/login",
+            call=lambda context: context.authentication_client.login_api(
+                LoginRequestSchema(email=context.user.email, password=context.user.password)
+            )
+        ),
+        LoadOperation(
+            name="create_user",
+            method="POST",
+            route=APIRoutes.USERS,
+            endpoint=f"{APIRoutes.USERS}",
+            call=lambda context: context.public_users_client.create_user_api(CreateUserRequestSchema())
+        ),
+        LoadOperation(
+            name="get_user_me",
+            method="GET",
+            route=APIRoutes.USERS,
+            endpoint=f"{APIRoutes.USERS}/me",
+            call=lambda context: context.private_users_client.get_user_me_api()
+        ),
+        LoadOperation(
+            name="get_user",
+            method="GET",
+            route=APIRoutes.USERS,
+            endpoint=f"{APIRoutes.USERS}/{{user_id}}",
+            call=lambda context: context.private_users_client.get_user_api(context.user_id)
+        ),
+        LoadOperation(
+            name="create_file",
+            method="POST",
+            route=APIRoutes.FILES,
+            endpoint=f"{APIRoutes.FILES}",
+            call=lambda context: context.files_client.create_file_api(
+                CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+            )
+        ),
+        LoadOperation(
+            name="get_file",
+            method="GET",
+            route=APIRoutes.FILES,
+            endpoint=f"{APIRoutes.FILES}/{{file_id}}",
+            call=lambda context: context.files_client.get_file_api(context.file_id)
+        ),
+        LoadOperation(
+            name="get_courses",
+            method="GET",
+            route=APIRoutes.COURSES,
+            endpoint=f"{APIRoutes.COURSES}",
+            call=lambda context: context.courses_client.get_courses_api(
+                GetCoursesQuerySchema(user_id=context.user_id)
+            )
+        ),
+        LoadOperation(
+            name="create_course",
+            method="POST",
+            route=APIRoutes.COURSES,
+            endpoint=f"{APIRoutes.COURSES}",
+            call=lambda context: context.courses_client.create_course_api(
+                CreateCourseRequestSchema(preview_file_id=context.file_id, created_by_user_id=context.user_id)
+            )
+        ),
+        LoadOperation(
+            name="get_course",
+            method="GET",
+            route=APIRoutes.COURSES,
+            endpoint=f"{APIRoutes.COURSES}/{{course_id}}",
+            call=lambda context: context.courses_client.get_course_api(context.course_id)
+        ),
+        LoadOperation(
+            name="update_course",
+            method="PATCH",
+            route=APIRoutes.COURSES,
+            endpoint=f"{APIRoutes.COURSES}/{{course_id}}",
+            call=lambda context: context.courses_client.update_course_api(
+                context.course_id, UpdateCourseRequestSchema()
+            )
+        ),
+        LoadOperation(
+            name="get_exercises",
+            method="GET",
+            route=APIRoutes.EXERCISES,
+            endpoint=f"{APIRoutes.EXERCISES}",
+            call=lambda context: context.exercises_client.get_exercises_api(
+                GetExercisesQuerySchema(course_id=context.course_id)
+            )
+        ),
+        LoadOperation(
+            name="create_exercise",
+            method="POST",
+            route=APIRoutes.EXERCISES,
+            endpoint=f"{APIRoutes.EXERCISES}",
+            call=lambda context: context.exercises_client.create_exercise_api(
+                CreateExerciseRequestSchema(course_id=context.course_id)
+            )
+        ),
+        LoadOperation(
+            name="get_exercise",
+            method="GET",
+            route=APIRoutes.EXERCISES,
+            endpoint=f"{APIRoutes.EXERCISES}/{{exercise_id}}",
+            call=lambda context: context.exercises_client.get_exercise_api(context.exercise_id)
+        ),
+        LoadOperation(
+            name="update_exercise",
+            method="PATCH",
+            route=APIRoutes.EXERCISES,
+            endpoint=f"{APIRoutes.EXERCISES}/{{exercise_id}}",
+            call=lambda context: context.exercises_client.update_exercise_api(
+                context.exercise_id, UpdateExerciseRequestSchema()
+            )
+        ),
+    )
+}
@@ -0,0 +1,157 @@
+import asyncio
+import random
+import time
+
+from config import LoadMode, LoadPhaseConfig
+from tools.load.operations import OPERATIONS, LoadContext, LoadOperation
+from tools.load.stats import LoadReportSchema, LoadStats
+from tools.logger import get_logger
+
+logger = get_logger("LOAD_RUNNER")
+
+# Как часто пересчитывается целевое число пользователей и проверяется нулевое RPS (секунды)
+TICK = 0.1
+
+
+class LoadRunner:
+    """
+    Генератор нагрузки поверх асинхронных типизированных клиентов.
+
+    В режиме rps операции запускаются с частотой, заданной фазами, и не ждут завершения предыдущих,
+    поэтому медленные ответы не снижают нагрузку. В режиме concurrency фазы задают число пользователей,
+    каждый из которых выполняет операции одну за другой.
+    """
+
+    def __init__(
+            self,
+            context: LoadContext,
+            mix: dict[str, float],
+            mode: LoadMode,
+            phases: list[LoadPhaseConfig],
+            max_concurrency: int,
+            seed: int | None = None
+    ):
+        """
+        :param context: Клиенты и сущности, с которыми работают операции.
+        :param mix: Веса операций по именам из OPERATIONS.
+        :param mode: Режим нагрузки.
+        :param phases: Фазы нагрузки, выполняются по порядку.
+        :param max_concurrency: Максимум одновременных операций в режиме rps.
+        :param seed: Зерно выбора операций.
+        """
+        if unknown := mix.keys() - OPERATIONS.keys():
+            raise ValueError(f"Unknown load operations: {', '.join(sorted(unknown))}")
+
+        self.context = context
+        self.mode = mode
+        self.phases = phases
+        self.max_concurrency = max_concurrency
+        self.stats = LoadStats()
+
+        self._operations = [OPERATIONS[name] for name in mix]
+        self._weights = list(mix.values())
+        self._random = random.Random(seed)
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def run(self) -> LoadReportSchema:
+        """
+        Выполняет все фазы нагрузки и дожидается завершения запущенных операций.
+
+        :return: Итог прогона.
+        """
+        started_at = time.perf_counter()
+        for phase in self.phases:
+            logger.info(
+                'Load phase "%s": %s s, %s from %s to %s',
+                phase.name, phase.duration, self.mode.value, phase.start, phase.end
+            )
+            if self.mode == LoadMode.RPS:
+                await self._run_rps_phase(phase)
+            else:
+                await self._run_concurrency_phase(phase)
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+
+        return self.stats.build_report(self.mode.value, time.perf_counter() - started_at)
+
+    async def _execute(self, operation: LoadOperation) -> None:
+        error = None
+        started_at = time.perf_counter()
+        try:
+            response = await operation.call(self.context)
+            if response.is_error:
+                error = f"HTTP {response.status_code}"
+        except Exception as exception:
+            # Любая ошибка операции (сети, валидации ответа, бюджета времени ответа) учитывается по типу,
+            # чтобы одна упавшая задача не терялась молча в _in_flight
+            error = type(exception).__name__
+
+        self.stats.record(operation, time.perf_counter() - started_at, error)
+
+    def _choose_operation(self) -> LoadOperation:
+        return self._random.choices(self._operations, weights=self._weights)[0]
+
+    async def _run_rps_phase(self, phase: LoadPhaseConfig) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        deadline = started_at + phase.duration
+        next_start = started_at
+
+        while next_start < deadline:
+            await asyncio.sleep(max(next_start - loop.time(), 0))
+            # Отставшее расписание не догоняем после конца фазы
+            if loop.time() >= deadline:
+                break
+
+            rps = get_phase_target(phase, next_start - started_at)
+            if rps <= 0:
+                next_start += TICK
+                continue
+
+            if len(self._in_flight) >= self.max_concurrency:
+                self.stats.dropped += 1
+            else:
+                task = asyncio.create_task(self._execute(self._choose_operation()))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+            # Время следующего запуска считаем от расписания, а не от текущего момента, чтобы не копить отставание
+            next_start += 1 / rps
+
+        # Фаза длится ровно duration, даже если следующий запуск пришелся бы на время после ее конца
+        await asyncio.sleep(max(deadline - loop.time(), 0))
+
+    async def _run_concurrency_phase(self, phase: LoadPhaseConfig) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        users: dict[int, asyncio.Task] = {}
+        target = 0
+
+        async def user(index: int) -> None:
+            while index < target and loop.time() - started_at < phase.duration:
+                await self._execute(self._choose_operation())
+
+        while (elapsed := loop.time() - started_at) < phase.duration:
+            target = round(get_phase_target(phase, elapsed))
+            for index in range(target):
+                if index not in users or users[index].done():
+                    users[index] = asyncio.create_task(user(index))
+
+            await asyncio.sleep(TICK)
+
+        await asyncio.gather(*users.values())
+
+
+def get_phase_target(phase: LoadPhaseConfig, elapsed: float) -> float:
+    """
+    Возвращает целевое значение фазы в момент времени, линейно между start и end.
+
+    :param phase: Фаза нагрузки.
+    :param elapsed: Время от начала фазы в секундах.
+    :return: Целевое RPS или число пользователей.
+    """
+    if phase.duration <= 0:
+        return phase.end
+
+    return phase.start + (phase.end - phase.start) * min(elapsed / phase.duration, 1.0)
@@ -0,0 +1,143 @@
+import json
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from tools.histogram import LatencyHistogram
+from tools.load.operations import LoadOperation
+
+
+class LoadEndpointStatsSchema(BaseModel):
+    """
+    Статистика эндпоинта или группы эндпоинтов за прогон. Время указано в миллисекундах.
+    """
+    requests: int
+    errors: int
+    error_types: dict[str, int]
+    rps: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class LoadReportSchema(BaseModel):
+    """
+    Итог прогона нагрузки, формат файла результатов.
+    """
+    mode: str
+    duration: float
+    requests: int
+    errors: int
+    # Запуски, пропущенные из-за достижения max_concurrency
+    dropped: int
+    # Статистика по эндпоинтам ("GET /api/v1/courses/{course_id}") и по разделам APIRoutes
+    endpoints: dict[str, LoadEndpointStatsSchema]
+    routes: dict[str, LoadEndpointStatsSchema]
+
+
+class LoadStats:
+    """
+    Собирает время ответа и ошибки операций нагрузки по эндпоинтам.
+
+    Время пишется в гистограммы LatencyHistogram, поэтому память и время построения отчета
+    не растут с длительностью прогона.
+    """
+
+    def __init__(self):
+        self.dropped = 0
+        self._operations: dict[str, LoadOperation] = {}
+        self._histograms: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        # Сумма времени в миллисекундах для среднего, гистограмма хранит только распределение
+        self._total_ms: dict[str, float] = defaultdict(float)
+        self._errors: dict[str, Counter[str]] = defaultdict(Counter)
+
+    def record(self, operation: LoadOperation, elapsed: float, error: str | None = None) -> None:
+        """
+        :param operation: Выполненная операция.
+        :param elapsed: Время выполнения в секундах.
+        :param error: Описание ошибки, например "HTTP 500" или имя исключения.
+        """
+        self._operations[operation.key] = operation
+        self._histograms[operation.key].record(elapsed)
+        self._total_ms[operation.key] += elapsed * 1000
+        if error is not None:
+            self._errors[operation.key][error] += 1
+
+    def build_report(self, mode: str, duration: float) -> LoadReportSchema:
+        """
+        :param mode: Режим нагрузки.
+        :param duration: Фактическая длительность прогона в секундах.
+        :return: Итог прогона.
+        """
+        routes: dict[str, list[str]] = defaultdict(list)
+        for key, operation in self._operations.items():
+            routes[operation.route.value].append(key)
+
+        endpoints = {key: self._summarize([key], duration) for key in sorted(self._histograms)}
+        return LoadReportSchema(
+            mode=mode,
+            duration=duration,
+            requests=sum(stats.requests for stats in endpoints.values()),
+            errors=sum(stats.errors for stats in endpoints.values()),
+            dropped=self.dropped,
+            endpoints=endpoints,
+            routes={route: self._summarize(keys, duration) for route, keys in sorted(routes.items())}
+        )
+
+    def _summarize(self, keys: list[str], duration: float) -> LoadEndpointStatsSchema:
+        histogram = LatencyHistogram()
+        for key in keys:
+            histogram.merge(self._histograms[key])
+
+        requests = histogram.total
+        errors = sum((self._errors[key] for key in keys), Counter())
+
+        return LoadEndpointStatsSchema(
+            requests=requests,
+            errors=errors.total(),
+            error_types=dict(errors),
+            rps=requests / duration if duration else 0.0,
+            mean_ms=sum(self._total_ms[key] for key in keys) / requests if requests else 0.0,
+            p50_ms=histogram.get_percentile(50),
+            p95_ms=histogram.get_percentile(95),
+            p99_ms=histogram.get_percentile(99),
+            max_ms=histogram.max_us / 1000
+        )
+
+
+def format_report(report: LoadReportSchema) -> str:
+    """
+    Форматирует итог прогона в текстовую таблицу для консоли.
+
+    :param report: Итог прогона.
+    :return: Таблица по эндпоинтам с итоговой строкой.
+    """
+    lines = [
+        f"{'Endpoint':<45} {'Requests':>9} {'Errors':>7} {'RPS':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8}"
+    ]
+    for key, stats in report.endpoints.items():
+        lines.append(
+            f"{key:<45} {stats.requests:>9} {stats.errors:>7} {stats.rps:>8.1f} {stats.p50_ms:>8.1f} "
+            f"{stats.p95_ms:>8.1f} {stats.p99_ms:>8.1f} {stats.max_ms:>8.1f}"
+        )
+
+    lines.append(
+        f"Total: {report.requests} requests, {report.errors} errors, {report.dropped} dropped "
+        f"in {report.duration:.1f} s ({report.mode} mode)"
+    )
+    return "\n".join(lines)
+
+
+def save_report(path: Path, report: LoadReportSchema) -> None:
+    """
+    Сохраняет итог прогона в JSON-файл.
+
+    :param path: Путь к файлу.
+    :param report: Итог прогона.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.model_dump(), indent=2))
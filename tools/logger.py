@@ -1,13 +1,128 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from config import settings
+
+LOG_FORMAT = '%(asctime)s | %(name)s | %(levelname)s | %(message)s'
+
+_setup_lock = threading.Lock()
+_queue_handler: QueueHandler | None = None
+_queue_listener: QueueListener | None = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Форматирует запись лога в одну строку JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "worker": get_worker_id(),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False)
+
+
+def get_worker_id() -> str:
+    """
+    Возвращает идентификатор воркера pytest-xdist или "master" для запуска без xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_formatter() -> logging.Formatter:
+    return JsonLinesFormatter() if settings.logging.json_format else logging.Formatter(LOG_FORMAT)
+
+
+def get_log_level(name: str) -> int:
+    """
+    Возвращает уровень логгера из настроек.
+
+    В профиле lean уровень не ниже WARNING, чтобы логи проверок и запросов не формировались.
+
+    :param name: Имя логгера.
+    :return: Числовой уровень логирования.
+    """
+    # Имена уровней проверены и приведены к верхнему регистру в LoggingConfig
+    level = logging.getLevelNamesMapping()[settings.logging.levels.get(name, settings.logging.level)]
+    return max(level, logging.WARNING) if settings.is_lean else level
+
+
+def setup_logging() -> QueueHandler:
+    """
+    Настраивает фоновую запись логов. Повторные вызовы возвращают уже созданный обработчик.
+
+    Логгеры пишут записи в очередь, а форматирование и вывод в консоль и файл воркера
+    выполняет отдельный поток QueueListener.
+
+    :return: Обработчик, складывающий записи в очередь.
+    """
+    global _queue_handler, _queue_listener
+
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        formatter = get_formatter()
+        handlers: list[logging.Handler] = []
+
+        if settings.logging.console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+
+        if settings.logging.directory is not None:
+            # Каждый воркер pytest-xdist пишет в свой файл, чтобы строки не перемешивались
+            settings.logging.directory.mkdir(parents=True, exist_ok=True)
+            extension = "jsonl" if settings.logging.json_format else "log"
+            file_handler = logging.FileHandler(
+                settings.logging.directory / f"{get_worker_id()}.{extension}", encoding="utf-8", delay=True
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        _queue_handler = QueueHandler(queue.SimpleQueue())
+        _queue_listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(shutdown_logging)
+
+        return _queue_handler
+
+
+def shutdown_logging() -> None:
+    """
+    Дописывает оставшиеся в очереди записи и останавливает фоновый поток.
+    """
+    global _queue_listener
+
+    with _setup_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Инициализирует и возвращает логгер с указанным именем.
 
     Настройки логгера:
-    - Уровень логирования: DEBUG (обрабатывает все сообщения от DEBUG и выше)
-    - Обработчик: StreamHandler для вывода в консоль
-    - Формат сообщений: '<время> | <имя логгера> | <уровень> | <сообщение>'
+    - Уровень логирования: из settings.logging (level и переопределения levels по имени),
+      в профиле lean — не ниже WARNING
+    - Обработчик: общий QueueHandler, запись в консоль и файл воркера выполняется в фоне
+    - Формат сообщений: '<время> | <имя логгера> | <уровень> | <сообщение>' или JSON lines
+
+    Повторный вызов с тем же именем не добавляет обработчик повторно.
 
     Args:
         name (str): Имя логгера.
@@ -16,13 +131,10 @@ def get_logger(name: str) -> logging.Logger:
         logging.Logger: Настроенный экземпляр логгера.
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
+    logger.setLevel(get_log_level(name))
 
-    formatter = logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s')
-    handler.setFormatter(formatter)
+    queue_handler = setup_logging()
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
 
-    logger.addHandler(handler)
-    return logger
\ No newline at end of file
+    return logger
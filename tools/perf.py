@@ -0,0 +1,104 @@
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from pydantic import BaseModel
+
+from tools.histogram import get_percentile
+
+# Перцентили, для которых в маркере perf можно задать бюджет: p50_ms, p95_ms, p99_ms, max_ms
+PERCENTILES = {"p50_ms": 50, "p95_ms": 95, "p99_ms": 99, "max_ms": 100}
+
+
+class PerfResultSchema(BaseModel):
+    """
+    Результат многократного выполнения теста или вызова клиента. Время указано в миллисекундах.
+    """
+    name: str
+    iterations: int
+    warmup: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    # Время каждой итерации в порядке выполнения, для сравнения между запусками
+    samples_ms: list[float]
+
+
+def run_perf(name: str, func: Callable[[], object], iterations: int, warmup: int) -> PerfResultSchema:
+    """
+    Выполняет функцию warmup раз без замера и iterations раз с замером каждого вызова.
+
+    :param name: Имя замера, обычно nodeid теста.
+    :param func: Функция без аргументов.
+    :param iterations: Количество замеряемых вызовов.
+    :param warmup: Количество вызовов для прогрева.
+    :return: Перцентили и время всех итераций.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started_at) * 1000)
+
+    ordered = sorted(samples)
+    return PerfResultSchema(
+        name=name,
+        iterations=iterations,
+        warmup=warmup,
+        mean_ms=statistics.mean(samples) if samples else 0.0,
+        samples_ms=samples,
+        **{key: get_percentile(ordered, percentile) for key, percentile in PERCENTILES.items()}
+    )
+
+
+def get_budget_breaches(result: PerfResultSchema, budgets: dict[str, float]) -> list[str]:
+    """
+    Сравнивает перцентили с бюджетами.
+
+    :param result: Результат замера.
+    :param budgets: Бюджеты в миллисекундах по ключам PERCENTILES, например {"p95_ms": 150}.
+    :return: Описания превышенных бюджетов.
+    """
+    return [
+        f"{key.removesuffix('_ms')} {getattr(result, key):.1f} ms exceeds budget {budget:g} ms"
+        for key, budget in budgets.items()
+        if getattr(result, key) > budget
+    ]
+
+
+def get_perf_result_path(directory: Path, name: str) -> Path:
+    """
+    :param directory: Директория результатов.
+    :param name: Имя замера, например nodeid теста.
+    :return: Путь к файлу результата, имя файла построено из имени замера.
+    """
+    filename = re.sub(r"[^\w.-]+", "_", name).strip("_")
+    return directory / f"{filename}.json"
+
+
+def load_perf_result(path: Path) -> PerfResultSchema | None:
+    """
+    :param path: Путь к файлу результата.
+    :return: Результат прошлого запуска или None, если его нет.
+    """
+    if not path.exists():
+        return None
+
+    return PerfResultSchema.model_validate_json(path.read_bytes())
+
+
+def save_perf_result(path: Path, result: PerfResultSchema) -> None:
+    """
+    :param path: Путь к файлу результата.
+    :param result: Результат замера.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result.model_dump(), indent=2))
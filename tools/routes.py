@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 
 
@@ -10,3 +11,54 @@ class APIRoutes(str, Enum):
 
     def __str__(self):
         return self.value
+
+
+# Шаблоны эндпоинтов, как в tracker.track_coverage_httpx. Пути без параметров идут раньше шаблонов с параметрами
+ROUTE_TEMPLATES = (
+    *(route.value for route in APIRoutes),
+    f"{APIRoutes.USERS}/me",
+    f"{APIRoutes.AUTHENTICATION}/login",
+    f"{APIRoutes.AUTHENTICATION}/refresh",
+    f"{APIRoutes.USERS}/{{user_id}}",
+    f"{APIRoutes.FILES}/{{file_id}}",
+    f"{APIRoutes.COURSES}/{{course_id}}",
+    f"{APIRoutes.EXERCISES}/{{exercise_id}}",
+)
+
+
+def compile_route(template: str) -> re.Pattern:
+    """
+    Превращает шаблон пути вида /api/v1/files/{file_id} в регулярное выражение.
+
+    :param template: Шаблон пути с параметрами в фигурных скобках.
+    :return: Скомпилированное регулярное выражение с именованными группами.
+    """
+    return re.compile(re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", template) + "$")
+
+
+_compiled_route_templates = [(template, compile_route(template)) for template in ROUTE_TEMPLATES]
+
+
+def get_route_template(path: str) -> str:
+    """
+    Находит шаблон эндпоинта для пути запроса, например /api/v1/courses/{course_id}.
+
+    :param path: Путь запроса без query параметров.
+    :return: Шаблон эндпоинта или сам путь, если шаблон не найден.
+    """
+    for template, pattern in _compiled_route_templates:
+        if pattern.match(path):
+            return template
+
+    return path
+
+
+def get_endpoint_key(method: str, path: str) -> str:
+    """
+    Формирует ключ эндпоинта из метода и шаблона пути, например "GET /api/v1/courses/{course_id}".
+
+    :param method: HTTP метод запроса.
+    :param path: Путь запроса.
+    :return: Ключ эндпоинта.
+    """
+    return f"{method} {get_route_template(path)}"
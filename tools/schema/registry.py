@@ -0,0 +1,162 @@
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import threading
+from pathlib import Path
+
+import pydantic
+from pydantic import BaseModel
+from pydantic.errors import PydanticUserError
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SCHEMA_REGISTRY")
+
+
+def get_model_key(model: type[BaseModel]) -> str:
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+class SchemaRegistry:
+    """
+    Реестр заранее сгенерированных JSON-схем pydantic моделей.
+
+    При загрузке находит все модули *_schema в пакете и генерирует схемы всех моделей, объявленных
+    в них. Если задан cache_dir, схемы сохраняются на диск в файл, ключ которого — хэш исходников
+    всех модулей схем и версии pydantic, поэтому повторные запуски и воркеры xdist схемы не генерируют.
+    """
+
+    def __init__(self, package: str, cache_dir: Path | None = None):
+        """
+        :param package: Пакет, в котором ищутся модули схем, например "clients".
+        :param cache_dir: Директория дискового кэша схем. Без неё схемы хранятся только в памяти.
+        """
+        self.package = package
+        self.cache_dir = cache_dir
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._schemas: dict[type[BaseModel], dict] = {}
+
+    def load(self) -> None:
+        """
+        Находит модели пакета и заполняет реестр из дискового кэша или генерирует схемы заново.
+        Повторные вызовы ничего не делают.
+        """
+        with self._lock:
+            if self._loaded:
+                return
+
+            modules = self._discover_modules()
+            models = [model for module in modules for model in self._get_module_models(module)]
+
+            cache_path = self._get_cache_path(modules)
+            cached_schemas = self._read_cache(cache_path)
+
+            schemas: dict[str, dict] = {}
+            for model in models:
+                key = get_model_key(model)
+                if key in cached_schemas:
+                    schema = cached_schemas[key]
+                else:
+                    schema = self._generate_schema(model)
+                    if schema is None:
+                        continue
+
+                schemas[key] = self._schemas[model] = schema
+
+            if cache_path is not None and schemas.keys() != cached_schemas.keys():
+                self._write_cache(cache_path, schemas)
+
+            logger.info(
+                "Loaded %s JSON schemas, %s from cache", len(schemas), len(schemas.keys() & cached_schemas.keys())
+            )
+            self._loaded = True
+
+    def get_schema(self, model: type[BaseModel]) -> dict:
+        """
+        Возвращает JSON-схему модели.
+
+        Модели вне пакета реестра генерируются при первом обращении и запоминаются.
+
+        :param model: Класс pydantic модели.
+        :return: JSON-схема модели.
+        """
+        if not self._loaded:
+            self.load()
+
+        if (schema := self._schemas.get(model)) is None:
+            schema = self._schemas[model] = model.model_json_schema()
+
+        return schema
+
+    def _discover_modules(self) -> list:
+        package = importlib.import_module(self.package)
+        return [
+            importlib.import_module(module.name)
+            for module in pkgutil.walk_packages(package.__path__, prefix=f"{self.package}.")
+            if module.name.endswith("_schema")
+        ]
+
+    @staticmethod
+    def _get_module_models(module) -> list[type[BaseModel]]:
+        # Берём только модели, объявленные в самом модуле, а не импортированные из других
+        return [
+            value for value in vars(module).values()
+            if inspect.isclass(value)
+               and issubclass(value, BaseModel)
+               and value.__module__ == module.__name__
+        ]
+
+    @staticmethod
+    def _generate_schema(model: type[BaseModel]) -> dict | None:
+        try:
+            return model.model_json_schema()
+        except PydanticUserError as error:
+            logger.warning("Unable to generate JSON schema for %s: %s", get_model_key(model), error)
+            return None
+
+    def _get_cache_path(self, modules: list) -> Path | None:
+        if self.cache_dir is None:
+            return None
+
+        # Схема модели может ссылаться на модели из других модулей, поэтому ключ — хэш всех модулей
+        source_hash = hashlib.sha256(pydantic.VERSION.encode())
+        for module in sorted(modules, key=lambda item: item.__name__):
+            source_hash.update(module.__name__.encode())
+            source_hash.update(Path(inspect.getfile(module)).read_bytes())
+
+        return self.cache_dir / f"{self.package}.{source_hash.hexdigest()[:16]}.json"
+
+    @staticmethod
+    def _read_cache(path: Path | None) -> dict[str, dict]:
+        if path is None:
+            return {}
+
+        try:
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_cache(path: Path, schemas: dict[str, dict]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(schemas))
+        os.replace(temporary_path, path)
+
+        # Удаляем файлы кэша, оставшиеся от прошлых версий схем
+        for stale_path in path.parent.glob(path.name.split(".", 1)[0] + ".*.json"):
+            if stale_path != path:
+                stale_path.unlink(missing_ok=True)
+
+
+schema_registry = SchemaRegistry(
+    package="clients",
+    cache_dir=settings.schema_registry.cache_dir if settings.schema_registry.disk_cache else None
+)
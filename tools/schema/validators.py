@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+
+from jsonschema.protocols import Validator
+from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
+
+from tools.schema.registry import schema_registry
+
+SchemaSource = dict | type[BaseModel]
+
+
+@dataclass
+class ValidatorCacheStats:
+    """
+    Статистика кэша скомпилированных валидаторов.
+    """
+    hits: int = 0
+    misses: int = 0
+    compile_seconds: float = 0.0
+
+
+class ValidatorRegistry:
+    """
+    Кэш скомпилированных валидаторов JSON-схем.
+
+    Схема проверяется и компилируется в Draft202012Validator один раз. Ключ кэша — класс
+    pydantic модели (схема берётся из schema_registry) или sha256 канонического JSON схемы,
+    переданной словарём.
+    """
+
+    def __init__(self):
+        self.stats = ValidatorCacheStats()
+        self._lock = threading.Lock()
+        self._validators: dict[type[BaseModel] | str, Validator] = {}
+
+    def get_validator(self, schema: SchemaSource) -> Validator:
+        """
+        Возвращает скомпилированный валидатор для схемы, компилируя его при первом обращении.
+
+        :param schema: JSON-схема или класс pydantic модели.
+        :return: Валидатор с проверкой форматов.
+        """
+        key = schema if isinstance(schema, type) else self._get_schema_hash(schema)
+
+        if (validator := self._validators.get(key)) is not None:
+            self.stats.hits += 1
+            return validator
+
+        with self._lock:
+            if (validator := self._validators.get(key)) is not None:
+                self.stats.hits += 1
+                return validator
+
+            started_at = time.perf_counter()
+            validator = self._compile(schema_registry.get_schema(schema) if isinstance(schema, type) else schema)
+            self.stats.compile_seconds += time.perf_counter() - started_at
+            self.stats.misses += 1
+
+            self._validators[key] = validator
+            return validator
+
+    def clear(self) -> None:
+        """
+        Очищает кэш валидаторов и статистику.
+        """
+        with self._lock:
+            self._validators.clear()
+            self.stats = ValidatorCacheStats()
+
+    @staticmethod
+    def _compile(schema: dict) -> Validator:
+        Draft202012Validator.check_schema(schema)
+        return Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+    @staticmethod
+    def _get_schema_hash(schema: dict) -> str:
+        return hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+validator_registry = ValidatorRegistry()
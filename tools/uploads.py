@@ -0,0 +1,146 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+
+from config import settings
+
+
+class UploadStream:
+    """
+    Файловый объект для загрузки файла в multipart запросе.
+
+    httpx читает файловые объекты частями и перед каждой отправкой перематывает их в начало,
+    поэтому содержимое не собирается в памяти целиком. read отдает не больше chunk_size байт
+    независимо от запрошенного размера, так что объем данных в памяти на одну загрузку ограничен.
+    """
+
+    def __init__(self, file: BinaryIO, name: str, size: int, chunk_size: int):
+        """
+        :param file: Открытый файл или буфер в памяти.
+        :param name: Имя файла, по нему httpx определяет filename и Content-Type части.
+        :param size: Размер содержимого в байтах, доступен и после закрытия файла.
+        :param chunk_size: Максимальный размер части в байтах.
+        """
+        self.file = file
+        self.name = name
+        self.size = size
+        self.chunk_size = chunk_size
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(self.chunk_size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        # У буфера в памяти дескриптора нет, httpx в этом случае определяет размер через seek
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "UploadStream":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+class UploadCache:
+    """
+    Кэш содержимого небольших файлов для повторных загрузок одного и того же тестового файла.
+
+    Содержимое хранится по sha256, поэтому копии одного файла по разным путям занимают память один раз.
+    Путь сопоставляется с хэшем по размеру и времени изменения файла, так что измененный файл читается заново.
+    Если суммарный размер превышает max_size, вытесняются давно не использованные файлы.
+    """
+
+    def __init__(self, max_file_size: int, max_size: int):
+        """
+        :param max_file_size: Файлы больше этого размера не кэшируются.
+        :param max_size: Максимальный суммарный размер содержимого в кэше.
+        """
+        self.max_file_size = max_file_size
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._contents: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, path: Path) -> bytes | None:
+        """
+        :param path: Путь к файлу.
+        :return: Содержимое файла или None, если файл слишком большой для кэша.
+        """
+        stat = path.stat()
+        if stat.st_size > self.max_file_size:
+            return None
+
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest in self._contents:
+                self._contents.move_to_end(digest)
+                return self._contents[digest]
+
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._digests[key] = digest
+            if digest not in self._contents:
+                self._contents[digest] = content
+                self._size += len(content)
+
+            # Возвращаем уже сохраненный объект, чтобы одинаковое содержимое не дублировалось в памяти
+            content = self._contents[digest]
+            self._contents.move_to_end(digest)
+            while self._size > self.max_size and len(self._contents) > 1:
+                _, evicted = self._contents.popitem(last=False)
+                self._size -= len(evicted)
+
+        return content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+            self._contents.clear()
+            self._size = 0
+
+
+def open_upload_file(path: Path) -> UploadStream:
+    """
+    Открывает файл для загрузки в multipart запросе.
+
+    Небольшие файлы отдаются из общего кэша: io.BytesIO над неизменяемыми bytes не копирует данные,
+    поэтому параллельные загрузки одного файла используют один буфер. Большие файлы читаются с диска
+    частями по мере отправки.
+
+    :param path: Путь к файлу.
+    :return: Файловый объект, который нужно закрыть после отправки запроса.
+    """
+    content = upload_cache.get(path)
+    if content is not None:
+        return UploadStream(io.BytesIO(content), path.name, len(content), settings.uploads.chunk_size)
+
+    file = open(path, "rb")
+    return UploadStream(file, path.name, os.fstat(file.fileno()).st_size, settings.uploads.chunk_size)
+
+
+upload_cache = UploadCache(
+    max_file_size=settings.uploads.cache_max_file_size,
+    max_size=settings.uploads.cache_max_size
+)